@@ -41,6 +41,14 @@ def start_background_scheduler():
         print(f"[ERROR] Failed to start email scheduler from FastAPI startup: {exc}")
 
 
+@app.on_event("shutdown")
+def flush_activity_logs():
+    """Write activity log entries still queued by the batched writer."""
+    from app.utils.activity_log_writer import shutdown
+
+    shutdown()
+
+
 class SafeLifeFormData(BaseModel):
     """Schema for SafeLife CCP Form submissions"""
     # User identification
@@ -5,9 +5,10 @@ Handles creating, reading, and filtering activity log entries
 
 from sqlalchemy.orm import Session
 from sqlalchemy import desc, and_
-from app.models import ActivityLog
+from app.models import ActivityFieldChange, ActivityLog, ActivityLogKeyword
+from app.utils import activity_archive, activity_log_writer
 from datetime import datetime, timedelta, date
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import json
 
 
@@ -19,6 +20,59 @@ class DateTimeEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+def _encode(value: Any) -> str:
+    return json.dumps(value, cls=DateTimeEncoder)
+
+
+def diff_fields(old_data: Optional[dict], new_data: Optional[dict]) -> List[Tuple[str, Any, Any]]:
+    """
+    (field, old, new) for every field whose value an activity changed.
+    A field missing on one side counts as None, so a create records only the
+    fields it set and an update only the fields whose value differs.
+    """
+    old_data = old_data if isinstance(old_data, dict) else {}
+    new_data = new_data if isinstance(new_data, dict) else {}
+    changes = []
+    for field in sorted(set(old_data) | set(new_data)):
+        old = old_data.get(field)
+        new = new_data.get(field)
+        if old == new:
+            continue
+        changes.append((field, old, new))
+    return changes
+
+
+def field_change_values(
+    entity_type: str,
+    entity_id: Optional[int],
+    changed_at: datetime,
+    old_data: Optional[dict],
+    new_data: Optional[dict]
+) -> List[Dict[str, Any]]:
+    """activity_field_changes rows (without log_id) for one activity's old/new values."""
+    return [
+        dict(
+            entity_type=entity_type,
+            entity_id=entity_id,
+            changed_at=changed_at,
+            field=field[:100],
+            old_value=_encode(old) if old is not None else None,
+            new_value=_encode(new) if new is not None else None,
+        )
+        for field, old, new in diff_fields(old_data, new_data)
+    ]
+
+
+def keyword_tags(keywords: Optional[str]) -> List[str]:
+    """Distinct lower-cased tags of a comma-separated keywords string, in order."""
+    tags = []
+    for tag in (keywords or "").split(","):
+        tag = tag.strip().lower()[:50]
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags
+
+
 def create_activity_log(
     db: Session,
     user_id: Optional[int],
@@ -31,12 +85,17 @@ def create_activity_log(
     old_value: Optional[dict] = None,
     new_value: Optional[dict] = None,
     keywords: Optional[str] = None,
-    ip_address: Optional[str] = None
+    ip_address: Optional[str] = None,
+    commit: bool = True
 ) -> ActivityLog:
     """
-    Create a new activity log entry
+    Create a new activity log entry.
+    With commit=False the entry is only added to the session; the caller commits.
+    Otherwise it is queued for the batched writer (app.utils.activity_log_writer),
+    or committed on its own when ACTIVITY_LOG_MODE=sync.
     """
-    activity = ActivityLog(
+    values = dict(
+        timestamp=datetime.utcnow(),
         user_id=user_id,
         username=username,
         action_type=action_type,
@@ -44,15 +103,27 @@ def create_activity_log(
         entity_id=entity_id,
         entity_name=entity_name,
         description=description,
-        old_value=json.dumps(old_value, cls=DateTimeEncoder) if old_value else None,
-        new_value=json.dumps(new_value, cls=DateTimeEncoder) if new_value else None,
+        old_value=_encode(old_value) if old_value else None,
+        new_value=_encode(new_value) if new_value else None,
         keywords=keywords,
         ip_address=ip_address
     )
-    
+    changes = field_change_values(entity_type, entity_id, values["timestamp"], old_value, new_value)
+    tags = [dict(keyword=tag) for tag in keyword_tags(keywords)]
+
+    if commit and activity_log_writer.async_enabled():
+        # Returned entry is transient: it has no id until the writer flushes
+        activity = ActivityLog(**values)
+        if activity_log_writer.enqueue(values, {"field_changes": changes, "keyword_tags": tags}):
+            return activity
+        # Queue full (the writer is falling behind): commit this entry here instead
+
+    activity = ActivityLog(**values)
+    activity.field_changes = [ActivityFieldChange(**change) for change in changes]
+    activity.keyword_tags = [ActivityLogKeyword(**tag) for tag in tags]
     db.add(activity)
-    db.commit()
-    db.refresh(activity)
+    if commit:
+        db.commit()
     return activity
 
 
@@ -69,11 +140,17 @@ def get_activity_logs(
     entity_type: Optional[str] = None,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-    search_keywords: Optional[str] = None
+    search_keywords: Optional[str] = None,
+    keyword: Optional[str] = None
 ) -> List[ActivityLog]:
     """
-    Get activity logs with optional filtering
+    Get activity logs with optional filtering.
+    search_keywords matches a substring of the description, keywords or
+    entity name (via the search index); keyword is an exact tag.
+    Once the matching rows in activity_logs run out, the page continues
+    into archived months (all older than anything still in the table).
     """
+    activity_log_writer.flush_pending()
     query = db.query(ActivityLog)
     
     # Apply filters
@@ -93,40 +170,151 @@ def get_activity_logs(
         query = query.filter(ActivityLog.timestamp <= end_date)
     
     if search_keywords:
-        query = query.filter(
-            (ActivityLog.description.contains(search_keywords)) |
-            (ActivityLog.keywords.contains(search_keywords)) |
-            (ActivityLog.entity_name.contains(search_keywords))
-        )
+        from app.utils.activity_search_index import activity_search_condition
+        query = query.filter(activity_search_condition(db, ActivityLog, search_keywords))
+
+    if keyword:
+        query = query.filter(ActivityLog.id.in_(
+            db.query(ActivityLogKeyword.log_id).filter(ActivityLogKeyword.keyword == keyword.strip().lower())
+        ))
     
     # Order by most recent first
     query = query.order_by(desc(ActivityLog.timestamp))
     
     # Apply pagination
-    return query.offset(offset).limit(limit).all()
+    logs = query.offset(offset).limit(limit).all()
+    if len(logs) < limit:
+        live_matches = offset + len(logs) if logs or not offset else query.count()
+        logs += activity_archive.find_logs(
+            db,
+            limit - len(logs),
+            max(0, offset - live_matches),
+            username=username,
+            action_type=action_type,
+            entity_type=entity_type,
+            start_date=start_date,
+            end_date=end_date,
+            search_keywords=search_keywords,
+            keyword=keyword
+        )
+    return logs
 
 
 def get_lead_history(db: Session, lead_id: int) -> List[ActivityLog]:
     """
-    Get all activity logs for a specific lead
+    Get all activity logs for a specific lead, including archived ones
     """
-    return db.query(ActivityLog).filter(
+    activity_log_writer.flush_pending()
+    logs = db.query(ActivityLog).filter(
         and_(
             ActivityLog.entity_type == "Lead",
             ActivityLog.entity_id == lead_id
         )
     ).order_by(desc(ActivityLog.timestamp)).all()
+    return logs + activity_archive.entity_logs(db, "Lead", [lead_id]).get(lead_id, [])
+
+
+def get_lead_histories(db: Session, lead_ids: List[int], limit_per_lead: Optional[int] = 10) -> Dict[int, List[ActivityLog]]:
+    """
+    Activity logs for several leads in one query, newest first per lead.
+    With limit_per_lead, only each lead's newest N entries are returned.
+    """
+    lead_ids = list({lead_id for lead_id in lead_ids if lead_id is not None})
+    if not lead_ids:
+        return {}
+
+    activity_log_writer.flush_pending()
+    conditions = and_(ActivityLog.entity_type == "Lead", ActivityLog.entity_id.in_(lead_ids))
+    if limit_per_lead:
+        from sqlalchemy import func
+        ranked = db.query(
+            ActivityLog.id.label("log_id"),
+            func.row_number().over(
+                partition_by=ActivityLog.entity_id,
+                order_by=(desc(ActivityLog.timestamp), desc(ActivityLog.id))
+            ).label("rank")
+        ).filter(conditions).subquery()
+        query = db.query(ActivityLog).join(ranked, ActivityLog.id == ranked.c.log_id).filter(ranked.c.rank <= limit_per_lead)
+    else:
+        query = db.query(ActivityLog).filter(conditions)
+
+    histories: Dict[int, List[ActivityLog]] = {}
+    for log in query.order_by(desc(ActivityLog.timestamp), desc(ActivityLog.id)).all():
+        histories.setdefault(log.entity_id, []).append(log)
+
+    # Top up from the archive only for leads whose live history is short
+    short = [lead_id for lead_id in lead_ids if not limit_per_lead or len(histories.get(lead_id, [])) < limit_per_lead]
+    for lead_id, archived in activity_archive.entity_logs(db, "Lead", short).items():
+        history = histories.setdefault(lead_id, [])
+        history.extend(archived)
+        if limit_per_lead:
+            del history[limit_per_lead:]
+    return histories
+
+
+def decode_field_value(value: Optional[str]) -> Any:
+    """Python value of an ActivityFieldChange.old_value/new_value."""
+    if value is None:
+        return None
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def get_field_changes(
+    db: Session,
+    entity_type: str,
+    entity_id: int,
+    field: str,
+    new_value: Any = None
+) -> List[ActivityFieldChange]:
+    """
+    Changes of one field of one entity, newest first. With new_value, only
+    changes to that value (e.g. authorization_received -> True).
+    """
+    activity_log_writer.flush_pending()
+    query = db.query(ActivityFieldChange).filter(
+        ActivityFieldChange.entity_type == entity_type,
+        ActivityFieldChange.entity_id == entity_id,
+        ActivityFieldChange.field == field
+    )
+    encoded = _encode(new_value) if new_value is not None else None
+    if encoded is not None:
+        query = query.filter(ActivityFieldChange.new_value == encoded)
+    changes = query.order_by(desc(ActivityFieldChange.changed_at), desc(ActivityFieldChange.id)).all()
+    return changes + activity_archive.field_changes(db, entity_type, entity_id, field, encoded)
+
+
+def get_field_changes_for_logs(db: Session, log_ids: List[int]) -> Dict[int, List[ActivityFieldChange]]:
+    """Field changes of several activity logs in one query, keyed by log id."""
+    log_ids = list({log_id for log_id in log_ids if log_id is not None})
+    changes: Dict[int, List[ActivityFieldChange]] = {}
+    for i in range(0, len(log_ids), 500):
+        rows = db.query(ActivityFieldChange).filter(
+            ActivityFieldChange.log_id.in_(log_ids[i:i + 500])
+        ).order_by(ActivityFieldChange.id).all()
+        for change in rows:
+            changes.setdefault(change.log_id, []).append(change)
+    return changes
 
 
 def get_recent_activities(db: Session, limit: int = 10) -> List[ActivityLog]:
     """
     Get the most recent activities for dashboard widget
     """
+    activity_log_writer.flush_pending()
     return db.query(ActivityLog).order_by(
         desc(ActivityLog.timestamp)
     ).limit(limit).all()
 
 
+def get_keyword_tags(db: Session) -> List[str]:
+    """Distinct keyword tags on activity logs, for the tag filter (read from the keyword index)."""
+    activity_log_writer.flush_pending()
+    return [tag for (tag,) in db.query(ActivityLogKeyword.keyword).distinct().order_by(ActivityLogKeyword.keyword)]
+
+
 def get_activity_count(
     db: Session,
     username: Optional[str] = None,
@@ -138,6 +326,7 @@ def get_activity_count(
     """
     Get count of activities matching filters
     """
+    activity_log_writer.flush_pending()
     query = db.query(ActivityLog)
     
     if username:
@@ -155,7 +344,14 @@ def get_activity_count(
     if end_date:
         query = query.filter(ActivityLog.timestamp <= end_date)
     
-    return query.count()
+    return query.count() + activity_archive.count_logs(
+        db,
+        username=username,
+        action_type=action_type,
+        entity_type=entity_type,
+        start_date=start_date,
+        end_date=end_date
+    )
 
 
 def get_user_activity_summary(db: Session, username: str, days: int = 7) -> dict:
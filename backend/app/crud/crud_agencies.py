@@ -2,6 +2,7 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 import app.models as models
 from ..utils.activity_logger import log_activity
+from ..utils.table_versions import bump_table_version
 
 def create_agency(db: Session, name: str, username: str, user_id: Optional[int] = None, **kwargs) -> models.Agency:
     """Create a new agency"""
@@ -14,6 +15,7 @@ def create_agency(db: Session, name: str, username: str, user_id: Optional[int]
         email=kwargs.get('email')
     )
     db.add(agency)
+    bump_table_version(db, "agencies")
     db.commit()
     db.refresh(agency)
     
@@ -74,6 +76,7 @@ def update_agency(db: Session, agency_id: int, name: str, username: str, user_id
             
     if changed:
         agency.updated_by = username
+        bump_table_version(db, "agencies")
         db.commit()
         db.refresh(agency)
         
@@ -108,6 +111,7 @@ def delete_agency(db: Session, agency_id: int, username: str, user_id: Optional[
     
     name = agency.name
     db.delete(agency)
+    bump_table_version(db, "agencies")
     db.commit()
     
     # Log activity
@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 from app.models import AgencySuboption
 from datetime import datetime
 from app.crud import crud_activity_logs
+from app.utils.table_versions import bump_table_version
 
 
 def get_all_suboptions(db: Session, agency_id: int = None):
@@ -38,6 +39,7 @@ def create_suboption(db: Session, name: str, agency_id: int, created_by: str, cr
         created_by=created_by
     )
     db.add(suboption)
+    bump_table_version(db, "agency_suboptions")
     db.commit()
     db.refresh(suboption)
     
@@ -61,6 +63,7 @@ def delete_suboption(db: Session, suboption_id: int, deleted_by: str, deleted_by
     if suboption:
         suboption_name = suboption.name
         db.delete(suboption)
+        bump_table_version(db, "agency_suboptions")
         db.commit()
         
         # Log activity
@@ -86,6 +89,7 @@ def update_suboption(db: Session, suboption_id: int, name: str, updated_by: str,
         suboption.name = name
         suboption.updated_at = datetime.utcnow()
         suboption.updated_by = updated_by
+        bump_table_version(db, "agency_suboptions")
         db.commit()
         db.refresh(suboption)
         
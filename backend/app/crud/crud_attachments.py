@@ -4,6 +4,7 @@ CRUD operations for attachment functionality
 from sqlalchemy.orm import Session
 from app.models import Attachment
 from datetime import datetime
+from typing import Dict, List
 
 
 def create_attachment(db: Session, lead_id: int, filename: str, file_path: str, file_size: int, uploaded_by: str):
@@ -27,6 +28,17 @@ def get_attachments_by_lead(db: Session, lead_id: int):
     return db.query(Attachment).filter(Attachment.lead_id == lead_id).order_by(Attachment.uploaded_at.desc()).all()
 
 
+def get_attachments_for_leads(db: Session, lead_ids: List[int]) -> Dict[int, List[Attachment]]:
+    """Attachments for several leads in one query, newest first per lead"""
+    lead_ids = list({lead_id for lead_id in lead_ids if lead_id is not None})
+    if not lead_ids:
+        return {}
+    attachments: Dict[int, List[Attachment]] = {}
+    for att in db.query(Attachment).filter(Attachment.lead_id.in_(lead_ids)).order_by(Attachment.uploaded_at.desc()).all():
+        attachments.setdefault(att.lead_id, []).append(att)
+    return attachments
+
+
 def get_attachment_by_id(db: Session, attachment_id: int):
     """Get a specific attachment by ID"""
     return db.query(Attachment).filter(Attachment.id == attachment_id).first()
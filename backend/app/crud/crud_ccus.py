@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 from app.models import CCU
 from datetime import datetime
 from app.crud import crud_activity_logs
+from app.utils.table_versions import bump_table_version
 
 
 def get_all_ccus(db: Session):
@@ -50,6 +51,7 @@ def create_ccu(db: Session, name: str, created_by: str, created_by_id: int,
     )
     try:
         db.add(ccu)
+        bump_table_version(db, "ccus")
         db.commit()
         db.refresh(ccu)
     except Exception as e:
@@ -78,6 +80,7 @@ def delete_ccu(db: Session, ccu_id: int, deleted_by: str, deleted_by_id: int):
         ccu_name = ccu.name
         try:
             db.delete(ccu)
+            bump_table_version(db, "ccus")
             db.commit()
         except Exception as e:
             db.rollback()
@@ -126,6 +129,7 @@ def update_ccu(db: Session, ccu_id: int, name: str, updated_by: str, updated_by_
         ccu.updated_at = datetime.utcnow()
         ccu.updated_by = updated_by
         try:
+            bump_table_version(db, "ccus")
             db.commit()
             db.refresh(ccu)
         except Exception as e:
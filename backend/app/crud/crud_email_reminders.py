@@ -2,7 +2,8 @@
 CRUD operations for Email Reminders
 """
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy import func, case
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 import app.models as models
@@ -107,3 +108,30 @@ def get_care_start_reminders_by_lead(db: Session, lead_id: int) -> List[models.E
         )\
         .order_by(models.EmailReminder.sent_at.desc())\
         .all()
+
+
+def get_last_reminder_times(
+    db: Session,
+    lead_ids: Optional[List[int]] = None
+) -> Dict[int, Tuple[Optional[datetime], Optional[datetime]]]:
+    """
+    Latest reminder timestamps per lead in one grouped query, optionally
+    restricted to lead_ids.
+    Returns {lead_id: (last_any_reminder, last_care_start_reminder)}.
+    """
+    care_start_sent = case(
+        (models.EmailReminder.subject.like("%Care Start%"), models.EmailReminder.sent_at),
+        else_=None
+    )
+    query = db.query(
+        models.EmailReminder.lead_id,
+        func.max(models.EmailReminder.sent_at),
+        func.max(care_start_sent)
+    )
+    if lead_ids is not None:
+        if not lead_ids:
+            return {}
+        query = query.filter(models.EmailReminder.lead_id.in_(lead_ids))
+    rows = query.group_by(models.EmailReminder.lead_id).all()
+
+    return {lead_id: (last_any, last_care) for lead_id, last_any, last_care in rows}
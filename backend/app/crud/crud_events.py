@@ -2,6 +2,7 @@ from sqlalchemy.orm import Session
 from typing import Optional
 import app.models as models
 from ..utils.activity_logger import log_activity
+from ..utils.table_versions import bump_table_version
 
 
 def create_event(db: Session, event_name: str, created_by: str, user_id: Optional[int] = None):
@@ -12,6 +13,7 @@ def create_event(db: Session, event_name: str, created_by: str, user_id: Optiona
         updated_by=created_by
     )
     db.add(event)
+    bump_table_version(db, "events")
     db.commit()
     db.refresh(event)
     
@@ -48,6 +50,7 @@ def delete_event(db: Session, event_id: int, username: str, user_id: Optional[in
     if event:
         event_name = event.event_name
         db.delete(event)
+        bump_table_version(db, "events")
         db.commit()
         
         # Log activity
@@ -82,6 +85,7 @@ def update_event(db: Session, event_id: int, new_event_name: str, username: str,
     event.event_name = new_event_name
     event.updated_by = username
     
+    bump_table_version(db, "events")
     db.commit()
     db.refresh(event)
     
@@ -1,12 +1,14 @@
 # Force Reload
+from sqlalchemy import inspect as sa_inspect, or_
 from sqlalchemy.orm import Session, joinedload
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 from datetime import datetime
 import json
 import re
 
 import app.models as models
 from app.schemas import LeadCreate, LeadUpdate
+from app.utils.table_versions import bump_table_version
 # from app.utils.activity_logger import log_activity # Moved to local import
 
 
@@ -21,51 +23,68 @@ def create_lead(db: Session, lead_in: LeadCreate, username: str = "system", user
 
     if lead.authorization_received and not lead.authorization_received_at:
         lead.authorization_received_at = datetime.utcnow()
+
+    # New leads have no reminder history yet
+    from app.utils.reminder_schedule import compute_next_reminder_due_at
+    lead.next_reminder_due_at = compute_next_reminder_due_at(lead, None, None)
         
     lead.created_by = lead_in.staff_name
     lead.updated_by = lead_in.staff_name
     
     # Auto-populate Employee ID based on staff_name
     if lead_in.staff_name:
-        from app.crud.crud_users import get_user_by_username
-        user_prof = get_user_by_username(db, lead_in.staff_name)
+        from app.services.reference_data import get_user_by_username
+        user_prof = get_user_by_username(lead_in.staff_name)
         if user_prof and user_prof.user_id:
             lead.custom_user_id = user_prof.user_id
     
-    db.add(lead)
-    db.commit()
-    db.refresh(lead)
-    
-    # Log the activity - use the passed in username/user_id or defaults
-    from app.utils.activity_logger import log_activity
-    log_activity(
-        db=db,
-        user_id=user_id,
-        username=username,
-        action_type="LEAD_CREATED",
-        entity_type="Lead",
-        entity_id=lead.id,
-        entity_name=f"{lead.first_name} {lead.last_name}",
-        description=f"Lead '{lead.first_name} {lead.last_name}' created",
-        new_value=lead_in.dict(),
-        keywords=f"lead,create,{lead.source.lower()}"
-    )
+    # One unit of work: the lead, its rollup/version bumps, the activity log
+    # and the assignment notification commit together or not at all
+    try:
+        db.add(lead)
+        db.flush()  # assign the id and column defaults for the rollup keys and the log
 
-    # Send notification to assigned staff
-    if lead.staff_name:
-        from app.crud.crud_users import get_user_by_username
-        from app.crud.crud_notifications import create_notification
-        
-        assignee = get_user_by_username(db, lead.staff_name)
-        if assignee:
-            create_notification(
-                db=db,
-                user_id=assignee.id,
-                title="New Lead Assigned",
-                description=f"You have been assigned a new lead: {lead.first_name} {lead.last_name}",
-                entity_id=lead.id,
-                entity_type="Lead"
-            )
+        from app.services.stats_rollup import apply_rollup_change, rollup_keys
+        apply_rollup_change(db, [], rollup_keys(lead))
+        bump_table_version(db, "leads")
+
+        # Log the activity - use the passed in username/user_id or defaults
+        from app.utils.activity_logger import log_activity
+        log_activity(
+            db=db,
+            user_id=user_id,
+            username=username,
+            action_type="LEAD_CREATED",
+            entity_type="Lead",
+            entity_id=lead.id,
+            entity_name=f"{lead.first_name} {lead.last_name}",
+            description=f"Lead '{lead.first_name} {lead.last_name}' created",
+            new_value=lead_in.dict(),
+            keywords=f"lead,create,{lead.source.lower()}",
+            commit=False
+        )
+
+        # Send notification to assigned staff
+        if lead.staff_name:
+            from app.services.reference_data import get_user_by_username
+            from app.crud.crud_notifications import create_notification
+
+            assignee = get_user_by_username(lead.staff_name)
+            if assignee:
+                create_notification(
+                    db=db,
+                    user_id=assignee.id,
+                    title="New Lead Assigned",
+                    description=f"You have been assigned a new lead: {lead.first_name} {lead.last_name}",
+                    entity_id=lead.id,
+                    entity_type="Lead",
+                    commit=False
+                )
+
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        raise e
     
     return lead
 
@@ -137,30 +156,130 @@ def check_deleted_duplicate_lead(db: Session, first_name: str, last_name: str, p
     return None
 
 
-def list_leads(db: Session, skip: int = 0, limit: int = 50, include_deleted: bool = False) -> List[models.Lead]:
-    """List leads, optionally including deleted ones. Eagerly loads relationships for caching."""
-    query = db.query(models.Lead).options(
-        joinedload(models.Lead.agency),
-        joinedload(models.Lead.ccu),
-        joinedload(models.Lead.mco),
-        joinedload(models.Lead.agency_suboption)
+# ------- KEYSET PAGINATION -------
+# A cursor is the (sort timestamp, id) pair of the last row on the previous
+# page. Seeking past it through the composite (timestamp, id) indexes costs
+# the same on page 200 as on page 1, unlike OFFSET which scans and discards.
+LeadCursor = Tuple[datetime, int]
+
+
+def _sort_column(sort_by: str):
+    if sort_by == "Recently Updated":
+        return models.Lead.updated_at
+    if sort_by == "Recently Deleted":
+        return models.Lead.deleted_at
+    # Default: Newest Added
+    return models.Lead.created_at
+
+
+def _paginate_leads(query, sort_by: str, skip: int, limit: int, cursor: Optional[LeadCursor] = None):
+    """Order newest-first by (timestamp, id) and seek past the cursor, or fall back to OFFSET."""
+    from sqlalchemy import tuple_
+    sort_col = _sort_column(sort_by)
+    if cursor:
+        query = query.filter(tuple_(sort_col, models.Lead.id) < tuple_(cursor[0], cursor[1]))
+    query = query.order_by(sort_col.desc(), models.Lead.id.desc())
+    if not cursor and skip:
+        query = query.offset(skip)
+    return query.limit(limit)
+
+
+def lead_cursor(lead, sort_by: str = "Newest Added") -> Optional[LeadCursor]:
+    """Cursor pointing just past `lead` for the given sort order."""
+    if lead is None:
+        return None
+    return (getattr(lead, _sort_column(sort_by).key), lead.id)
+
+
+# ------- LIST PROJECTION -------
+# List pages render dozens of cards per rerun. They get plain rows with the
+# lead's columns and its newest comment instead of ORM objects with joined
+# agency/CCU/MCO/suboption rows and every comment. Load the full lead with
+# get_lead() for edit dialogs and other writes.
+_LEAD_COLUMN_KEYS = tuple(attr.key for attr in sa_inspect(models.Lead).column_attrs)
+_LATEST_COMMENT_KEYS = ("latest_comment", "latest_comment_by", "latest_comment_at")
+
+
+class LeadListRow:
+    """Read-only list-view lead: every lead column plus its latest comment."""
+    __slots__ = _LEAD_COLUMN_KEYS + _LATEST_COMMENT_KEYS
+
+    def __init__(self, mapping):
+        for key in _LEAD_COLUMN_KEYS:
+            setattr(self, key, mapping[key])
+        # Export streams (iter_search_leads) skip the latest-comment join
+        for key in _LATEST_COMMENT_KEYS:
+            setattr(self, key, mapping.get(key))
+
+    # Lookups resolve through the shared reference data, not per-row joins
+    @property
+    def agency(self):
+        from app.services.reference_data import get_agency
+        return get_agency(self.agency_id)
+
+    @property
+    def agency_suboption(self):
+        from app.services.reference_data import get_suboption
+        return get_suboption(self.agency_suboption_id)
+
+    @property
+    def ccu(self):
+        from app.services.reference_data import get_ccu
+        return get_ccu(self.ccu_id)
+
+    @property
+    def mco(self):
+        from app.services.reference_data import get_mco
+        return get_mco(self.mco_id)
+
+    def __repr__(self):
+        return f"<LeadListRow id={self.id} {self.first_name} {self.last_name}>"
+
+
+def _list_row_query(db: Session, *extra):
+    """Column-only lead query for list pages (filters and paging apply as usual)."""
+    columns = [getattr(models.Lead, key) for key in _LEAD_COLUMN_KEYS]
+    return db.query(*columns, *extra).select_from(models.Lead)
+
+
+def _with_latest_comment(query):
+    """Outer-join each lead's newest comment, picked by a correlated subquery."""
+    from sqlalchemy import select
+    from sqlalchemy.orm import aliased
+
+    latest = aliased(models.LeadComment)
+    latest_id = (
+        select(models.LeadComment.id)
+        .where(models.LeadComment.lead_id == models.Lead.id)
+        .order_by(models.LeadComment.created_at.desc(), models.LeadComment.id.desc())
+        .limit(1)
+        .correlate(models.Lead)
+        .scalar_subquery()
     )
-    
-    # Defensive eager loading - gracefully handle if relationship unavailable
-    try:
-        query = query.options(joinedload(models.Lead.lead_comments))
-    except Exception:
-        pass  # Continue without eager loading if relationship not available
-    
+    return query.outerjoin(latest, latest.id == latest_id).add_columns(
+        latest.content.label("latest_comment"),
+        latest.username.label("latest_comment_by"),
+        latest.created_at.label("latest_comment_at"),
+    )
+
+
+def _to_list_rows(rows) -> List[LeadListRow]:
+    return [LeadListRow(row._mapping) for row in rows]
+
+
+def list_leads(
+    db: Session,
+    skip: int = 0,
+    limit: int = 50,
+    include_deleted: bool = False,
+    cursor: Optional[LeadCursor] = None
+) -> List[LeadListRow]:
+    """List leads, optionally including deleted ones, as slim list rows (see LeadListRow)."""
+    query = _list_row_query(db)
     if not include_deleted:
         query = query.filter(models.Lead.deleted_at == None)
-    return (
-        query
-        .order_by(models.Lead.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    query = _with_latest_comment(query)
+    return _to_list_rows(_paginate_leads(query, "Newest Added", skip, limit, cursor).all())
 
 
 # ------- UPDATE -------
@@ -176,6 +295,9 @@ def update_lead(
     if not lead:
         return None
     
+    from app.services.stats_rollup import ROLLUP_FIELDS, apply_rollup_change, rollup_keys
+    rollup_before = rollup_keys(lead)
+
     # Capture old values for change tracking
     old_values = {}
     new_values = {}
@@ -198,23 +320,34 @@ def update_lead(
             old_values["authorization_received_at"] = lead.authorization_received_at
             lead.authorization_received_at = None
             new_values["authorization_received_at"] = None
+
+    from app.utils.reminder_schedule import SCHEDULE_FIELDS, refresh_next_reminder_due_at
+    if SCHEDULE_FIELDS.intersection(new_values):
+        refresh_next_reminder_due_at(db, lead)
+
+    if ROLLUP_FIELDS.intersection(new_values):
+        apply_rollup_change(db, rollup_before, rollup_keys(lead))
     
-    if changes_made:
+    if not changes_made:
+        return lead
+
+    # One unit of work: the field changes, rollup/version bumps, any
+    # assignment notification and the activity log commit together
+    try:
         lead.updated_by = username
-        db.commit()
-        db.refresh(lead)
-        
+        bump_table_version(db, "leads")
+
         # Determine action type based on what changed
         action_type = "LEAD_UPDATED"
         keywords = ["lead", "update"]
         
         # Independent check for staff assignment changes
         if "staff_name" in new_values:
-            from app.crud.crud_users import get_user_by_username
+            from app.services.reference_data import get_user_by_username
             from app.crud.crud_notifications import create_notification
             
             new_staff = new_values["staff_name"]
-            user_prof = get_user_by_username(db, new_staff)
+            user_prof = get_user_by_username(new_staff)
             
             # Auto-populate Employee ID if found
             if user_prof:
@@ -229,7 +362,8 @@ def update_lead(
                     title="Lead Assigned to You",
                     description=f"Lead '{lead.first_name} {lead.last_name}' has been assigned to you by {username}",
                     entity_id=lead.id,
-                    entity_type="Lead"
+                    entity_type="Lead",
+                    commit=False
                 )
             action_type = "LEAD_ASSIGNED"
             keywords.append("assignment")
@@ -268,8 +402,21 @@ def update_lead(
             description=f"Lead '{lead.first_name} {lead.last_name}' updated",
             old_value=old_values,
             new_value=new_values,
-            keywords=",".join(keywords)
+            keywords=",".join(keywords),
+            commit=False
         )
+
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        raise e
+
+    # No refresh: the session keeps loaded values after commit, so only the
+    # relationships behind a changed foreign key (agency, ccu, ...) are stale
+    stale = [rel.key for rel in sa_inspect(models.Lead).relationships
+             if any(col.key in new_values for col in rel.local_columns)]
+    if stale:
+        db.expire(lead, stale)
     
     return lead
 
@@ -289,35 +436,48 @@ def delete_lead(db: Session, lead_id: int, username: str, user_id: Optional[int]
         "staff_name": lead.staff_name
     }
     
-    if permanent:
-        # Permanent deletion
-        db.delete(lead)
-        action_type = "LEAD_PERMANENTLY_DELETED"
-        description = f"Lead '{lead_name}' permanently deleted"
-    else:
-        # Soft delete - move to recycle bin
-        from datetime import datetime
-        lead.deleted_at = datetime.utcnow()
-        lead.deleted_by = username
-        action_type = "LEAD_DELETED"
-        description = f"Lead '{lead_name}' moved to recycle bin"
-    
-    db.commit()
-    
-    # Log the activity
-    from ..utils.activity_logger import log_activity
-    log_activity(
-        db=db,
-        user_id=user_id,
-        username=username,
-        action_type=action_type,
-        entity_type="Lead",
-        entity_id=lead_id,
-        entity_name=lead_name,
-        description=description,
-        old_value=lead_data,
-        keywords="lead,delete"
-    )
+    # One unit of work: the delete, rollup/version bumps and the activity log
+    try:
+        from app.services.stats_rollup import apply_rollup_change, rollup_keys
+        rollup_before = rollup_keys(lead)
+
+        if permanent:
+            # Permanent deletion
+            apply_rollup_change(db, rollup_before, [])
+            db.delete(lead)
+            action_type = "LEAD_PERMANENTLY_DELETED"
+            description = f"Lead '{lead_name}' permanently deleted"
+        else:
+            # Soft delete - move to recycle bin
+            from datetime import datetime
+            lead.deleted_at = datetime.utcnow()
+            lead.deleted_by = username
+            lead.next_reminder_due_at = None
+            apply_rollup_change(db, rollup_before, rollup_keys(lead))
+            action_type = "LEAD_DELETED"
+            description = f"Lead '{lead_name}' moved to recycle bin"
+
+        bump_table_version(db, "leads")
+
+        # Log the activity in the same transaction
+        from ..utils.activity_logger import log_activity
+        log_activity(
+            db=db,
+            user_id=user_id,
+            username=username,
+            action_type=action_type,
+            entity_type="Lead",
+            entity_id=lead_id,
+            entity_name=lead_name,
+            description=description,
+            old_value=lead_data,
+            keywords="lead,delete",
+            commit=False
+        )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        raise e
     
     return True
 
@@ -328,58 +488,56 @@ def restore_lead(db: Session, lead_id: int, username: str, user_id: Optional[int
     if not lead or not lead.deleted_at:
         return False
     
-    lead_name = f"{lead.first_name} {lead.last_name}"
-    lead.deleted_at = None
-    lead.deleted_by = None
-    db.commit()
-    
-    # Log the activity
-    from ..utils.activity_logger import log_activity
-    log_activity(
-        db=db,
-        user_id=user_id,
-        username=username,
-        action_type="LEAD_RESTORED",
-        entity_type="Lead",
-        entity_id=lead_id,
-        entity_name=lead_name,
-        description=f"Lead '{lead_name}' restored from recycle bin",
-        keywords="lead,restore,recycle"
-    )
-    
-    return True
+    # One unit of work: the restore, rollup/version bumps and the activity log
+    try:
+        from app.services.stats_rollup import apply_rollup_change, rollup_keys
+        rollup_before = rollup_keys(lead)
+
+        lead_name = f"{lead.first_name} {lead.last_name}"
+        lead.deleted_at = None
+        lead.deleted_by = None
+        apply_rollup_change(db, rollup_before, rollup_keys(lead))
 
+        from app.utils.reminder_schedule import refresh_next_reminder_due_at
+        refresh_next_reminder_due_at(db, lead)
+        bump_table_version(db, "leads")
 
-def list_deleted_leads(db: Session, skip: int = 0, limit: int = 50) -> List[models.Lead]:
-    """List only deleted leads (recycle bin). Eagerly loads relationships for caching."""
-    query = (
-        db.query(models.Lead)
-        .options(
-            joinedload(models.Lead.agency),
-            joinedload(models.Lead.ccu),
-            joinedload(models.Lead.mco),
-            joinedload(models.Lead.agency_suboption)
+        # Log the activity in the same transaction
+        from ..utils.activity_logger import log_activity
+        log_activity(
+            db=db,
+            user_id=user_id,
+            username=username,
+            action_type="LEAD_RESTORED",
+            entity_type="Lead",
+            entity_id=lead_id,
+            entity_name=lead_name,
+            description=f"Lead '{lead_name}' restored from recycle bin",
+            keywords="lead,restore,recycle",
+            commit=False
         )
-    )
-    
-    # Defensive eager loading
-    try:
-        query = query.options(joinedload(models.Lead.lead_comments))
-    except Exception:
-        pass
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        raise e
     
-    return (
-        query
-        .filter(models.Lead.deleted_at != None)
-        .order_by(models.Lead.deleted_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    return True
 
 
-def search_leads(
+def list_deleted_leads(
     db: Session,
+    skip: int = 0,
+    limit: int = 50,
+    cursor: Optional[LeadCursor] = None
+) -> List[LeadListRow]:
+    """List only deleted leads (recycle bin) as slim list rows."""
+    query = _list_row_query(db).filter(models.Lead.deleted_at != None)
+    query = _with_latest_comment(query)
+    return _to_list_rows(_paginate_leads(query, "Recently Deleted", skip, limit, cursor).all())
+
+
+def _apply_lead_filters(
+    query,
     search_query: Optional[str] = None,
     staff_filter: Optional[str] = None,
     source_filter: Optional[str] = None,
@@ -392,8 +550,6 @@ def search_leads(
     exclude_clients: bool = True,
     only_clients: bool = False,
     auth_received_filter: Optional[bool] = None,
-    skip: int = 0,
-    limit: int = 50,
     city_filter: Optional[str] = None,
     zip_filter: Optional[str] = None,
     lead_id_filter: Optional[int] = None,
@@ -405,29 +561,13 @@ def search_leads(
     tag_color_filter: Optional[str] = None,
     caregiver_type_filter: Optional[str] = None,
     ccu_filter: Optional[str] = None,
-    agency_filter: Optional[str] = None,
-    sort_by: str = "Newest Added"
+    agency_filter: Optional[str] = None
 ):
     """
-    Search leads with comprehensive SQL-level filtering and pagination.
-    Super fast performance.
+    Single filter compiler shared by search_leads, count_search_leads and
+    search_leads_with_count. Builds the WHERE clause once so the page and
+    its total can never disagree.
     """
-    import app.models as models
-    # Centralized reloading in streamlit_app.py handles updates
-    
-    query = db.query(models.Lead).options(
-        joinedload(models.Lead.agency),
-        joinedload(models.Lead.ccu),
-        joinedload(models.Lead.mco),
-        joinedload(models.Lead.agency_suboption)
-    )
-    
-    # Defensive eager loading
-    try:
-        query = query.options(joinedload(models.Lead.lead_comments))
-    except Exception:
-        pass
-    
     # 1. Deleted State
     if include_deleted:
         query = query.filter(models.Lead.deleted_at != None)
@@ -481,39 +621,16 @@ def search_leads(
     # work exactly as before (one token → standard partial ILIKE).
     # Fields searched per token: first_name, last_name, concatenated full
     # name (forward and reversed), phone, email, medicaid_no, custom_user_id.
+    # Token matching goes through the trigram search index (FTS5 on SQLite,
+    # pg_trgm on Postgres) and falls back to ILIKE when it is unavailable.
     # ─────────────────────────────────────────────────────────────────────────
     if search_query:
-        from sqlalchemy import or_, and_, func, cast, String as SAString
-        # Normalize: trim, lowercase, collapse multiple spaces
-        normalized = re.sub(r'\s+', ' ', search_query.strip()).lower()
-        tokens = [t for t in normalized.split() if t]  # drop empty strings
+        from app.utils.lead_search_index import tokenize_search_query, lead_token_condition
+        tokens = tokenize_search_query(search_query)
 
         if tokens:
-            # Build a lower-cased full-name expression (first last) and its reverse
-            full_name_expr = func.lower(
-                models.Lead.first_name + ' ' + models.Lead.last_name
-            )
-            full_name_rev_expr = func.lower(
-                models.Lead.last_name + ' ' + models.Lead.first_name
-            )
-
-            token_conditions = []
-            for token in tokens:
-                tok_pat = f"%{token}%"
-                # Each token must appear in at least ONE of these fields
-                token_conditions.append(or_(
-                    models.Lead.first_name.ilike(tok_pat),
-                    models.Lead.last_name.ilike(tok_pat),
-                    full_name_expr.ilike(tok_pat),
-                    full_name_rev_expr.ilike(tok_pat),
-                    models.Lead.phone.ilike(tok_pat),
-                    models.Lead.email.ilike(tok_pat),
-                    models.Lead.medicaid_no.ilike(tok_pat),
-                    models.Lead.custom_user_id.ilike(tok_pat),
-                ))
-
-            # ALL token conditions must hold (AND across tokens)
-            query = query.filter(and_(*token_conditions))
+            # ALL tokens must match (AND across tokens, OR across fields)
+            query = query.filter(lead_token_condition(models.Lead, tokens))
         
     # 5. Staff Filter
     if staff_filter:
@@ -526,7 +643,6 @@ def search_leads(
     # 7. Status Filter
     if status_filter and status_filter != "All":
         if status_filter in ["Initial Referral Sent", "Referral Sent"]:
-            from sqlalchemy import or_
             query = query.filter(models.Lead.last_contact_status.in_(["Initial Referral Sent", "Referral Sent"]))
         else:
             query = query.filter(models.Lead.last_contact_status == status_filter)
@@ -536,7 +652,6 @@ def search_leads(
         query = query.filter(models.Lead.referral_type == referral_category_filter)
     if priority_filter and priority_filter != "All":
         if priority_filter == "Not Called":
-            from sqlalchemy import or_
             query = query.filter(or_(models.Lead.priority == "Not Called", models.Lead.priority == None))
         else:
             query = query.filter(models.Lead.priority == priority_filter)
@@ -548,7 +663,6 @@ def search_leads(
     # 8.6 Caregiver Type Filter
     if caregiver_type_filter and caregiver_type_filter != "All":
         if caregiver_type_filter == "None":
-            from sqlalchemy import or_
             query = query.filter(or_(models.Lead.caregiver_type == None, models.Lead.caregiver_type == "", models.Lead.caregiver_type == "None"))
         else:
             query = query.filter(models.Lead.caregiver_type == caregiver_type_filter)
@@ -557,8 +671,11 @@ def search_leads(
     if agency_filter and agency_filter != "All":
         query = query.join(models.Agency, isouter=True).filter(models.Agency.name == agency_filter)
         
+    # CCU may be needed by several filters below; join it only once
+    ccu_joined = False
     if ccu_filter and ccu_filter != "All":
         query = query.join(models.CCU, isouter=True).filter(models.CCU.name == ccu_filter)
+        ccu_joined = True
             
     # 9. Active/Inactive Filter
     if only_clients:
@@ -574,26 +691,26 @@ def search_leads(
             query = query.filter(models.Lead.last_contact_status.in_(["Inactive", "Not Interested"]))
         
     # 10. Advanced Filters (City / Zip)
+    if (city_filter or zip_filter) and not ccu_joined:
+        query = query.join(models.CCU, isouter=True)
+
     if city_filter:
-        from sqlalchemy import or_
         query = query.filter(or_(
             models.Lead.city.ilike(f"%{city_filter}%"),
             models.CCU.city.ilike(f"%{city_filter}%")
-        )).join(models.CCU, isouter=True)
+        ))
         
     if zip_filter:
-        from sqlalchemy import or_
         query = query.filter(or_(
             models.Lead.zip_code.ilike(f"%{zip_filter}%"),
             models.CCU.zip_code.ilike(f"%{zip_filter}%")
-        )).join(models.CCU, isouter=True)
+        ))
         
     if lead_id_filter:
         query = query.filter(models.Lead.id == lead_id_filter)
         
     # 11. Care Status Filter (for Authorizations Received / Confirmations page)
     if care_status_filter:
-        from sqlalchemy import or_
         if care_status_filter == "Active":
             # Active means NOT Hold, NOT Terminated, NOT Deceased, and NOT Transfer Received
             query = query.filter(or_(
@@ -643,25 +760,56 @@ def search_leads(
     # 10.7 Referral Category Filter
     if referral_category_filter and referral_category_filter != "All":
         if referral_category_filter == "Regular":
-            from sqlalchemy import or_
             query = query.filter(or_(models.Lead.referral_type == "Regular", models.Lead.referral_type == None, models.Lead.referral_type == ""))
         elif referral_category_filter == "Interim":
             query = query.filter(models.Lead.referral_type == "Interim")
         
         
-    # 11. Order and Pagination
-    if sort_by == "Recently Updated":
-        query = query.order_by(models.Lead.updated_at.desc())
-    else:
-        # Default: Newest Added
-        query = query.order_by(models.Lead.created_at.desc())
-        
-    return (
-        query
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    return query
+
+
+def search_leads(
+    db: Session,
+    search_query: Optional[str] = None,
+    staff_filter: Optional[str] = None,
+    source_filter: Optional[str] = None,
+    status_filter: Optional[str] = None,
+    priority_filter: Optional[str] = None,
+    active_inactive_filter: Optional[str] = None,
+    owner_id: Optional[int] = None,
+    only_my_leads: bool = False,
+    include_deleted: bool = False,
+    exclude_clients: bool = True,
+    only_clients: bool = False,
+    auth_received_filter: Optional[bool] = None,
+    skip: int = 0,
+    limit: int = 50,
+    city_filter: Optional[str] = None,
+    zip_filter: Optional[str] = None,
+    lead_id_filter: Optional[int] = None,
+    lead_id_search: Optional[str] = None,  # Partial ID text search (ILIKE)
+    lead_type_filter: Optional[str] = None, # "Lead", "Initial Referral Sent", "Referral Confirmed"
+    referral_category_filter: Optional[str] = None,
+    care_status_filter: Optional[str] = None,
+    care_sub_status_filter: Optional[str] = None,
+    tag_color_filter: Optional[str] = None,
+    caregiver_type_filter: Optional[str] = None,
+    ccu_filter: Optional[str] = None,
+    agency_filter: Optional[str] = None,
+    sort_by: str = "Newest Added",
+    cursor: Optional[LeadCursor] = None
+):
+    """
+    Search leads with comprehensive SQL-level filtering and pagination.
+    Pass `cursor` (see lead_cursor) for keyset paging; `skip` is only used
+    without one. Use search_leads_with_count when the page also needs the total.
+    """
+    filters = dict(locals())
+    for key in ("db", "skip", "limit", "sort_by", "cursor"):
+        filters.pop(key)
+
+    query = _with_latest_comment(_apply_lead_filters(_list_row_query(db), **filters))
+    return _to_list_rows(_paginate_leads(query, sort_by, skip, limit, cursor).all())
 
 
 def count_search_leads(
@@ -682,7 +830,7 @@ def count_search_leads(
     zip_filter: Optional[str] = None,
     lead_id_filter: Optional[int] = None,
     lead_id_search: Optional[str] = None,  # Partial ID text search (ILIKE)
-    lead_type_filter: Optional[str] = None,
+    lead_type_filter: Optional[str] = None, # "Lead", "Initial Referral Sent", "Referral Confirmed"
     referral_category_filter: Optional[str] = None,
     care_status_filter: Optional[str] = None,
     care_sub_status_filter: Optional[str] = None,
@@ -692,195 +840,66 @@ def count_search_leads(
     agency_filter: Optional[str] = None
 ) -> int:
     """Returns the total count of leads matching the search criteria (for pagination)"""
+    filters = dict(locals())
+    filters.pop("db")
+
     from sqlalchemy import func
-    query = db.query(func.count(models.Lead.id))
-    
-    if include_deleted:
-        query = query.filter(models.Lead.deleted_at != None)
-    else:
-        query = query.filter(models.Lead.deleted_at == None)
-        
-    # 1.5 Lead Type Shorthands
-    if lead_type_filter == "Referral Sent":
-        only_clients = True
-        auth_received_filter = False
-    elif lead_type_filter == "Referral Confirmed": # Authorizations Received
-        only_clients = True
-        auth_received_filter = True
-    elif lead_type_filter == "Lead":
-        only_clients = False
-        exclude_clients = True
-        
-    if only_clients:
-        query = query.filter(models.Lead.active_client == True)
-    elif exclude_clients and not include_deleted:
-        query = query.filter(models.Lead.active_client == False)
-        
-    if auth_received_filter is not None:
-        query = query.filter(models.Lead.authorization_received == auth_received_filter)
-        
-    if only_my_leads and owner_id:
-        query = query.filter(models.Lead.owner_id == owner_id)
-        
-    # Exact ID filter (URL navigation)
-    if lead_id_filter:
-        query = query.filter(models.Lead.id == lead_id_filter)
 
-    # Partial ID search (ILIKE on cast)
-    elif lead_id_search and lead_id_search.strip():
-        from sqlalchemy import cast, String as SAString
-        query = query.filter(
-            cast(models.Lead.id, SAString).ilike(f"%{lead_id_search.strip()}%")
-        )
+    query = db.query(func.count(models.Lead.id)).select_from(models.Lead)
+    return _apply_lead_filters(query, **filters).scalar()
 
-    # Smart multi-token name / field search (mirrors search_leads)
-    if search_query:
-        from sqlalchemy import or_, and_, func, cast, String as SAString
-        normalized = re.sub(r'\s+', ' ', search_query.strip()).lower()
-        tokens = [t for t in normalized.split() if t]
 
-        if tokens:
-            full_name_expr = func.lower(
-                models.Lead.first_name + ' ' + models.Lead.last_name
-            )
-            full_name_rev_expr = func.lower(
-                models.Lead.last_name + ' ' + models.Lead.first_name
-            )
-
-            token_conditions = []
-            for token in tokens:
-                tok_pat = f"%{token}%"
-                token_conditions.append(or_(
-                    models.Lead.first_name.ilike(tok_pat),
-                    models.Lead.last_name.ilike(tok_pat),
-                    full_name_expr.ilike(tok_pat),
-                    full_name_rev_expr.ilike(tok_pat),
-                    models.Lead.phone.ilike(tok_pat),
-                    models.Lead.email.ilike(tok_pat),
-                    models.Lead.medicaid_no.ilike(tok_pat),
-                    models.Lead.custom_user_id.ilike(tok_pat),
-                ))
-
-            query = query.filter(and_(*token_conditions))
-        
-    if staff_filter:
-        query = query.filter(models.Lead.staff_name.ilike(f"%{staff_filter}%"))
-        
-    if source_filter:
-        query = query.filter(models.Lead.source.ilike(f"%{source_filter}%"))
-        
-    if status_filter and status_filter != "All":
-        if status_filter in ["Initial Referral Sent", "Referral Sent"]:
-            from sqlalchemy import or_
-            query = query.filter(models.Lead.last_contact_status.in_(["Initial Referral Sent", "Referral Sent"]))
-        else:
-            query = query.filter(models.Lead.last_contact_status == status_filter)
-        
-    # 7.5 Referral Category Filter (Regular/Interim)
-    if referral_category_filter and referral_category_filter != "All":
-        query = query.filter(models.Lead.referral_type == referral_category_filter)
-        
-    if priority_filter and priority_filter != "All":
-        if priority_filter == "Not Called":
-            from sqlalchemy import or_
-            query = query.filter(or_(models.Lead.priority == "Not Called", models.Lead.priority == None))
-        else:
-            query = query.filter(models.Lead.priority == priority_filter)
-        
-    if tag_color_filter and tag_color_filter != "All":
-        query = query.filter(models.Lead.tag_color == tag_color_filter)
-        
-    # 8.6 Caregiver Type Filter
-    if caregiver_type_filter and caregiver_type_filter != "All":
-        if caregiver_type_filter == "None":
-            from sqlalchemy import or_
-            query = query.filter(or_(models.Lead.caregiver_type == None, models.Lead.caregiver_type == "", models.Lead.caregiver_type == "None"))
-        else:
-            query = query.filter(models.Lead.caregiver_type == caregiver_type_filter)
-            
-    # 8.7 Agency / CCU Filter
-    if agency_filter and agency_filter != "All":
-        query = query.join(models.Agency, isouter=True).filter(models.Agency.name == agency_filter)
-        
-    if ccu_filter and ccu_filter != "All":
-        query = query.join(models.CCU, isouter=True).filter(models.CCU.name == ccu_filter)
-            
-    if only_clients:
-        inactive_statuses = ["Not Approved", "Services Refused", "Inactive", "Not Interested"]
-        if active_inactive_filter == "Active":
-            query = query.filter(~models.Lead.last_contact_status.in_(inactive_statuses))
-        elif active_inactive_filter == "Inactive":
-            query = query.filter(models.Lead.last_contact_status.in_(inactive_statuses))
-    else:
-        from sqlalchemy import or_
-        if active_inactive_filter == "Active":
-            query = query.filter(~models.Lead.last_contact_status.in_(["Inactive", "Not Interested"]))
-        elif active_inactive_filter == "Inactive":
-            query = query.filter(models.Lead.last_contact_status.in_(["Inactive", "Not Interested"]))
-        
-    if city_filter:
-        from sqlalchemy import or_
-        query = query.filter(or_(
-            models.Lead.city.ilike(f"%{city_filter}%"),
-            models.CCU.city.ilike(f"%{city_filter}%")
-        )).join(models.CCU, isouter=True)
-        
-    if zip_filter:
-        from sqlalchemy import or_
-        query = query.filter(or_(
-            models.Lead.zip_code.ilike(f"%{zip_filter}%"),
-            models.CCU.zip_code.ilike(f"%{zip_filter}%")
-        )).join(models.CCU, isouter=True)
-        
-            
-            
-    if lead_type_filter and lead_type_filter != "All":
-        if lead_type_filter == "Lead":
-            query = query.filter(models.Lead.active_client == False)
-        elif lead_type_filter == "Initial Referral Sent":
-            query = query.filter(models.Lead.active_client == True, models.Lead.authorization_received == False)
-        elif lead_type_filter == "Referral Confirmed":
-            query = query.filter(models.Lead.active_client == True, models.Lead.authorization_received == True)
+def search_leads_with_count(
+    db: Session,
+    skip: int = 0,
+    limit: int = 50,
+    sort_by: str = "Newest Added",
+    cursor: Optional[LeadCursor] = None,
+    total: Optional[int] = None,
+    **filters
+) -> Tuple[List[LeadListRow], int]:
+    """
+    Return one page of matching leads (as list rows) together with the total match count.
+    Accepts the same filter keywords as search_leads. The total comes from a
+    COUNT(*) OVER() window on the page query, so a single scan serves both.
+    With a keyset `cursor` the window would only see rows past the cursor,
+    so pass the `total` an earlier page returned; it is only recounted
+    (a full filtered COUNT) when not given.
+    """
+    if cursor:
+        query = _with_latest_comment(_apply_lead_filters(_list_row_query(db), **filters))
+        leads = _to_list_rows(_paginate_leads(query, sort_by, skip, limit, cursor).all())
+        if total is None:
+            total = count_search_leads(db, **filters)
+        return leads, total
 
-    if referral_category_filter and referral_category_filter != "All":
-        if referral_category_filter == "Regular":
-            from sqlalchemy import or_
-            query = query.filter(or_(models.Lead.referral_type == "Regular", models.Lead.referral_type == None, models.Lead.referral_type == ""))
-        elif referral_category_filter == "Interim":
-            query = query.filter(models.Lead.referral_type == "Interim")
-            
-    # 11. Care Status Filter (Mirroring search_leads)
-    if care_status_filter:
-        from sqlalchemy import or_
-        if care_status_filter == "Active":
-            query = query.filter(or_(
-                models.Lead.care_status == None,
-                ~models.Lead.care_status.in_(["Hold", "Terminated", "Deceased"])
-            ))
-            
-            # REFINED: Mirror search_leads logic for count
-            query = query.filter(or_(
-                models.Lead.source != "Transfer",
-                models.Lead.care_status == "Care Start"
-            ))
-            
-            # Apply sub-filter if Active
-            if care_sub_status_filter and care_sub_status_filter != "All":
-                query = query.filter(models.Lead.care_status == care_sub_status_filter)
-                
-        elif care_status_filter == "Transfer":
-            query = query.filter(
-                models.Lead.source == "Transfer",
-                models.Lead.care_status != "Care Start"
-            )
-        elif care_status_filter == "Inactive":
-            query = query.filter(models.Lead.care_status.in_(["Hold", "Terminated", "Deceased"]))
-            # Apply sub-filter if Inactive
-            if care_sub_status_filter and care_sub_status_filter != "All":
-                query = query.filter(models.Lead.care_status == care_sub_status_filter)
-        elif care_status_filter in ["Hold", "Terminated", "Deceased"]:
-            query = query.filter(models.Lead.care_status == care_status_filter)
-        elif care_status_filter != "All":
-            query = query.filter(models.Lead.care_status == care_status_filter)
-        
-    return query.scalar()
+    from sqlalchemy import func
+    total_col = func.count(models.Lead.id).over().label("total_count")
+
+    query = _with_latest_comment(_apply_lead_filters(_list_row_query(db, total_col), **filters))
+    rows = _paginate_leads(query, sort_by, skip, limit).all()
+
+    if rows:
+        return _to_list_rows(rows), rows[0].total_count
+
+    # Empty page: either nothing matches or the page is past the end
+    total = count_search_leads(db, **filters) if skip > 0 else 0
+    return [], total
+
+
+def iter_search_leads(
+    db: Session,
+    sort_by: str = "Newest Added",
+    batch_size: int = 1000,
+    **filters
+) -> Iterator[LeadListRow]:
+    """
+    Stream every lead matching the search_leads filters, in list order, for exports.
+    Rows are fetched `batch_size` at a time (yield_per; a server-side cursor
+    on PostgreSQL) rather than materialized as one list, and without the
+    latest-comment join. Consume the iterator before closing `db`.
+    """
+    query = _apply_lead_filters(_list_row_query(db), **filters)
+    query = _paginate_leads(query, sort_by, 0, None).execution_options(yield_per=batch_size)
+    for row in query:
+        yield LeadListRow(row._mapping)
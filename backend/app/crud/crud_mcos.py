@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import Optional, List
 import app.models as models
 from .crud_activity_logs import create_activity_log
+from ..utils.table_versions import bump_table_version
 
 
 def get_all_mcos(db: Session) -> List[models.MCO]:
@@ -36,6 +37,7 @@ def create_mco(
         created_at=datetime.utcnow()
     )
     db.add(new_mco)
+    bump_table_version(db, "mcos")
     db.commit()
     db.refresh(new_mco)
     
@@ -72,6 +74,7 @@ def update_mco(
     mco.updated_by = username
     mco.updated_at = datetime.utcnow()
     
+    bump_table_version(db, "mcos")
     db.commit()
     db.refresh(mco)
     
@@ -113,6 +116,7 @@ def delete_mco(
         return False
     
     db.delete(mco)
+    bump_table_version(db, "mcos")
     db.commit()
     
     # Log the activity
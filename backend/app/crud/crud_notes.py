@@ -55,6 +55,21 @@ def get_comments(db: Session, lead_id: int):
         .all()
     )
 
+def get_comments_for_leads(db: Session, lead_ids: List[int]):
+    """Comments for several leads in one query, newest first per lead"""
+    lead_ids = list({lead_id for lead_id in lead_ids if lead_id is not None})
+    if not lead_ids:
+        return {}
+    comments = {}
+    for comment in (
+        db.query(models.LeadComment)
+        .filter(models.LeadComment.lead_id.in_(lead_ids))
+        .order_by(models.LeadComment.created_at.desc())
+        .all()
+    ):
+        comments.setdefault(comment.lead_id, []).append(comment)
+    return comments
+
 def delete_comment(db: Session, comment_id: int) -> bool:
     """Delete a comment"""
     comment = db.query(models.LeadComment).filter(models.LeadComment.id == comment_id).first()
@@ -13,9 +13,10 @@ def create_notification(
     title: str, 
     description: str, 
     entity_id: Optional[int] = None, 
-    entity_type: Optional[str] = None
+    entity_type: Optional[str] = None,
+    commit: bool = True
 ):
-    """Create a new in-app notification for a user"""
+    """Create a new in-app notification for a user (commit=False: the caller commits)"""
     notification = Notification(
         user_id=user_id,
         title=title,
@@ -26,8 +27,8 @@ def create_notification(
         created_at=datetime.utcnow()
     )
     db.add(notification)
-    db.commit()
-    db.refresh(notification)
+    if commit:
+        db.commit()
     return notification
 
 
@@ -0,0 +1,151 @@
+"""
+CRUD operations for the outbound email queue
+"""
+from sqlalchemy.orm import Session
+from sqlalchemy import update
+from typing import List, Optional
+from datetime import datetime, timedelta
+
+import app.models as models
+
+# Retry schedule: 1m, 2m, 4m, ... capped at 6h
+BACKOFF_BASE_SECONDS = 60
+BACKOFF_MAX_SECONDS = 6 * 3600
+
+# A "sending" row older than this belongs to a worker that died mid-send
+STALE_LOCK_SECONDS = 600
+
+
+def enqueue_email(
+    db: Session,
+    to_email: str,
+    subject: str,
+    body: str,
+    html_body: Optional[str] = None,
+    include_admin_bcc: bool = True,
+    max_attempts: int = 6,
+    reminder_id: Optional[int] = None
+) -> models.OutboundEmail:
+    """
+    Persist an email for background delivery.
+    `reminder_id` links an email_reminders row whose status follows delivery.
+    """
+    email = models.OutboundEmail(
+        to_email=to_email,
+        subject=subject,
+        body=body,
+        html_body=html_body,
+        include_admin_bcc=include_admin_bcc,
+        reminder_id=reminder_id,
+        status="pending",
+        max_attempts=max_attempts,
+        next_attempt_at=datetime.utcnow()
+    )
+    db.add(email)
+    db.commit()
+    db.refresh(email)
+    return email
+
+
+def claim_due_emails(db: Session, limit: int = 50) -> List[models.OutboundEmail]:
+    """
+    Claim up to `limit` due emails for this worker.
+    Each row is flipped pending -> sending with a conditional UPDATE, so
+    concurrent workers (Streamlit and API processes) never send the same row.
+    """
+    now = datetime.utcnow()
+    candidate_ids = [row_id for (row_id,) in db.query(models.OutboundEmail.id).filter(
+        models.OutboundEmail.status == "pending",
+        models.OutboundEmail.next_attempt_at <= now
+    ).order_by(models.OutboundEmail.next_attempt_at.asc()).limit(limit).all()]
+
+    claimed = []
+    for email_id in candidate_ids:
+        result = db.execute(
+            update(models.OutboundEmail)
+            .where(models.OutboundEmail.id == email_id, models.OutboundEmail.status == "pending")
+            .values(status="sending", locked_at=now)
+        )
+        if result.rowcount:
+            claimed.append(email_id)
+    db.commit()
+
+    if not claimed:
+        return []
+    return db.query(models.OutboundEmail).filter(
+        models.OutboundEmail.id.in_(claimed)
+    ).order_by(models.OutboundEmail.id.asc()).all()
+
+
+def mark_sent(db: Session, email: models.OutboundEmail) -> None:
+    email.status = "sent"
+    email.attempts += 1
+    email.sent_at = datetime.utcnow()
+    email.locked_at = None
+    email.last_error = None
+    _update_reminder(db, email, "sent", None)
+    db.commit()
+
+
+def mark_failed(db: Session, email: models.OutboundEmail, error: str) -> None:
+    """Schedule a retry with exponential backoff, or dead-letter after max_attempts"""
+    email.attempts += 1
+    email.last_error = error
+    email.locked_at = None
+    if email.attempts >= email.max_attempts:
+        email.status = "dead"
+        _update_reminder(db, email, "failed", error)
+    else:
+        delay = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** (email.attempts - 1)))
+        email.status = "pending"
+        email.next_attempt_at = datetime.utcnow() + timedelta(seconds=delay)
+    db.commit()
+
+
+def _update_reminder(db: Session, email: models.OutboundEmail, status: str, error: Optional[str]) -> None:
+    """Carry the delivery outcome onto the linked email_reminders row (same transaction)"""
+    if not email.reminder_id:
+        return
+    values = {"status": status, "error_message": error}
+    if status == "sent":
+        values["sent_at"] = email.sent_at
+    db.execute(
+        update(models.EmailReminder)
+        .where(models.EmailReminder.id == email.reminder_id)
+        .values(**values)
+    )
+
+
+def release_stale_claims(db: Session) -> int:
+    """Return rows stuck in "sending" (worker crashed or restarted) to the queue"""
+    cutoff = datetime.utcnow() - timedelta(seconds=STALE_LOCK_SECONDS)
+    result = db.execute(
+        update(models.OutboundEmail)
+        .where(models.OutboundEmail.status == "sending", models.OutboundEmail.locked_at < cutoff)
+        .values(status="pending", locked_at=None)
+    )
+    db.commit()
+    return result.rowcount or 0
+
+
+def get_dead_letters(db: Session, limit: int = 100) -> List[models.OutboundEmail]:
+    """Emails that exhausted their retries, newest first"""
+    return db.query(models.OutboundEmail).filter(
+        models.OutboundEmail.status == "dead"
+    ).order_by(models.OutboundEmail.created_at.desc()).limit(limit).all()
+
+
+def retry_dead_letter(db: Session, email_id: int) -> bool:
+    """Put a dead-lettered email back on the queue with a fresh retry budget"""
+    email = db.query(models.OutboundEmail).filter(
+        models.OutboundEmail.id == email_id,
+        models.OutboundEmail.status == "dead"
+    ).first()
+    if not email:
+        return False
+    email.status = "pending"
+    email.attempts = 0
+    email.next_attempt_at = datetime.utcnow()
+    _update_reminder(db, email, "pending", None)
+    db.commit()
+    return True
@@ -7,6 +7,7 @@ from ..utils import security
 import app.models as models
 from ..schemas import UserCreate
 from ..utils.activity_logger import log_activity
+from ..utils.table_versions import bump_table_version
 
 
 # -------- Password Helpers --------
@@ -40,6 +41,7 @@ def create_user(db: Session, user_in: UserCreate, performer_username: str = "Sys
         role=user_in.role,
     )
     db.add(user)
+    bump_table_version(db, "users")
     db.commit()
     db.refresh(user)
     
@@ -149,6 +151,7 @@ def update_user_credentials(
         except Exception as e:
             print(f"Error saving profile picture: {e}")
     
+    bump_table_version(db, "users")
     db.commit()
     db.refresh(user)
     
@@ -195,6 +198,7 @@ def approve_user(db: Session, user_id: int, admin_username: str, admin_id: int):
         return None
     
     user.is_approved = True
+    bump_table_version(db, "users")
     db.commit()
     db.refresh(user)
     
@@ -222,6 +226,7 @@ def reject_user(db: Session, user_id: int, admin_username: str, admin_id: int):
     
     username = user.username
     db.delete(user)
+    bump_table_version(db, "users")
     db.commit()
     
     # Log activity
@@ -248,6 +253,7 @@ def delete_user(db: Session, user_id: int, admin_username: str, admin_id: int):
     
     username = user.username
     db.delete(user)
+    bump_table_version(db, "users")
     db.commit()
     
     # Log activity
@@ -284,6 +290,7 @@ def request_password_reset(db: Session, username: str):
         return None
     
     user.password_reset_requested = True
+    bump_table_version(db, "users")
     db.commit()
     db.refresh(user)
     
@@ -316,6 +323,7 @@ def admin_reset_password(db: Session, user_id: int, new_password: str, admin_use
     
     user.hashed_password = hash_password(new_password)
     user.password_reset_requested = False
+    bump_table_version(db, "users")
     db.commit()
     db.refresh(user)
     
@@ -347,6 +355,7 @@ def update_user_role(db: Session, user_id: int, new_role: str, admin_username: s
     
     old_role = user.role
     user.role = new_role
+    bump_table_version(db, "users")
     db.commit()
     db.refresh(user)
     
@@ -385,6 +394,7 @@ def admin_update_username(db: Session, user_id: int, new_username: str, admin_us
     _sync_username_changes(db, old_username, new_username)
     
     user.username = new_username
+    bump_table_version(db, "users")
     db.commit()
     db.refresh(user)
     
@@ -419,6 +429,7 @@ def admin_update_email(db: Session, user_id: int, new_email: str, admin_username
     
     old_email = user.email
     user.email = new_email
+    bump_table_version(db, "users")
     db.commit()
     db.refresh(user)
     
@@ -454,6 +465,7 @@ def admin_update_user_id(db: Session, user_id: int, new_user_id: str, admin_user
     
     old_user_id = user.user_id
     user.user_id = new_user_id
+    bump_table_version(db, "users")
     db.commit()
     db.refresh(user)
     
@@ -492,6 +504,9 @@ def _sync_username_changes(db: Session, old_username: str, new_username: str):
     db.query(models.Lead).filter(models.Lead.staff_name == old_username).update({models.Lead.staff_name: new_username}, synchronize_session=False)
     db.query(models.Lead).filter(models.Lead.created_by == old_username).update({models.Lead.created_by: new_username}, synchronize_session=False)
     db.query(models.Lead).filter(models.Lead.updated_by == old_username).update({models.Lead.updated_by: new_username}, synchronize_session=False)
+    from app.services.stats_rollup import rename_rollup_staff
+    rename_rollup_staff(db, old_username, new_username)
+    bump_table_version(db, "leads")
 
     # 2. Update Events (created_by, updated_by)
     db.query(models.Event).filter(models.Event.created_by == old_username).update({models.Event.created_by: new_username}, synchronize_session=False)
@@ -523,6 +538,10 @@ def _sync_username_changes(db: Session, old_username: str, new_username: str):
     # 8. Update Email Reminders (sent_by)
     db.query(models.EmailReminder).filter(models.EmailReminder.sent_by == old_username).update({models.EmailReminder.sent_by: new_username}, synchronize_session=False)
 
+    # created_by/updated_by on reference rows changed too
+    for table_name in ("events", "agencies", "agency_suboptions", "ccus", "mcos"):
+        bump_table_version(db, table_name)
+
     db.flush() # Ensure changes are staged within the current transaction
 
 
@@ -535,5 +554,6 @@ def _sync_user_id_changes(db: Session, old_user_id: str, new_user_id: str):
 
     # Update Leads (custom_user_id)
     db.query(models.Lead).filter(models.Lead.custom_user_id == old_user_id).update({models.Lead.custom_user_id: new_user_id}, synchronize_session=False)
+    bump_table_version(db, "leads")
 
     db.flush()
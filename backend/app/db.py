@@ -106,6 +106,19 @@ def auto_upgrade_db(eng):
                         logger.info("Auto-added 'caregiver_type' column to leads table")
                     except Exception as e:
                         logger.error(f"Failed to add caregiver_type: {e}")
+
+                if "next_reminder_due_at" not in columns:
+                    try:
+                        conn.execute(text("ALTER TABLE leads ADD COLUMN next_reminder_due_at TIMESTAMP"))
+                        # Mark everything due once; the scheduler evaluates the real
+                        # history on its next tick and stores the proper due time.
+                        conn.execute(text(
+                            "UPDATE leads SET next_reminder_due_at = CURRENT_TIMESTAMP "
+                            "WHERE deleted_at IS NULL"
+                        ))
+                        logger.info("Auto-added 'next_reminder_due_at' column to leads table")
+                    except Exception as e:
+                        logger.error(f"Failed to add next_reminder_due_at: {e}")
                         
         if "users" in inspector.get_table_names():
             columns = [col['name'] for col in inspector.get_columns("users")]
@@ -116,6 +129,28 @@ def auto_upgrade_db(eng):
                         logger.info("Auto-added 'profile_pic' column to users table")
                     except Exception as e:
                         logger.error(f"Failed to add profile_pic: {e}")
+
+        if "outbound_emails" in inspector.get_table_names():
+            columns = [col['name'] for col in inspector.get_columns("outbound_emails")]
+            with eng.begin() as conn:
+                if "reminder_id" not in columns:
+                    try:
+                        conn.execute(text("ALTER TABLE outbound_emails ADD COLUMN reminder_id INTEGER REFERENCES email_reminders(id)"))
+                        logger.info("Auto-added 'reminder_id' column to outbound_emails table")
+                    except Exception as e:
+                        logger.error(f"Failed to add reminder_id: {e}")
+
+        # create_all skips indexes on tables that already exist
+        existing_tables = set(inspector.get_table_names())
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            for index in table.indexes:
+                try:
+                    with eng.begin() as conn:
+                        index.create(bind=conn, checkfirst=True)
+                except Exception as e:
+                    logger.error(f"Failed to create index {index.name}: {e}")
     except Exception as e:
         logger.error(f"DB Auto-upgrade failed: {e}")
 
@@ -127,4 +162,21 @@ def init_db(eng):
     Base.metadata.create_all(bind=eng)
     auto_upgrade_db(eng)
 
+    # Optional trigram index for the lead search box
+    from app.utils.lead_search_index import ensure_lead_search_index
+    ensure_lead_search_index(eng)
+
+    # Substring index for the Activity Logs search box
+    from app.utils.activity_search_index import ensure_activity_search_index
+    ensure_activity_search_index(eng)
+
+    # Pre-aggregated dashboard counters (first build on existing databases)
+    try:
+        from sqlalchemy.orm import Session
+        from app.services.stats_rollup import ensure_stats_rollup
+        with Session(bind=eng) as session:
+            ensure_stats_rollup(session)
+    except Exception as e:
+        logger.error(f"Stats rollup build failed: {e}")
+
 init_db(engine)
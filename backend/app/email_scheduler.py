@@ -7,10 +7,17 @@ load_dotenv(dotenv_path)
 load_dotenv()
 
 from datetime import datetime, timedelta
+from sqlalchemy import event, insert, update, bindparam
 from sqlalchemy.orm import Session
 from app.db import SessionLocal
-from app.crud import crud_leads, crud_users, crud_email_reminders, crud_notifications
-from app.crud.crud_email_reminders import create_care_start_reminder, get_care_start_reminders_by_lead
+import app.models as models
+from app.crud import crud_email_reminders
+from app.utils.reminder_schedule import (
+    CARE_START_INTERVAL_HOURS,
+    care_start_pending,
+    compute_next_reminder_due_at,
+    reminder_interval_hours,
+)
 import time
 import threading
 
@@ -22,6 +29,7 @@ except ImportError:
 
 _last_digest_attempt_date = None
 _scheduler_thread = None
+_outbound_thread = None
 _scheduler_lock = threading.Lock()
 
 
@@ -97,12 +105,10 @@ def should_send_reminder(lead, last_reminder_time):
             return False
             
         # Interim: 48h, Regular: 1 week (168h)
-        referral_type = lead.referral_type if lead.referral_type else 'Regular'
-        interval_hours = 48 if referral_type == 'Interim' else 168
-        return hours_since_last >= interval_hours
+        return hours_since_last >= reminder_interval_hours(lead)
     else:
         # Non-referral lead: Every 7 days (1 week)
-        return hours_since_last >= 168
+        return hours_since_last >= reminder_interval_hours(lead)
 
 
 def should_send_care_start_reminder(lead, last_reminder_time, auth_received_time):
@@ -129,285 +135,283 @@ def should_send_care_start_reminder(lead, last_reminder_time, auth_received_time
 
     # Different schedules based on referral type
     # Updated: Every 24 hours for authorized referrals until Care Start
-    return hours_since_last >= 24
+    return hours_since_last >= CARE_START_INTERVAL_HOURS
+
+
+class _QueryCounter:
+    """
+    Counts SQL statements issued on one connection while active (for tick reports).
+    Listening on the connection rather than the shared engine keeps other
+    threads' queries (API requests, the outbound email worker) out of the count.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.count = 0
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(self.conn, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.conn, "before_cursor_execute", self._on_execute)
+        return False
+
+
+def _load_reminder_context(db: Session, leads: list) -> dict:
+    """Pre-load every lookup the reminder pass needs for these leads."""
+    from app.services.reference_data import get_reference_data
+
+    ref = get_reference_data()
+    return {
+        "users": {
+            username: ref.user_by_id[user_id]
+            for username, user_id in ref.user_id_by_username.items()
+        },
+        "agencies": ref.agency_by_id,
+        "suboptions": ref.suboption_by_id,
+        "ccus": ref.ccu_by_id,
+        "last_reminders": crud_email_reminders.get_last_reminder_times(db, [l.id for l in leads]),
+    }
+
+
+def _referral_details(lead, ctx: dict) -> dict:
+    """Payor and CCU details for a referral, resolved from the pre-loaded maps."""
+    agency = ctx["agencies"].get(lead.agency_id)
+    suboption = ctx["suboptions"].get(lead.agency_suboption_id)
+    ccu = ctx["ccus"].get(lead.ccu_id)
+
+    return {
+        'name': f"{lead.first_name} {lead.last_name}",
+        'phone': lead.phone,
+        'dob': str(lead.dob) if lead.dob else 'N/A',
+        'creator': lead.created_by,
+        'created_date': lead.created_at.strftime('%m/%d/%Y'),
+        'status': lead.last_contact_status,
+        'referral_type': lead.referral_type if lead.referral_type else 'Regular',
+        'payor_name': agency.name if agency else "N/A",
+        'payor_suboption': suboption.name if suboption else "",
+        'ccu_name': ccu.name if ccu else "N/A",
+        'ccu_phone': (ccu.phone if ccu and ccu.phone else "N/A"),
+        'ccu_fax': (ccu.fax if ccu and ccu.fax else "N/A"),
+        'ccu_email': (ccu.email if ccu and ccu.email else "N/A"),
+        'ccu_address': (ccu.address if ccu and ccu.address else "N/A"),
+        'ccu_coordinator': (ccu.care_coordinator_name if ccu and ccu.care_coordinator_name else "N/A"),
+        'care_status': lead.care_status if lead.care_status else 'N/A',
+        'priority': lead.priority if lead.priority else 'Medium'
+    }
+
+
+def _reminder_row(lead, user, subject: str, now: datetime) -> dict:
+    # Recorded for scheduler timing/history only; delivery is in-app.
+    return dict(
+        lead_id=lead.id,
+        recipient_email=user.email or "",
+        subject=subject,
+        sent_at=now,
+        sent_by="system",
+        status="notification_only",
+        error_message=None,
+        lead_name=f"{lead.first_name} {lead.last_name}",
+        lead_status=lead.last_contact_status,
+        lead_source=lead.source
+    )
+
+
+def _notification_row(lead, user, description: str, entity_type: str, now: datetime) -> dict:
+    return dict(
+        user_id=user.id,
+        title=f"ID: {lead.id} | {lead.first_name} {lead.last_name}",
+        description=description,
+        entity_id=lead.id,
+        entity_type=entity_type,
+        is_read=False,
+        created_at=now
+    )
 
 
 def send_lead_reminders():
-    """Check all active leads and create in-app reminder notifications if needed."""
+    """
+    Create in-app reminder notifications for leads whose reminder is due.
+
+    Only leads with next_reminder_due_at <= now are loaded (indexed), so a
+    tick costs O(due reminders) rather than O(leads). Lookups are pre-loaded
+    for that set, new reminder/notification rows are bulk-inserted, and each
+    processed lead gets its next due time written back in the same commit.
+    """
     db = SessionLocal()
     print(f"[{datetime.now()}] Starting lead reminder scan...")
+    started = time.perf_counter()
+    counter = None
+    created = 0
     try:
-        # Get all leads that are not inactive
-        all_leads = crud_leads.list_leads(db, limit=10000)
-        active_leads = [
-            lead for lead in all_leads 
-            if lead.last_contact_status != "Inactive"
-        ]
-        
-        print(f"[INFO] Found {len(active_leads)} active/follow-up leads to check.")
-        
-        for lead in active_leads:
-            try:
-                # Get the last reminder sent for this lead
-                reminders = crud_email_reminders.get_reminders_by_lead(db, lead.id)
-                last_reminder_time = reminders[0].sent_at if reminders else None
-                
-                if should_send_reminder(lead, last_reminder_time):
-                    # Get the lead creator for in-app notifications.
-                    if lead.created_by:
-                        user = crud_users.get_user_by_username(db, lead.created_by)
-                        if user:
-                            print(f"[DEBUG] Reminder condition met for Lead ID {lead.id} ({lead.first_name}). Creating notification for {user.username}...")
-                            
-                            # Check if this is a referral or regular lead
-                            if lead.active_client:  # Is a referral
-                                # Get agency (payor) information
-                                agency_name = "N/A"
-                                agency_suboption = ""
-                                if lead.agency_id:
-                                    from app.crud.crud_agencies import get_agency
-                                    agency = get_agency(db, lead.agency_id)
-                                    if agency:
-                                        agency_name = agency.name
-                                
-                                if lead.agency_suboption_id:
-                                    from app.crud.crud_agency_suboptions import get_suboption_by_id
-                                    suboption = get_suboption_by_id(db, lead.agency_suboption_id)
-                                    if suboption:
-                                        agency_suboption = suboption.name
-                                
-                                # Get CCU information
-                                ccu_name = "N/A"
-                                ccu_phone = "N/A"
-                                ccu_fax = "N/A"
-                                ccu_email = "N/A"
-                                ccu_address = "N/A"
-                                ccu_coordinator = "N/A"
-                                if lead.ccu_id:
-                                    from app.crud.crud_ccus import get_ccu_by_id
-                                    ccu = get_ccu_by_id(db, lead.ccu_id)
-                                    if ccu:
-                                        ccu_name = ccu.name
-                                        ccu_phone = ccu.phone if ccu.phone else "N/A"
-                                        ccu_fax = ccu.fax if ccu.fax else "N/A"
-                                        ccu_email = ccu.email if ccu.email else "N/A"
-                                        ccu_address = ccu.address if ccu.address else "N/A"
-                                        ccu_coordinator = ccu.care_coordinator_name if ccu.care_coordinator_name else "N/A"
-                                
-                                # Prepare referral-specific data
-                                referral_info = {
-                                    'name': f"{lead.first_name} {lead.last_name}",
-                                    'phone': lead.phone,
-                                    'dob': str(lead.dob) if lead.dob else 'N/A',
-                                    'creator': lead.created_by,
-                                    'created_date': lead.created_at.strftime('%m/%d/%Y'),
-                                    'status': lead.last_contact_status,
-                                    'referral_type': lead.referral_type if lead.referral_type else 'Regular',
-                                    'payor_name': agency_name,
-                                    'payor_suboption': agency_suboption,
-                                    'ccu_name': ccu_name,
-                                    'ccu_phone': ccu_phone,
-                                    'ccu_fax': ccu_fax,
-                                    'ccu_email': ccu_email,
-                                    'ccu_address': ccu_address,
-                                    'ccu_coordinator': ccu_coordinator,
-                                    'care_status': lead.care_status if lead.care_status else 'N/A',
-                                    'priority': lead.priority if lead.priority else 'Medium'
-                                }
-                                
-                                subject = f"Referral Reminder [{referral_info['referral_type']}]: {lead.first_name} {lead.last_name}"
-                                
-                            else:  # Regular non-referral lead
-                                subject = f"Lead Reminder: {lead.first_name} {lead.last_name}"
-                            
-                            # Record the reminder for scheduler timing/history only.
-                            crud_email_reminders.create_reminder(
-                                db=db,
-                                lead_id=lead.id,
-                                recipient_email=user.email or "",
-                                subject=subject,
-                                sent_by="system",
-                                status="notification_only",
-                                error_message=None
-                            )
-                            
-                            # CREATE IN-APP NOTIFICATION
-                            try:
-                                notification_title = f"ID: {lead.id} | {lead.first_name} {lead.last_name}"
-                                if lead.active_client:
+        # The scan runs in one transaction, so every statement uses this connection
+        counter = _QueryCounter(db.connection())
+        with counter:
+            now = datetime.utcnow()
+            # Soft-deleted leads always carry NULL, so the due index alone suffices
+            due_leads = db.query(models.Lead).filter(
+                models.Lead.next_reminder_due_at <= now
+            ).all()
+            print(f"[INFO] Found {len(due_leads)} leads with reminders due.")
+
+            if due_leads:
+                ctx = _load_reminder_context(db, due_leads)
+                reminder_rows = []
+                notification_rows = []
+                due_updates = []
+
+                for lead in due_leads:
+                    try:
+                        last_reminder_time, last_care_reminder_time = ctx["last_reminders"].get(lead.id, (None, None))
+                        user = ctx["users"].get(lead.created_by) if lead.created_by else None
+
+                        if should_send_reminder(lead, last_reminder_time):
+                            if user:
+                                if lead.active_client:  # Is a referral
+                                    referral_info = _referral_details(lead, ctx)
+                                    subject = f"Referral Reminder [{referral_info['referral_type']}]: {lead.first_name} {lead.last_name}"
                                     description = f"Referral Sent: Please follow-up with this referral. ({referral_info['referral_type']})"
                                     entity_type = "referral"
-                                else:
+                                else:  # Regular non-referral lead
+                                    subject = f"Lead Reminder: {lead.first_name} {lead.last_name}"
                                     description = "Lead: Please follow-up with this lead."
                                     entity_type = "lead"
-                                
-                                crud_notifications.create_notification(
-                                    db=db,
-                                    user_id=user.id,
-                                    title=notification_title,
-                                    description=description,
-                                    entity_id=lead.id,
-                                    entity_type=entity_type
-                                )
-                            except Exception as notif_e:
-                                print(f"[ERROR] Failed to create in-app notification: {notif_e}")
-                            
-                            if lead.active_client:
-                                reminder_type = f"[{referral_info['referral_type']}]"
-                            else:
-                                reminder_type = "[Lead]"
-                            print(f"[SUCCESS] Created {reminder_type} notification reminder for lead {lead.id}: {lead.first_name} {lead.last_name}")
-                        else:
-                            print(f"[WARN] No user found for lead creator: {lead.created_by} (Lead ID: {lead.id})")
-                else:
-                    # Optional tracking of why skipped
-                    pass
-            except Exception as inner_e:
-                print(f"[ERROR] Error processing Lead ID {lead.id}: {inner_e}")
-
-        # Now check for care start reminders for authorized referrals
-        print(f"[INFO] Checking authorized referrals for Care Start reminders...")
-        for lead in active_leads:
-            try:
-                # Only check referrals with authorization received but no care started
-                if not lead.active_client or not lead.authorization_received or lead.care_status == "Care Start":
-                    continue
-
-                # Find when authorization was received
-                auth_received_time = None
-                try:
-                    from app.crud.crud_activity_logs import get_lead_history
-                    import json
-                    history_logs = get_lead_history(db, lead.id)
-                    for log in history_logs:
-                        if log.old_value and log.new_value:
-                            try:
-                                old_val = json.loads(log.old_value) if isinstance(log.old_value, str) else log.old_value
-                                new_val = json.loads(log.new_value) if isinstance(log.new_value, str) else log.new_value
-
-                                # Check if authorization_received changed from False to True
-                                if (isinstance(old_val, dict) and isinstance(new_val, dict) and
-                                    old_val.get('authorization_received') == False and
-                                    new_val.get('authorization_received') == True):
-                                    auth_received_time = log.timestamp
-                                    break
-                            except (json.JSONDecodeError, TypeError):
-                                continue
-                except Exception:
-                    pass
-
-                if not auth_received_time:
-                    continue  # Skip if we can't determine when authorization was received
-
-                # Get the last care start reminder sent for this lead
-                care_start_reminders = get_care_start_reminders_by_lead(db, lead.id)
-                last_care_reminder_time = care_start_reminders[0].sent_at if care_start_reminders else None
-
-                if should_send_care_start_reminder(lead, last_care_reminder_time, auth_received_time):
-                    # Get the lead creator for in-app notifications.
-                    if lead.created_by:
-                        user = crud_users.get_user_by_username(db, lead.created_by)
-                        if user:
-                            print(f"[DEBUG] Care Start condition met for authorized Lead ID {lead.id}. Creating notification...")
-                            
-                            # Get agency (payor) information
-                            agency_name = "N/A"
-                            agency_suboption = ""
-                            if lead.agency_id:
-                                from app.crud.crud_agencies import get_agency
-                                agency = get_agency(db, lead.agency_id)
-                                if agency:
-                                    agency_name = agency.name
-
-                            if lead.agency_suboption_id:
-                                from app.crud.crud_agency_suboptions import get_suboption_by_id
-                                suboption = get_suboption_by_id(db, lead.agency_suboption_id)
-                                if suboption:
-                                    agency_suboption = suboption.name
-
-                            # Get CCU information
-                            ccu_name = "N/A"
-                            ccu_phone = "N/A"
-                            ccu_fax = "N/A"
-                            ccu_email = "N/A"
-                            ccu_address = "N/A"
-                            ccu_coordinator = "N/A"
-                            if lead.ccu_id:
-                                from app.crud.crud_ccus import get_ccu_by_id
-                                ccu = get_ccu_by_id(db, lead.ccu_id)
-                                if ccu:
-                                    ccu_name = ccu.name
-                                    ccu_phone = ccu.phone if ccu.phone else "N/A"
-                                    ccu_fax = ccu.fax if ccu.fax else "N/A"
-                                    ccu_email = ccu.email if ccu.email else "N/A"
-                                    ccu_address = ccu.address if ccu.address else "N/A"
-                                    ccu_coordinator = ccu.care_coordinator_name if ccu.care_coordinator_name else "N/A"
-
-                            # Prepare comprehensive care start reminder data
-                            care_start_info = {
-                                'name': f"{lead.first_name} {lead.last_name}",
-                                'phone': lead.phone,
-                                'dob': str(lead.dob) if lead.dob else 'N/A',
-                                'creator': lead.created_by,
-                                'created_date': lead.created_at.strftime('%m/%d/%Y'),
-                                'status': lead.last_contact_status,
-                                'referral_type': lead.referral_type if lead.referral_type else 'Regular',
-                                'payor_name': agency_name,
-                                'payor_suboption': agency_suboption,
-                                'ccu_name': ccu_name,
-                                'ccu_phone': ccu_phone,
-                                'ccu_fax': ccu_fax,
-                                'ccu_email': ccu_email,
-                                'ccu_address': ccu_address,
-                                'ccu_coordinator': ccu_coordinator,
-                                'auth_received_date': auth_received_time.strftime('%m/%d/%Y'),
-                                'days_since_auth': int((datetime.utcnow() - auth_received_time).total_seconds() / 86400),
-                                'care_status': lead.care_status if lead.care_status else 'N/A',
-                                'priority': lead.priority if lead.priority else 'Medium'
-                            }
-
-                            subject = f"Care Start Reminder [{care_start_info['referral_type']}]: {lead.first_name} {lead.last_name} - {care_start_info['days_since_auth']} days since authorization"
-
-                            # Record the care start reminder for scheduler timing/history only.
-                            create_care_start_reminder(
-                                db=db,
-                                lead_id=lead.id,
-                                recipient_email=user.email or "",
-                                subject=subject,
-                                sent_by="system",
-                                status="notification_only",
-                                error_message=None
-                            )
-
-                            # CREATE IN-APP NOTIFICATION (CARE START)
-                            try:
-                                notification_title = f"ID: {lead.id} | {lead.first_name} {lead.last_name}"
+
+                                reminder_rows.append(_reminder_row(lead, user, subject, now))
+                                notification_rows.append(_notification_row(lead, user, description, entity_type, now))
+                                created += 1
+                            elif lead.created_by:
+                                print(f"[WARN] No user found for lead creator: {lead.created_by} (Lead ID: {lead.id})")
+                            # Without a recipient, wait a full interval before retrying
+                            last_reminder_time = now
+
+                        # Care Start reminders for authorized referrals that have not started care
+                        auth_received_time = lead.authorization_received_at
+                        if care_start_pending(lead) and auth_received_time and \
+                                should_send_care_start_reminder(lead, last_care_reminder_time, auth_received_time):
+                            if user:
+                                care_start_info = _referral_details(lead, ctx)
+                                care_start_info['auth_received_date'] = auth_received_time.strftime('%m/%d/%Y')
+                                care_start_info['days_since_auth'] = int((now - auth_received_time).total_seconds() / 86400)
+
+                                subject = f"Care Start Reminder [{care_start_info['referral_type']}]: {lead.first_name} {lead.last_name} - {care_start_info['days_since_auth']} days since authorization"
                                 description = f"Referral Sent: Please follow-up with this referral. ({care_start_info['days_since_auth']} days since Authorization)"
-                                
-                                crud_notifications.create_notification(
-                                    db=db,
-                                    user_id=user.id,
-                                    title=notification_title,
-                                    description=description,
-                                    entity_id=lead.id,
-                                    entity_type="referral"
-                                )
-                            except Exception as notif_e:
-                                print(f"[ERROR] Failed to create care start notification: {notif_e}")
-
-                            print(f"[SUCCESS] Created Care Start notification for authorized referral {lead.id}: {lead.first_name} {lead.last_name} ({care_start_info['days_since_auth']} days since auth)")
-                        else:
-                            print(f"[WARN] No user found for lead creator: {lead.created_by} (Lead ID: {lead.id})")
-            except Exception as inner_e:
-                 print(f"[ERROR] Error processing Care Start reminder for Lead ID {lead.id}: {inner_e}")
 
+                                reminder_rows.append(_reminder_row(lead, user, subject, now))
+                                notification_rows.append(_notification_row(lead, user, description, "referral", now))
+                                created += 1
+                            elif lead.created_by:
+                                print(f"[WARN] No user found for lead creator: {lead.created_by} (Lead ID: {lead.id})")
+                            last_reminder_time = last_care_reminder_time = now
+
+                        due_updates.append({
+                            "lead_id": lead.id,
+                            "due": compute_next_reminder_due_at(lead, last_reminder_time, last_care_reminder_time, now)
+                        })
+                    except Exception as inner_e:
+                        print(f"[ERROR] Error processing Lead ID {lead.id}: {inner_e}")
+
+                # One executemany per table, committed together
+                if reminder_rows:
+                    db.execute(insert(models.EmailReminder), reminder_rows)
+                    db.execute(insert(models.Notification), notification_rows)
+                if due_updates:
+                    leads_table = models.Lead.__table__
+                    db.execute(
+                        update(leads_table)
+                        .where(leads_table.c.id == bindparam("lead_id"))
+                        # Keep updated_at: scheduling is not a user edit
+                        .values(next_reminder_due_at=bindparam("due"), updated_at=leads_table.c.updated_at),
+                        due_updates
+                    )
+                db.commit()
     except Exception as e:
+        db.rollback()
         print(f"[CRITICAL] Error in send_lead_reminders: {e}")
     finally:
         db.close()
+        elapsed = time.perf_counter() - started
+        queries = counter.count if counter else 0
+        print(f"[INFO] Reminder scan created {created} reminders using {queries} queries in {elapsed:.2f}s")
         print(f"[{datetime.now()}] Lead reminder scan complete.")
 
 
+def process_outbound_emails(batch_size: int = 50) -> dict:
+    """Deliver one batch of due queued emails; failures are retried with backoff."""
+    from app.crud import crud_outbound_emails
+    from app.utils.email_service import send_email
+
+    db = SessionLocal()
+    result = {"sent": 0, "retry": 0, "dead": 0}
+    try:
+        for email in crud_outbound_emails.claim_due_emails(db, limit=batch_size):
+            try:
+                ok = send_email(
+                    to_email=email.to_email,
+                    subject=email.subject,
+                    body=email.body,
+                    html_body=email.html_body,
+                    include_admin_bcc=email.include_admin_bcc,
+                )
+                error = None if ok else "SMTP send failed"
+            except Exception as e:
+                ok, error = False, str(e)
+
+            if ok:
+                crud_outbound_emails.mark_sent(db, email)
+                result["sent"] += 1
+            else:
+                crud_outbound_emails.mark_failed(db, email, error)
+                if email.status == "dead":
+                    print(f"[ERROR] Outbound email {email.id} to {email.to_email} dead-lettered after {email.attempts} attempts: {error}")
+                    result["dead"] += 1
+                else:
+                    result["retry"] += 1
+    except Exception as e:
+        db.rollback()
+        print(f"[ERROR] Outbound email batch failed: {e}")
+    finally:
+        db.close()
+    return result
+
+
+def _outbound_poll_seconds() -> float:
+    try:
+        return max(1.0, float(os.getenv("OUTBOUND_EMAIL_POLL_SECONDS", 5)))
+    except ValueError:
+        return 5.0
+
+
+def run_outbound_worker():
+    """Drain the outbound email queue continuously in the background."""
+    from app.crud import crud_outbound_emails
+
+    print(f"[{datetime.now()}] Outbound email worker started.")
+    db = SessionLocal()
+    try:
+        released = crud_outbound_emails.release_stale_claims(db)
+        if released:
+            print(f"[INFO] Re-queued {released} outbound emails left in 'sending' by a previous run.")
+    except Exception as e:
+        print(f"[ERROR] Could not release stale outbound email claims: {e}")
+    finally:
+        db.close()
+
+    while True:
+        try:
+            result = process_outbound_emails()
+            if any(result.values()):
+                print(f"[INFO] Outbound emails: {result['sent']} sent, {result['retry']} retrying, {result['dead']} dead-lettered")
+                continue  # More may be waiting; poll again immediately
+        except Exception as e:
+            print(f"[CRITICAL] Error in outbound email worker: {e}")
+        time.sleep(_outbound_poll_seconds())
+
+
 def run_scheduler():
     """Run the scheduler in background."""
     print(f"[{datetime.now()}] Scheduler continuous loop started.")
@@ -425,7 +429,7 @@ def run_scheduler():
 
 def start_scheduler():
     """Start the background scheduler thread"""
-    global _scheduler_thread
+    global _scheduler_thread, _outbound_thread
 
     with _scheduler_lock:
         if _scheduler_thread and _scheduler_thread.is_alive():
@@ -438,3 +442,11 @@ def start_scheduler():
             print("[SUCCESS] Notification reminder background thread spawned.")
         except Exception as e:
             print(f"[ERROR] Failed to spawn scheduler thread: {e}")
+
+        if not (_outbound_thread and _outbound_thread.is_alive()):
+            try:
+                _outbound_thread = threading.Thread(target=run_outbound_worker, daemon=True)
+                _outbound_thread.start()
+                print("[SUCCESS] Outbound email worker thread spawned.")
+            except Exception as e:
+                print(f"[ERROR] Failed to spawn outbound email worker: {e}")
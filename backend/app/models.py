@@ -10,6 +10,7 @@ from sqlalchemy import (
     Date,
     ForeignKey,
     UniqueConstraint,
+    Index,
 )
 from sqlalchemy.orm import relationship
 from .db import Base
@@ -32,6 +33,15 @@ class User(Base):
 
 class Lead(Base):
     __tablename__ = "leads"
+    __table_args__ = (
+        # Back keyset pagination on (timestamp, id) for the list pages.
+        # deleted_at leads because every listing filters on it first.
+        Index("ix_leads_deleted_created_id", "deleted_at", "created_at", "id"),
+        Index("ix_leads_deleted_updated_id", "deleted_at", "updated_at", "id"),
+        Index("ix_leads_deleted_at_id", "deleted_at", "id"),
+        # Reminder scheduler polls "due <= now"; NULL means nothing pending
+        Index("ix_leads_next_reminder_due_at", "next_reminder_due_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -136,6 +146,7 @@ class Lead(Base):
 
     # Notification Preference
     send_reminders = Column(Boolean, nullable=False, default=True)
+    next_reminder_due_at = Column(DateTime, nullable=True)  # Maintained by app.utils.reminder_schedule
     
     # Relationships
     lead_comments = relationship("LeadComment", back_populates="lead", cascade="all, delete-orphan")
@@ -146,6 +157,10 @@ class LeadComment(Base):
     Displayed in a chronological stack.
     """
     __tablename__ = "lead_comments"
+    __table_args__ = (
+        # Newest comment per lead for the list pages
+        Index("ix_lead_comments_lead_created", "lead_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     lead_id = Column(Integer, ForeignKey("leads.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -240,6 +255,11 @@ class ActivityLog(Base):
     Tracks all user actions across the application.
     """
     __tablename__ = "activity_logs"
+    __table_args__ = (
+        # Per-user log view and per-entity history, both newest first
+        Index("ix_activity_logs_username_timestamp", "username", "timestamp"),
+        Index("ix_activity_logs_entity_timestamp", "entity_type", "entity_id", "timestamp"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     timestamp = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
@@ -263,6 +283,89 @@ class ActivityLog(Base):
     # Optional metadata
     ip_address = Column(String(50), nullable=True)
 
+    field_changes = relationship("ActivityFieldChange", back_populates="log", cascade="all, delete-orphan")
+    keyword_tags = relationship("ActivityLogKeyword", back_populates="log", cascade="all, delete-orphan")
+
+
+class ActivityLogKeyword(Base):
+    """One tag of an activity log's comma-separated `keywords`, lower-cased, for exact tag filters."""
+    __tablename__ = "activity_log_keywords"
+    __table_args__ = (
+        Index("ix_activity_log_keywords_keyword_log", "keyword", "log_id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    log_id = Column(Integer, ForeignKey("activity_logs.id", ondelete="CASCADE"), nullable=False, index=True)
+    log = relationship("ActivityLog", back_populates="keyword_tags")
+    keyword = Column(String(50), nullable=False)
+
+
+class ActivityFieldChange(Base):
+    """
+    One changed field of an activity log entry, split out of the
+    old_value/new_value JSON so "when did field X change" is an index lookup.
+    old_value/new_value hold the JSON encoding of the single field value.
+    """
+    __tablename__ = "activity_field_changes"
+    __table_args__ = (
+        Index("ix_activity_field_changes_entity_field", "entity_type", "entity_id", "field"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    log_id = Column(Integer, ForeignKey("activity_logs.id", ondelete="CASCADE"), nullable=False, index=True)
+    log = relationship("ActivityLog", back_populates="field_changes")
+
+    # Copied from the log so lookups need no join
+    entity_type = Column(String(50), nullable=False)
+    entity_id = Column(Integer, nullable=True)
+    changed_at = Column(DateTime, nullable=False)
+
+    field = Column(String(100), nullable=False)
+    old_value = Column(Text, nullable=True)
+    new_value = Column(Text, nullable=True)
+
+
+class ActivityArchiveMonth(Base):
+    """
+    One month of activity logs moved out of activity_logs into a gzipped
+    JSONL file by scripts/archive_activity_logs.py (see app.utils.activity_archive).
+    """
+    __tablename__ = "activity_archive_months"
+
+    id = Column(Integer, primary_key=True, index=True)
+    month = Column(String(7), nullable=False, unique=True)  # "YYYY-MM"
+    file_name = Column(String(255), nullable=False)  # relative to the archive directory
+    row_count = Column(Integer, nullable=False, default=0)
+    first_timestamp = Column(DateTime, nullable=True)
+    last_timestamp = Column(DateTime, nullable=True)
+    archived_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class ActivityArchiveEntity(Base):
+    """Which archive months hold logs for an entity, so history lookups open only those files."""
+    __tablename__ = "activity_archive_entities"
+    __table_args__ = (
+        Index("ix_activity_archive_entities_entity", "entity_type", "entity_id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    month = Column(String(7), nullable=False, index=True)
+    entity_type = Column(String(50), nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    row_count = Column(Integer, nullable=False, default=0)
+
+
+class ActivityArchiveCount(Base):
+    """Archived log counts per month, user, action and entity type, so counts never open a file."""
+    __tablename__ = "activity_archive_counts"
+
+    id = Column(Integer, primary_key=True, index=True)
+    month = Column(String(7), nullable=False, index=True)
+    username = Column(String(100), nullable=False)
+    action_type = Column(String(50), nullable=False)
+    entity_type = Column(String(50), nullable=False)
+    row_count = Column(Integer, nullable=False, default=0)
+
 
 class EmailReminder(Base):
     """
@@ -312,6 +415,72 @@ class DailyDigestEmail(Base):
     user = relationship("User")
 
 
+class LeadStatsRollup(Base):
+    """
+    Incremental lead counters behind services_stats.
+    One row per (dimension, value, month, staff, deleted); maintained by
+    app.services.stats_rollup from the lead CRUD paths. NULL values are
+    stored as "".
+    """
+    __tablename__ = "lead_stats_rollup"
+    __table_args__ = (
+        UniqueConstraint("dimension", "value", "month", "staff", "deleted", name="uq_lead_stats_rollup_key"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    dimension = Column(String(50), nullable=False)  # e.g. "source", "status", "referral_ccu"
+    value = Column(String(255), nullable=False, default="")
+    month = Column(String(7), nullable=False)  # YYYY-MM of created_at
+    staff = Column(String(150), nullable=False, default="")
+    deleted = Column(Boolean, nullable=False, default=False)
+    count = Column(Integer, nullable=False, default=0)
+
+
+class OutboundEmail(Base):
+    """
+    Persisted outbound email queue.
+    Callers enqueue and return; the email_scheduler worker delivers with
+    retries and exponential backoff, moving exhausted messages to "dead".
+    """
+    __tablename__ = "outbound_emails"
+    __table_args__ = (
+        # Worker polls "pending and due" oldest first
+        Index("ix_outbound_emails_status_next_attempt", "status", "next_attempt_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    to_email = Column(String(255), nullable=False)
+    subject = Column(String(255), nullable=False)
+    body = Column(Text, nullable=False)
+    html_body = Column(Text, nullable=True)
+    include_admin_bcc = Column(Boolean, nullable=False, default=True)
+    # email_reminders row that tracks this delivery, if any
+    reminder_id = Column(Integer, ForeignKey("email_reminders.id"), nullable=True, index=True)
+
+    status = Column(String(20), nullable=False, default="pending")  # pending, sending, sent, dead
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=6)
+    next_attempt_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    locked_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    sent_at = Column(DateTime, nullable=True)
+
+
+class TableVersion(Base):
+    """
+    Per-table change counter.
+    CRUD writes bump the row for the table they touch in the same
+    transaction, so caches in any process can key on the version.
+    """
+    __tablename__ = "table_versions"
+
+    table_name = Column(String(64), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
 class SessionToken(Base):
     """
     Stores secure session tokens for persistent authentication.
@@ -10,7 +10,7 @@ from datetime import date, datetime, time, timezone
 from html import escape
 import json
 import os
-import time as sleep_time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from sqlalchemy import desc
@@ -18,8 +18,9 @@ from sqlalchemy.orm import Session
 
 # Ensure app.db initializes the shared SQLAlchemy Base before model imports.
 import app.db  # noqa: F401
+from app.crud.crud_activity_logs import decode_field_value, diff_fields, get_field_changes_for_logs
 from app.models import ActivityLog, DailyDigestEmail, Lead, User
-from app.utils.email_service import send_email
+from app.utils.email_service import close_mailer, send_email
 
 try:
     from zoneinfo import ZoneInfo
@@ -28,7 +29,9 @@ except ImportError:
 
 
 DIGEST_TIMEZONE = os.getenv("DAILY_DIGEST_TIMEZONE", "America/Chicago")
-DIGEST_SEND_DELAY_SECONDS = 3
+DIGEST_WORKERS = 4
+LEAD_IN_CHUNK = 500
+FieldChanges = List[Tuple[str, Any, Any]]  # (field, old, new) of one activity log
 DIGEST_ACTIONS = {
     "CREATE_LEAD",
     "UPDATE_LEAD",
@@ -108,13 +111,6 @@ def _timestamp_query_value(value: datetime) -> str:
     return value.strftime("%Y-%m-%d %H:%M:%S")
 
 
-def _digest_send_delay_seconds() -> float:
-    try:
-        return max(0.0, float(os.getenv("DAILY_DIGEST_SEND_DELAY_SECONDS", DIGEST_SEND_DELAY_SECONDS)))
-    except ValueError:
-        return float(DIGEST_SEND_DELAY_SECONDS)
-
-
 def _parse_json(value: Optional[str]) -> Dict[str, Any]:
     if not value:
         return {}
@@ -145,21 +141,31 @@ def _field_label(field: str) -> str:
     return FIELD_LABELS.get(field, field.replace("_", " ").title())
 
 
-def _safe_changes(old_value: Optional[str], new_value: Optional[str]) -> List[Dict[str, str]]:
-    old_data = _parse_json(old_value)
-    new_data = _parse_json(new_value)
-    if not new_data and old_data:
-        new_data = {}
+def _load_field_changes(db: Session, logs: Iterable[ActivityLog]) -> Dict[int, FieldChanges]:
+    """
+    (field, old, new) per log id from activity_field_changes in one query.
+    Logs written before that table existed (and not backfilled) fall back
+    to parsing their JSON.
+    """
+    logs = list(logs)
+    rows = get_field_changes_for_logs(db, [log.id for log in logs])
+    changes: Dict[int, FieldChanges] = {}
+    for log in logs:
+        if log.id in rows:
+            changes[log.id] = [
+                (row.field, decode_field_value(row.old_value), decode_field_value(row.new_value))
+                for row in rows[log.id]
+            ]
+        elif log.old_value or log.new_value:
+            changes[log.id] = diff_fields(_parse_json(log.old_value), _parse_json(log.new_value))
+    return changes
+
 
+def _safe_changes(fields: FieldChanges) -> List[Dict[str, str]]:
     changes = []
-    fields = sorted(set(old_data.keys()) | set(new_data.keys()))
-    for field in fields:
+    for field, old, new in fields:
         if field in SENSITIVE_FIELDS:
             continue
-        old = old_data.get(field)
-        new = new_data.get(field)
-        if old == new and field in old_data and field in new_data:
-            continue
         changes.append({
             "field": _field_label(field),
             "old": _format_value(old),
@@ -168,32 +174,29 @@ def _safe_changes(old_value: Optional[str], new_value: Optional[str]) -> List[Di
     return changes[:12]
 
 
-def _log_has_field(log: ActivityLog, *fields: str) -> bool:
-    old_data = _parse_json(log.old_value)
-    new_data = _parse_json(log.new_value)
-    keys = set(old_data.keys()) | set(new_data.keys())
-    return any(field in keys for field in fields)
+def _log_has_field(fields: FieldChanges, *names: str) -> bool:
+    return any(field in names for field, _, _ in fields)
 
 
-def _section_for_log(log: ActivityLog) -> str:
+def _section_for_log(log: ActivityLog, fields: FieldChanges) -> str:
     if log.action_type in {"AUTHORIZATION_MARKED", "CARE_START_MARKED"}:
         return "authorizations"
-    if _log_has_field(log, "authorization_received", "care_status", "soc_date"):
+    if _log_has_field(fields, "authorization_received", "care_status", "soc_date"):
         return "authorizations"
     if (
         log.action_type in {"REFERRAL_MARKED", "REFERRAL_UNMARKED", "AGENCY_ASSIGNED"}
-        or _log_has_field(log, "active_client", "referral_type", "agency_id", "agency_suboption_id", "ccu_id", "referral_sent_date")
+        or _log_has_field(fields, "active_client", "referral_type", "agency_id", "agency_suboption_id", "ccu_id", "referral_sent_date")
     ):
         return "referrals"
     return "leads"
 
 
-def _action_label(log: ActivityLog) -> str:
-    if _log_has_field(log, "authorization_received"):
-        new_data = _parse_json(log.new_value)
-        if new_data.get("authorization_received") is True:
+def _action_label(log: ActivityLog, fields: FieldChanges) -> str:
+    authorization = [new for field, _, new in fields if field == "authorization_received"]
+    if authorization:
+        if authorization[0] is True:
             return "Authorization Received"
-        if new_data.get("authorization_received") is False:
+        if authorization[0] is False:
             return "Authorization Removed"
     labels = {
         "CREATE_LEAD": "Lead Created",
@@ -244,13 +247,9 @@ def _local_time(timestamp: datetime) -> str:
     return timestamp.astimezone(ZoneInfo(DIGEST_TIMEZONE)).strftime("%I:%M %p")
 
 
-def _lead_context(db: Session, log: ActivityLog) -> Dict[str, str]:
-    lead = None
-    if log.entity_id:
-        lead = db.query(Lead).filter(Lead.id == log.entity_id).first()
-
-    old_data = _parse_json(log.old_value)
-    new_data = _parse_json(log.new_value)
+def _lead_context(log: ActivityLog, lead: Optional[Lead], fields: FieldChanges) -> Dict[str, str]:
+    old_data = {field: old for field, old, _ in fields}
+    new_data = {field: new for field, _, new in fields}
 
     name = log.entity_name or old_data.get("name")
     if lead:
@@ -265,27 +264,57 @@ def _lead_context(db: Session, log: ActivityLog) -> Dict[str, str]:
     }
 
 
-def _build_digest_items(db: Session, logs: Iterable[ActivityLog]) -> Dict[str, List[Dict[str, Any]]]:
+def _load_leads(db: Session, logs: Iterable[ActivityLog]) -> Dict[int, Lead]:
+    """Every lead referenced by the logs, via IN queries (chunked for parameter limits)."""
+    lead_ids = sorted({log.entity_id for log in logs if log.entity_id})
+    leads: Dict[int, Lead] = {}
+    for i in range(0, len(lead_ids), LEAD_IN_CHUNK):
+        chunk = lead_ids[i:i + LEAD_IN_CHUNK]
+        for lead in db.query(Lead).filter(Lead.id.in_(chunk)).all():
+            leads[lead.id] = lead
+    return leads
+
+
+def _digest_item(log: ActivityLog, lead: Optional[Lead], fields: FieldChanges) -> Dict[str, Any]:
+    section = _section_for_log(log, fields)
+    label = _action_label(log, fields)
+    return {
+        "section": "comments" if log.action_type in {"COMMENT_ADDED", "ADD_COMMENT"} else section,
+        "action": label,
+        "color": _action_color(section, label),
+        "time": _local_time(log.timestamp),
+        "by": log.username,
+        "description": log.description,
+        "changes": _safe_changes(fields),
+        "context": _lead_context(log, lead, fields),
+    }
+
+
+def _sections_from_items(items: Iterable[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
     sections = {"leads": [], "referrals": [], "authorizations": [], "comments": []}
-    for log in logs:
-        section = _section_for_log(log)
-        label = _action_label(log)
-        item = {
-            "action": label,
-            "color": _action_color(section, label),
-            "time": _local_time(log.timestamp),
-            "by": log.username,
-            "description": log.description,
-            "changes": _safe_changes(log.old_value, log.new_value),
-            "context": _lead_context(db, log),
-        }
-        if log.action_type in {"COMMENT_ADDED", "ADD_COMMENT"}:
-            sections["comments"].append(item)
-        else:
-            sections[section].append(item)
+    for item in items:
+        sections[item["section"]].append(item)
     return sections
 
 
+def _build_digest_items(db: Session, logs: Iterable[ActivityLog]) -> Dict[str, List[Dict[str, Any]]]:
+    logs = list(logs)
+    leads = _load_leads(db, logs)
+    changes = _load_field_changes(db, logs)
+    return _sections_from_items(
+        _digest_item(log, leads.get(log.entity_id), changes.get(log.id, [])) for log in logs
+    )
+
+
+def _day_activity(db: Session, start_utc: datetime, end_utc: datetime) -> List[ActivityLog]:
+    """All digest-relevant activity for the window, newest first."""
+    return db.query(ActivityLog).filter(
+        ActivityLog.timestamp >= _timestamp_query_value(start_utc),
+        ActivityLog.timestamp <= _timestamp_query_value(end_utc),
+        ActivityLog.action_type.in_(DIGEST_ACTIONS),
+    ).order_by(desc(ActivityLog.timestamp)).all()
+
+
 def _activity_query(db: Session, user: User, start_utc: datetime, end_utc: datetime) -> List[ActivityLog]:
     query = db.query(ActivityLog).filter(
         ActivityLog.timestamp >= _timestamp_query_value(start_utc),
@@ -470,29 +499,14 @@ def build_digest_email(user: User, digest_date: date, sections: Dict[str, List[D
     return subject, "\n".join(plain_body), html_body
 
 
-def send_digest_for_user(db: Session, user: User, digest_date: Optional[date] = None) -> str:
-    if not user.email or not user.is_approved:
-        return "skipped"
-
-    digest_date = digest_date or datetime.now(ZoneInfo(DIGEST_TIMEZONE)).date()
-    existing = _digest_record(db, user.id, digest_date)
-    if existing and existing.status == "sent":
-        return "already_sent"
-
-    start_utc, end_utc = _local_day_window(digest_date)
-    logs = _activity_query(db, user, start_utc, end_utc)
-    sections = _build_digest_items(db, logs)
-    subject, plain_body, html_body = build_digest_email(user, digest_date, sections)
-    activity_count = sum(len(items) for items in sections.values())
-
-    sent = send_email(
-        to_email=user.email,
-        subject=subject,
-        body=plain_body,
-        html_body=html_body,
-        include_admin_bcc=False,
-    )
-
+def _record_digest(
+    db: Session,
+    existing: Optional[DailyDigestEmail],
+    user: User,
+    digest_date: date,
+    activity_count: int,
+    sent: bool,
+) -> None:
     now = datetime.utcnow()
     if existing:
         existing.recipient_email = user.email
@@ -510,13 +524,58 @@ def send_digest_for_user(db: Session, user: User, digest_date: Optional[date] =
             sent_at=now,
             error_message=None if sent else "SMTP send failed",
         ))
+
+
+def _render_and_send(user: User, digest_date: date, sections: Dict[str, List[Dict[str, Any]]]) -> bool:
+    subject, plain_body, html_body = build_digest_email(user, digest_date, sections)
+    return send_email(
+        to_email=user.email,
+        subject=subject,
+        body=plain_body,
+        html_body=html_body,
+        include_admin_bcc=False,
+    )
+
+
+def send_digest_for_user(db: Session, user: User, digest_date: Optional[date] = None) -> str:
+    if not user.email or not user.is_approved:
+        return "skipped"
+
+    digest_date = digest_date or datetime.now(ZoneInfo(DIGEST_TIMEZONE)).date()
+    existing = _digest_record(db, user.id, digest_date)
+    if existing and existing.status == "sent":
+        return "already_sent"
+
+    start_utc, end_utc = _local_day_window(digest_date)
+    logs = _activity_query(db, user, start_utc, end_utc)
+    sections = _build_digest_items(db, logs)
+    activity_count = sum(len(items) for items in sections.values())
+
+    sent = _render_and_send(user, digest_date, sections)
+    _record_digest(db, existing, user, digest_date, activity_count, sent)
     db.commit()
     return "sent" if sent else "failed"
 
 
+def _digest_workers() -> int:
+    try:
+        return max(1, int(os.getenv("DAILY_DIGEST_WORKERS", DIGEST_WORKERS)))
+    except ValueError:
+        return DIGEST_WORKERS
+
+
 def send_daily_digests(db: Session, digest_date: Optional[date] = None) -> Dict[str, int]:
+    """
+    Send every approved user's digest for the day.
+
+    The day's activity is fetched once and turned into digest items once
+    (with a single bulk lead lookup), then partitioned per user in memory:
+    super_admins see everything, others their own actions. Rendering and
+    SMTP hand-off run in a thread pool over the shared, rate-limited mailer;
+    digest records are written back on this session in one commit.
+    """
+    digest_date = digest_date or datetime.now(ZoneInfo(DIGEST_TIMEZONE)).date()
     users = db.query(User).filter(User.is_approved == 1).order_by(User.id.asc()).all()
-    delay_seconds = _digest_send_delay_seconds()
     result = {
         "sent": 0,
         "failed": 0,
@@ -525,15 +584,71 @@ def send_daily_digests(db: Session, digest_date: Optional[date] = None) -> Dict[
         "no_activity": 0,
     }
 
+    existing_records = {
+        record.user_id: record
+        for record in db.query(DailyDigestEmail).filter(DailyDigestEmail.digest_date == digest_date).all()
+    }
+
+    pending = []
     for user in users:
-        try:
-            status = send_digest_for_user(db, user, digest_date=digest_date)
-            result[status] = result.get(status, 0) + 1
-            if status in ("sent", "failed") and delay_seconds > 0:
-                print(f"[INFO] Waiting {delay_seconds:g}s before next digest email...")
-                sleep_time.sleep(delay_seconds)
-        except Exception as exc:
-            print(f"[ERROR] Daily digest failed for user {getattr(user, 'username', 'unknown')}: {exc}")
-            result["failed"] += 1
+        existing = existing_records.get(user.id)
+        if not user.email:
+            result["skipped"] += 1
+        elif existing and existing.status == "sent":
+            result["already_sent"] += 1
+        else:
+            pending.append(user)
+
+    if not pending:
+        return result
+
+    start_utc, end_utc = _local_day_window(digest_date)
+    logs = _day_activity(db, start_utc, end_utc)
+    leads = _load_leads(db, logs)
+    changes = _load_field_changes(db, logs)
+    items = [_digest_item(log, leads.get(log.entity_id), changes.get(log.id, [])) for log in logs]
+
+    # Partition once: items stay newest-first within each user's list
+    by_user_id: Dict[int, List[int]] = {}
+    by_username: Dict[str, List[int]] = {}
+    for idx, log in enumerate(logs):
+        if log.user_id is not None:
+            by_user_id.setdefault(log.user_id, []).append(idx)
+        if log.username:
+            by_username.setdefault(log.username, []).append(idx)
+
+    def sections_for(user: User) -> Dict[str, List[Dict[str, Any]]]:
+        if user.role == "super_admin":
+            return _sections_from_items(items)
+        indexes = sorted(set(by_user_id.get(user.id, [])) | set(by_username.get(user.username, [])))
+        return _sections_from_items(items[idx] for idx in indexes)
+
+    user_sections = [(user, sections_for(user)) for user in pending]
+
+    try:
+        with ThreadPoolExecutor(max_workers=_digest_workers()) as pool:
+            futures = {
+                pool.submit(_render_and_send, user, digest_date, sections): (user, sections)
+                for user, sections in user_sections
+            }
+            for future in as_completed(futures):
+                user, sections = futures[future]
+                try:
+                    sent = future.result()
+                except Exception as exc:
+                    print(f"[ERROR] Daily digest failed for user {getattr(user, 'username', 'unknown')}: {exc}")
+                    sent = False
+                activity_count = sum(len(section_items) for section_items in sections.values())
+                # Record each send as it completes, so a crash later in the
+                # batch cannot make the next run send this digest again
+                try:
+                    _record_digest(db, existing_records.get(user.id), user, digest_date, activity_count, sent)
+                    db.commit()
+                except Exception as exc:
+                    db.rollback()
+                    print(f"[ERROR] Failed to record daily digest for user {getattr(user, 'username', 'unknown')}: {exc}")
+                result["sent" if sent else "failed"] += 1
+    finally:
+        close_mailer()
 
     return result
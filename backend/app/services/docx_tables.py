@@ -0,0 +1,74 @@
+"""
+Bulk Word table builder.
+
+python-docx's `table.add_row().cells` + `cell.text` + run-by-run font
+setting goes through proxy objects and xpath lookups for every cell, which
+makes reports with a few thousand rows take tens of seconds. `add_data_table`
+styles one template `<w:tr>` through the normal API, then deep-copies it for
+every data row and only swaps in the text, producing the same XML.
+"""
+
+from copy import deepcopy
+from typing import Iterable, Sequence, Tuple
+
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.shared import Pt, RGBColor
+
+WHITE = (255, 255, 255)
+
+
+def _style_header_row(table, headers: Sequence[str], fill_rgb: Tuple[int, int, int], font_size):
+    """Bold white header text on a solid `fill_rgb` background."""
+    hdr_cells = table.rows[0].cells
+    for i, h in enumerate(headers):
+        hdr_cells[i].text = h
+        for paragraph in hdr_cells[i].paragraphs:
+            for run in paragraph.runs:
+                run.font.bold = True
+                run.font.size = font_size
+                run.font.color.rgb = RGBColor(*WHITE)
+        tcPr = hdr_cells[i]._tc.get_or_add_tcPr()
+        shd = OxmlElement("w:shd")
+        shd.set(qn("w:fill"), "%02x%02x%02x" % fill_rgb)
+        tcPr.append(shd)
+
+
+def _template_row(table, font_size):
+    """Build one empty body row with a sized run per cell and detach it from the table."""
+    row = table.add_row()
+    for cell in row.cells:
+        cell.text = ""
+        cell.paragraphs[0].runs[0].font.size = font_size
+    tr = row._tr
+    tr.getparent().remove(tr)
+    return tr
+
+
+def add_data_table(
+    doc,
+    headers: Sequence[str],
+    rows: Iterable[Sequence[str]],
+    header_fill: Tuple[int, int, int],
+    style: str = "Table Grid",
+    header_size=Pt(8),
+    body_size=Pt(7),
+):
+    """
+    Append a table with a shaded header row and one row per item of `rows`.
+    Each row is a sequence of cell strings in header order; newlines become
+    line breaks as with `cell.text`.
+    """
+    table = doc.add_table(rows=1, cols=len(headers))
+    table.style = style
+    _style_header_row(table, headers, header_fill, header_size)
+
+    tbl = table._tbl
+    template = _template_row(table, body_size)
+    r_tag = qn("w:r")
+    for values in rows:
+        tr = deepcopy(template)
+        for run, value in zip(tr.iter(r_tag), values):
+            run.text = value
+        tbl.append(tr)
+    return table
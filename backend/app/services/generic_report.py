@@ -21,7 +21,7 @@ from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func, or_
 
 from app.models import Lead, CCU, Agency, MCO, LeadComment
-from app.services import report_engine
+from app.services import reference_data, report_engine
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -139,9 +139,6 @@ def get_top_entities_with_leads(db: Session, dimension: str = "ccu", limit: int
         leads = (
             db.query(Lead)
             .options(
-                joinedload(Lead.agency),
-                joinedload(Lead.ccu),
-                joinedload(Lead.mco),
                 joinedload(Lead.lead_comments),
             )
             .filter(
@@ -249,13 +246,16 @@ def _build_report_config(db: Session, top_data: List[Dict], dimension: str, limi
         for lead in entry["leads"]:
             # Payor / MCO combined label
             payor_label = ""
-            if lead.agency:
-                payor_label = lead.agency.name
-            elif lead.mco:
-                payor_label = getattr(lead.mco, "name", "")
+            agency = reference_data.get_agency(lead.agency_id)
+            mco = reference_data.get_mco(lead.mco_id)
+            if agency:
+                payor_label = agency.name
+            elif mco:
+                payor_label = mco.name or ""
 
             # CCU Name
-            ccu_name = lead.ccu.name if lead.ccu else ""
+            ccu = reference_data.get_ccu(lead.ccu_id)
+            ccu_name = ccu.name if ccu else ""
 
             # Address
             addr_parts = []
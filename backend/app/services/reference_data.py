@@ -0,0 +1,177 @@
+"""
+Reference data registry.
+
+Agencies, suboptions, CCUs, MCOs, events and users change rarely but are
+read on nearly every page, per lead write and by the scheduler. This module
+keeps one process-wide, read-only copy of them with id -> record and
+name -> id maps.
+
+Records are plain attribute snapshots of the table columns (users without
+hashed_password/profile_pic), not ORM objects, so they are safe to share
+across sessions and threads. Use the CRUD modules when you need a live ORM
+object to modify.
+
+Freshness: the CRUD create/update/delete functions bump the table's
+version (app.utils.table_versions). A write in this process is picked up
+on the next access; writes from other processes within
+VERSION_CHECK_SECONDS.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+import app.models as models
+from app.utils.table_versions import get_table_versions, local_generation
+
+# Tables covered by the registry, in the order their versions are compared
+REFERENCE_TABLES = ("agencies", "agency_suboptions", "ccus", "mcos", "events", "users")
+
+VERSION_CHECK_SECONDS = float(os.getenv("REFERENCE_DATA_CHECK_SECONDS", "2"))
+
+_USER_EXCLUDED_COLUMNS = {"hashed_password", "profile_pic"}
+
+
+def _record(obj, exclude=()) -> SimpleNamespace:
+    return SimpleNamespace(**{
+        col.key: getattr(obj, col.key)
+        for col in obj.__table__.columns
+        if col.key not in exclude
+    })
+
+
+class ReferenceData:
+    """One immutable load of every reference table."""
+
+    def __init__(self, db, versions):
+        self.versions = versions
+
+        self.agencies = [_record(a) for a in db.query(models.Agency).order_by(models.Agency.name).all()]
+        self.suboptions = [_record(s) for s in db.query(models.AgencySuboption).order_by(models.AgencySuboption.name).all()]
+        self.ccus = [_record(c) for c in db.query(models.CCU).order_by(models.CCU.name).all()]
+        self.mcos = [_record(m) for m in db.query(models.MCO).order_by(models.MCO.name).all()]
+        self.events = [_record(e) for e in db.query(models.Event).order_by(models.Event.event_name).all()]
+        self.users = [
+            _record(u, _USER_EXCLUDED_COLUMNS)
+            for u in db.query(models.User).order_by(models.User.id).all()
+        ]
+
+        self.agency_by_id = {a.id: a for a in self.agencies}
+        self.suboption_by_id = {s.id: s for s in self.suboptions}
+        self.ccu_by_id = {c.id: c for c in self.ccus}
+        self.mco_by_id = {m.id: m for m in self.mcos}
+        self.event_by_id = {e.id: e for e in self.events}
+        self.user_by_id = {u.id: u for u in self.users}
+
+        self.agency_id_by_name = {a.name: a.id for a in self.agencies}
+        self.ccu_id_by_name = {c.name: c.id for c in self.ccus}
+        self.mco_id_by_name = {m.name: m.id for m in self.mcos}
+        self.event_id_by_name = {e.event_name: e.id for e in self.events}
+        self.user_id_by_username = {u.username: u.id for u in self.users}
+
+        self.suboptions_by_agency: Dict[int, List[SimpleNamespace]] = {}
+        for s in self.suboptions:
+            self.suboptions_by_agency.setdefault(s.agency_id, []).append(s)
+
+
+_lock = threading.Lock()
+_current: Optional[ReferenceData] = None
+_checked_at = 0.0
+_checked_generation = -1
+
+
+def get_reference_data() -> ReferenceData:
+    """The current registry, loading or reloading it if a reference table changed."""
+    global _current, _checked_at, _checked_generation
+
+    now = time.monotonic()
+    generation = local_generation()
+    current = _current
+    if (
+        current is not None
+        and generation == _checked_generation
+        and now - _checked_at < VERSION_CHECK_SECONDS
+    ):
+        return current
+
+    with _lock:
+        # Own session: never cache rows from a caller's uncommitted transaction
+        from app.db import SessionLocal
+        db = SessionLocal()
+        try:
+            versions = get_table_versions(db, REFERENCE_TABLES)
+            if _current is None or _current.versions != versions:
+                _current = ReferenceData(db, versions)
+            _checked_at = now
+            _checked_generation = generation
+            return _current
+        finally:
+            db.close()
+
+
+def invalidate() -> None:
+    """Force a reload on next access (e.g. after writing reference tables outside the CRUD layer)."""
+    global _current
+    with _lock:
+        _current = None
+
+
+# ------- LOOKUPS -------
+def get_agencies() -> List[SimpleNamespace]:
+    return get_reference_data().agencies
+
+
+def get_suboptions(agency_id: Optional[int] = None) -> List[SimpleNamespace]:
+    data = get_reference_data()
+    if agency_id:
+        return data.suboptions_by_agency.get(agency_id, [])
+    return data.suboptions
+
+
+def get_ccus() -> List[SimpleNamespace]:
+    return get_reference_data().ccus
+
+
+def get_mcos() -> List[SimpleNamespace]:
+    return get_reference_data().mcos
+
+
+def get_events() -> List[SimpleNamespace]:
+    return get_reference_data().events
+
+
+def get_users() -> List[SimpleNamespace]:
+    """All users ordered by username"""
+    return sorted(get_reference_data().users, key=lambda u: u.username)
+
+
+def get_approved_users() -> List[SimpleNamespace]:
+    return [u for u in get_reference_data().users if u.is_approved]
+
+
+def get_agency(agency_id) -> Optional[SimpleNamespace]:
+    return get_reference_data().agency_by_id.get(agency_id)
+
+
+def get_suboption(suboption_id) -> Optional[SimpleNamespace]:
+    return get_reference_data().suboption_by_id.get(suboption_id)
+
+
+def get_ccu(ccu_id) -> Optional[SimpleNamespace]:
+    return get_reference_data().ccu_by_id.get(ccu_id)
+
+
+def get_mco(mco_id) -> Optional[SimpleNamespace]:
+    return get_reference_data().mco_by_id.get(mco_id)
+
+
+def get_user(user_id) -> Optional[SimpleNamespace]:
+    return get_reference_data().user_by_id.get(user_id)
+
+
+def get_user_by_username(username: str) -> Optional[SimpleNamespace]:
+    data = get_reference_data()
+    return data.user_by_id.get(data.user_id_by_username.get(username))
@@ -16,20 +16,17 @@ from typing import List, Dict, Any
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import or_
 from app.models import Lead, CCU, Agency, MCO, LeadComment
+from app.services import reference_data
 from docx import Document
-from docx.shared import Inches, Pt, RGBColor
+from docx.shared import Inches, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.section import WD_ORIENT, WD_SECTION
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
+from app.services.docx_tables import add_data_table
 
 
 def get_referrals_sent(db: Session) -> List[Lead]:
     """Get all sent referrals (active only)"""
     return db.query(Lead).options(
-        joinedload(Lead.agency),
-        joinedload(Lead.ccu),
-        joinedload(Lead.mco),
         joinedload(Lead.lead_comments)
     ).filter(
         Lead.active_client == True,
@@ -42,9 +39,6 @@ def get_referrals_sent(db: Session) -> List[Lead]:
 def get_referrals_confirmed(db: Session) -> List[Lead]:
     """Get all confirmed referrals (active only)"""
     return db.query(Lead).options(
-        joinedload(Lead.agency),
-        joinedload(Lead.ccu),
-        joinedload(Lead.mco),
         joinedload(Lead.lead_comments)
     ).filter(
         Lead.active_client == True,
@@ -68,6 +62,70 @@ def get_latest_comment(lead: Lead) -> str:
     return sorted_comments[0].content if sorted_comments else ""
 
 
+def referral_row(lead: Lead) -> List[str]:
+    """Cell text for one lead, in the grouped column order of the referral report."""
+    # Contact / SSN / Medicaid
+    contact_parts = []
+    if lead.phone: contact_parts.append(f"P: {lead.phone}")
+    if lead.email: contact_parts.append(f"E: {lead.email}")
+    if lead.ssn: contact_parts.append(f"SSN: {lead.ssn}")
+    if lead.medicaid_no: contact_parts.append(f"Medicaid: {lead.medicaid_no}")
+
+    # Address
+    addr_parts = [lead.street or ""]
+    city_state = []
+    if lead.city: city_state.append(lead.city)
+    if lead.state: city_state.append(lead.state)
+    if city_state: addr_parts.append(", ".join(city_state))
+    if lead.zip_code: addr_parts.append(lead.zip_code)
+
+    # Emergency Contact
+    e_parts = []
+    if lead.e_contact_name: e_parts.append(lead.e_contact_name)
+    if lead.e_contact_relation: e_parts.append(f"({lead.e_contact_relation})")
+    if lead.e_contact_phone: e_parts.append(lead.e_contact_phone)
+
+    # Referral Info
+    ref_parts = [f"Source: {lead.source or ''}", f"Type: {lead.referral_type or 'Regular'}", f"Staff: {lead.staff_name or ''}"]
+
+    # Status / SOC / Priority
+    stat_parts = [f"Status: {lead.last_contact_status or ''}", f"Auth: {'Yes' if lead.authorization_received else 'No'}", f"SOC: {format_date(lead.soc_date)}", f"Priority: {lead.priority or ''}"]
+
+    # Payor Details
+    pay_parts = []
+    agency = reference_data.get_agency(lead.agency_id)
+    if agency:
+        pay_parts.append(agency.name)
+        pay_parts.append(agency.phone or "")
+        pay_parts.append(agency.email or "")
+
+    # CCU Details
+    ccu_parts = []
+    ccu = reference_data.get_ccu(lead.ccu_id)
+    if ccu:
+        ccu_parts.append(f"Name: {ccu.name}")
+        ccu_parts.append(f"Coord: {ccu.care_coordinator_name or ''}")
+        ccu_parts.append(f"Phone: {ccu.phone or ''}")
+        ccu_parts.append(f"Email: {ccu.email or ''}")
+
+    # Metadata / Latest Comment
+    meta_parts = [f"Created: {format_date(lead.created_at)} by {lead.created_by or ''}", f"Comment: {get_latest_comment(lead)}"]
+
+    return [
+        str(lead.id),
+        f"{lead.first_name} {lead.last_name}",
+        "\n".join(contact_parts),
+        f"DOB: {format_date(lead.dob)}\nAge: {lead.age or ''}",
+        "\n".join(addr_parts),
+        "\n".join(e_parts),
+        "\n".join(ref_parts),
+        "\n".join(stat_parts),
+        "\n".join(pay_parts),
+        "\n".join(ccu_parts),
+        "\n".join(meta_parts),
+    ]
+
+
 def generate_referral_report_docx(db: Session) -> bytes:
     """
     Generate professional Word report in Landscape format.
@@ -119,95 +177,7 @@ def generate_referral_report_docx(db: Session) -> bytes:
             doc.add_paragraph(f"No {section_title.lower()} records found.")
             return
 
-        table = doc.add_table(rows=1, cols=len(headers))
-        table.style = 'Table Grid'
-        
-        # Format Headers
-        hdr_cells = table.rows[0].cells
-        for i, h in enumerate(headers):
-            hdr_cells[i].text = h
-            for paragraph in hdr_cells[i].paragraphs:
-                for run in paragraph.runs:
-                    run.font.bold = True
-                    run.font.size = Pt(8)
-                    run.font.color.rgb = RGBColor(255, 255, 255)
-            # Set background color for header
-            tc = hdr_cells[i]._tc
-            tcPr = tc.get_or_add_tcPr()
-            shd = OxmlElement('w:shd')
-            shd.set(qn('w:fill'), '%02x%02x%02x' % color)
-            tcPr.append(shd)
-
-        for lead in leads:
-            row_cells = table.add_row().cells
-            
-            # ID
-            row_cells[0].text = str(lead.id)
-            
-            # Client Name
-            row_cells[1].text = f"{lead.first_name} {lead.last_name}"
-            
-            # Contact / SSN / Medicaid
-            contact_parts = []
-            if lead.phone: contact_parts.append(f"P: {lead.phone}")
-            if lead.email: contact_parts.append(f"E: {lead.email}")
-            if lead.ssn: contact_parts.append(f"SSN: {lead.ssn}")
-            if lead.medicaid_no: contact_parts.append(f"Medicaid: {lead.medicaid_no}")
-            row_cells[2].text = "\n".join(contact_parts)
-            
-            # DOB / Age
-            row_cells[3].text = f"DOB: {format_date(lead.dob)}\nAge: {lead.age or ''}"
-            
-            # Address
-            addr_parts = [lead.street or ""]
-            city_state = []
-            if lead.city: city_state.append(lead.city)
-            if lead.state: city_state.append(lead.state)
-            if city_state: addr_parts.append(", ".join(city_state))
-            if lead.zip_code: addr_parts.append(lead.zip_code)
-            row_cells[4].text = "\n".join(addr_parts)
-            
-            # Emergency Contact
-            e_parts = []
-            if lead.e_contact_name: e_parts.append(lead.e_contact_name)
-            if lead.e_contact_relation: e_parts.append(f"({lead.e_contact_relation})")
-            if lead.e_contact_phone: e_parts.append(lead.e_contact_phone)
-            row_cells[5].text = "\n".join(e_parts)
-            
-            # Referral Info
-            ref_parts = [f"Source: {lead.source or ''}", f"Type: {lead.referral_type or 'Regular'}", f"Staff: {lead.staff_name or ''}"]
-            row_cells[6].text = "\n".join(ref_parts)
-            
-            # Status / SOC / Priority
-            stat_parts = [f"Status: {lead.last_contact_status or ''}", f"Auth: {'Yes' if lead.authorization_received else 'No'}", f"SOC: {format_date(lead.soc_date)}", f"Priority: {lead.priority or ''}"]
-            row_cells[7].text = "\n".join(stat_parts)
-            
-            # Payor Details
-            pay_parts = []
-            if lead.agency:
-                pay_parts.append(lead.agency.name)
-                pay_parts.append(lead.agency.phone or "")
-                pay_parts.append(lead.agency.email or "")
-            row_cells[8].text = "\n".join(pay_parts)
-            
-            # CCU Details
-            ccu_parts = []
-            if lead.ccu:
-                ccu_parts.append(f"Name: {lead.ccu.name}")
-                ccu_parts.append(f"Coord: {lead.ccu.care_coordinator_name or ''}")
-                ccu_parts.append(f"Phone: {lead.ccu.phone or ''}")
-                ccu_parts.append(f"Email: {lead.ccu.email or ''}")
-            row_cells[9].text = "\n".join(ccu_parts)
-            
-            # Metadata / Latest Comment
-            meta_parts = [f"Created: {format_date(lead.created_at)} by {lead.created_by or ''}", f"Comment: {get_latest_comment(lead)}"]
-            row_cells[10].text = "\n".join(meta_parts)
-            
-            # Format row font size
-            for cell in row_cells:
-                for paragraph in cell.paragraphs:
-                    for run in paragraph.runs:
-                        run.font.size = Pt(7)
+        add_data_table(doc, headers, (referral_row(lead) for lead in leads), color)
         
         doc.add_page_break()
 
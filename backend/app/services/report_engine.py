@@ -29,9 +29,7 @@ from typing import Any, Dict, List
 
 # ── Excel ─────────────────────────────────────────────────────────────────────
 try:
-    import openpyxl
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-    from openpyxl.utils import get_column_letter
+    import xlsxwriter
     EXCEL_AVAILABLE = True
 except ImportError:
     EXCEL_AVAILABLE = False
@@ -42,8 +40,7 @@ try:
     from docx.shared import Inches, Pt, RGBColor
     from docx.enum.text import WD_ALIGN_PARAGRAPH
     from docx.enum.section import WD_ORIENT
-    from docx.oxml.ns import qn
-    from docx.oxml import OxmlElement
+    from app.services.docx_tables import add_data_table
     WORD_AVAILABLE = True
 except ImportError:
     WORD_AVAILABLE = False
@@ -94,145 +91,150 @@ def _get_rank_colour_rgb(rank: int):
 # Excel generation
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Column width bounds for section sheets (characters)
+MIN_COLUMN_WIDTH = 12
+MAX_COLUMN_WIDTH = 45
+
+
+class _ExcelStyles:
+    """
+    Every cell style the report uses, created once per workbook.
+    Cells share these Format objects instead of carrying their own
+    Font/Fill/Alignment, so the styles part stays a handful of entries.
+    """
+
+    def __init__(self, wb):
+        self._wb = wb
+        self._rank_styles = {}
+
+        self.title = wb.add_format({"bold": True, "font_size": 16})
+        self.generated = wb.add_format({"italic": True, "font_size": 11})
+        self.cover_header = wb.add_format({"bold": True, "font_color": HEADER_TEXT_HEX, "bg_color": "1A6B8A", "align": "center"})
+        self.cover_alt_row = wb.add_format({"bg_color": "EAF4F6"})
+        self.summary_value = wb.add_format({"bold": True, "font_size": 10, "bg_color": SUMMARY_BG_HEX, "align": "left", "text_wrap": True})
+        self.detail_header = wb.add_format({"bold": True, "font_size": 9, "font_color": HEADER_TEXT_HEX, "bg_color": "00506B", "align": "center", "text_wrap": True})
+        self.detail_rows = (
+            wb.add_format({"font_size": 9, "bg_color": "F0F9FA", "text_wrap": True, "valign": "top"}),
+            wb.add_format({"font_size": 9, "bg_color": "FFFFFF", "text_wrap": True, "valign": "top"}),
+        )
+
+    def rank(self, rank: int):
+        """(heading, summary header) formats in the rank's colour."""
+        colour_hex = _get_rank_colour_hex(rank)
+        if colour_hex not in self._rank_styles:
+            self._rank_styles[colour_hex] = (
+                self._wb.add_format({"bold": True, "font_size": 13, "font_color": HEADER_TEXT_HEX, "bg_color": colour_hex, "align": "left", "valign": "vcenter"}),
+                self._wb.add_format({"bold": True, "font_color": HEADER_TEXT_HEX, "bg_color": colour_hex, "align": "center", "text_wrap": True}),
+            )
+        return self._rank_styles[colour_hex]
+
+
 def generate_excel(report_config: Dict[str, Any]) -> bytes:
     """
     Generate an Excel workbook from report_config.
     Returns raw bytes suitable for HTTP download or st.download_button.
+    Rows are streamed (xlsxwriter constant_memory) and column widths are
+    measured as they are written, so large sections stay cheap.
     """
     if not EXCEL_AVAILABLE:
-        raise RuntimeError("openpyxl is not installed. Run: pip install openpyxl")
+        raise RuntimeError("XlsxWriter is not installed. Run: pip install xlsxwriter")
 
-    wb = openpyxl.Workbook()
-    # Remove default empty sheet
-    wb.remove(wb.active)
+    buf = io.BytesIO()
+    # Report text is data: never turn it into formulas or hyperlinks
+    wb = xlsxwriter.Workbook(buf, {"constant_memory": True, "strings_to_formulas": False, "strings_to_urls": False})
+    styles = _ExcelStyles(wb)
+    sections = report_config.get("sections", [])
+    used_names = {"summary"}
 
     # ── Cover sheet ──────────────────────────────────────────────────────────
-    cover = wb.create_sheet("Summary", 0)
-    cover["A1"] = report_config.get("title", "Report")
-    cover["A1"].font = Font(bold=True, size=16)
-    cover["A2"] = f"Generated: {report_config.get('generated_at', datetime.now().strftime('%Y-%m-%d %H:%M:%S'))}"
-    cover["A2"].font = Font(size=11, italic=True)
-
-    cover["A4"] = "Rank"
-    cover["B4"] = "Heading"
-    cover["C4"] = "Records"
-    for col in ["A4", "B4", "C4"]:
-        cover[col].font = Font(bold=True, color=HEADER_TEXT_HEX)
-        cover[col].fill = PatternFill("solid", fgColor="1A6B8A")
-        cover[col].alignment = Alignment(horizontal="center")
-
-    for i, section in enumerate(report_config.get("sections", []), start=1):
-        row = 4 + i
-        cover.cell(row=row, column=1, value=i)
-        cover.cell(row=row, column=2, value=section.get("heading", ""))
-        cover.cell(row=row, column=3, value=len(section.get("detail_rows", [])))
+    cover = wb.add_worksheet("Summary")
+    cover.write(0, 0, report_config.get("title", "Report"), styles.title)
+    cover.write(1, 0, f"Generated: {report_config.get('generated_at', datetime.now().strftime('%Y-%m-%d %H:%M:%S'))}", styles.generated)
+    cover.write_row(3, 0, ["Rank", "Heading", "Records"], styles.cover_header)
+
+    for i, section in enumerate(sections, start=1):
         # Alternating row fill
-        if i % 2 == 0:
-            for c in range(1, 4):
-                cover.cell(row=row, column=c).fill = PatternFill("solid", fgColor="EAF4F6")
+        row_style = styles.cover_alt_row if i % 2 == 0 else None
+        cover.write_row(3 + i, 0, [i, section.get("heading", ""), len(section.get("detail_rows", []))], row_style)
 
-    cover.column_dimensions["A"].width = 8
-    cover.column_dimensions["B"].width = 48
-    cover.column_dimensions["C"].width = 12
+    cover.set_column(0, 0, 8)
+    cover.set_column(1, 1, 48)
+    cover.set_column(2, 2, 12)
 
     # ── One sheet per section ─────────────────────────────────────────────────
-    for rank, section in enumerate(report_config.get("sections", []), start=1):
-        sheet_name = _safe_sheet_name(section.get("sheet_name", f"#{rank}"), rank)
-        ws = wb.create_sheet(sheet_name)
+    for rank, section in enumerate(sections, start=1):
+        sheet_name = _unique_sheet_name(_safe_sheet_name(section.get("sheet_name", f"#{rank}"), rank), used_names)
+        ws = wb.add_worksheet(sheet_name)
+        _write_section_sheet(ws, styles, rank, section, sheet_name)
 
-        colour_hex = _get_rank_colour_hex(rank)
+    wb.close()
+    return buf.getvalue()
 
-        # Section heading row
-        heading_text = section.get("heading", sheet_name)
-        ws["A1"] = heading_text
-        ws["A1"].font = Font(bold=True, size=13, color=HEADER_TEXT_HEX)
-        ws["A1"].fill = PatternFill("solid", fgColor=colour_hex)
-        ws["A1"].alignment = Alignment(horizontal="left", vertical="center")
-
-        # Merge heading across all columns (we'll know how wide after writing detail)
-        detail_columns = section.get("detail_columns", [])
-        summary_row = section.get("summary_row", {})
-        detail_rows = section.get("detail_rows", [])
-
-        # All columns = summary keys + detail columns (union, ordered)
-        all_summary_keys = list(summary_row.keys())
-
-        # ── Summary row (row 3) ───────────────────────────────────────────────
-        ws.append([])  # row 2 blank
-        ws.append(all_summary_keys)  # header row for summary (row 3)
-        for col_idx, key in enumerate(all_summary_keys, start=1):
-            cell = ws.cell(row=3, column=col_idx)
-            cell.font = Font(bold=True, color=HEADER_TEXT_HEX)
-            cell.fill = PatternFill("solid", fgColor=colour_hex)
-            cell.alignment = Alignment(horizontal="center", wrap_text=True)
-
-        ws.append([summary_row.get(k, "") for k in all_summary_keys])  # row 4
-        for col_idx in range(1, len(all_summary_keys) + 1):
-            cell = ws.cell(row=4, column=col_idx)
-            cell.fill = PatternFill("solid", fgColor=SUMMARY_BG_HEX)
-            cell.font = Font(bold=True, size=10)
-            cell.alignment = Alignment(horizontal="left", wrap_text=True)
-
-        ws.append([])  # row 5 blank
-
-        # ── Detail rows ───────────────────────────────────────────────────────
-        if detail_columns:
-            ws.append(detail_columns)  # row 6 — column headers
-            header_row_idx = ws.max_row
-            for col_idx, col_name in enumerate(detail_columns, start=1):
-                cell = ws.cell(row=header_row_idx, column=col_idx)
-                cell.font = Font(bold=True, color=HEADER_TEXT_HEX, size=9)
-                cell.fill = PatternFill("solid", fgColor="00506B")
-                cell.alignment = Alignment(horizontal="center", wrap_text=True)
-
-            for row_num, row_data in enumerate(detail_rows):
-                row_values = [str(row_data.get(col, "") or "") for col in detail_columns]
-                ws.append(row_values)
-                data_row_idx = ws.max_row
-                row_fill = "F0F9FA" if row_num % 2 == 0 else "FFFFFF"
-                for col_idx in range(1, len(detail_columns) + 1):
-                    cell = ws.cell(row=data_row_idx, column=col_idx)
-                    cell.fill = PatternFill("solid", fgColor=row_fill)
-                    cell.font = Font(size=9)
-                    cell.alignment = Alignment(wrap_text=True, vertical="top")
-
-        # Merge heading row A1 across all used columns
-        max_col = max(len(all_summary_keys), len(detail_columns), 1)
-        if max_col > 1:
-            ws.merge_cells(start_row=1, start_column=1, end_row=1, end_column=max_col)
-
-        # Auto-width columns
-        for col_idx in range(1, max_col + 1):
-            col_letter = get_column_letter(col_idx)
-            max_len = 12
-            for row in ws.iter_rows(min_col=col_idx, max_col=col_idx):
-                for cell in row:
-                    try:
-                        val_len = len(str(cell.value or ""))
-                        if val_len > max_len:
-                            max_len = val_len
-                    except Exception:
-                        pass
-            ws.column_dimensions[col_letter].width = min(max_len + 2, 45)
-
-        ws.row_dimensions[1].height = 22
-        ws.freeze_panes = "A7"
 
-    buf = io.BytesIO()
-    wb.save(buf)
-    buf.seek(0)
-    return buf.getvalue()
+def _write_section_sheet(ws, styles, rank: int, section: Dict[str, Any], sheet_name: str) -> None:
+    """Heading, summary block and detail table for one section, written top to bottom."""
+    heading_style, summary_header_style = styles.rank(rank)
+    heading_text = section.get("heading", sheet_name)
+    detail_columns = section.get("detail_columns", [])
+    summary_row = section.get("summary_row", {})
+    detail_rows = section.get("detail_rows", [])
+    all_summary_keys = list(summary_row.keys())
+
+    max_col = max(len(all_summary_keys), len(detail_columns), 1)
+    widths = [MIN_COLUMN_WIDTH] * max_col
+
+    def measure(values):
+        for col_idx, value in enumerate(values):
+            widths[col_idx] = max(widths[col_idx], len(str(value if value is not None else "")))
+
+    # Section heading row, merged across all used columns
+    ws.set_row(0, 22)
+    if max_col > 1:
+        ws.merge_range(0, 0, 0, max_col - 1, heading_text, heading_style)
+    else:
+        ws.write(0, 0, heading_text, heading_style)
+        measure([heading_text])
+
+    # ── Summary block (rows 3-4) ──────────────────────────────────────────────
+    summary_values = [summary_row.get(k, "") for k in all_summary_keys]
+    ws.write_row(2, 0, all_summary_keys, summary_header_style)
+    ws.write_row(3, 0, summary_values, styles.summary_value)
+    measure(all_summary_keys)
+    measure(summary_values)
+
+    # ── Detail rows (header on row 6) ─────────────────────────────────────────
+    if detail_columns:
+        ws.write_row(5, 0, detail_columns, styles.detail_header)
+        measure(detail_columns)
+        for row_num, row_data in enumerate(detail_rows):
+            row_values = [str(row_data.get(col, "") or "") for col in detail_columns]
+            ws.write_row(6 + row_num, 0, row_values, styles.detail_rows[row_num % 2])
+            measure(row_values)
+
+    for col_idx, width in enumerate(widths):
+        ws.set_column(col_idx, col_idx, min(width + 2, MAX_COLUMN_WIDTH))
+    ws.freeze_panes(6, 0)
 
 
 def _safe_sheet_name(name: str, rank: int) -> str:
     """Excel sheet names must be ≤31 chars and have no special chars."""
     safe = name.replace("/", "-").replace("\\", "-").replace("*", "").replace("?", "").replace("[", "").replace("]", "").replace(":", "")
-    truncated = safe[:28]
+    truncated = safe[:28].strip("'")
     if not truncated.strip():
         truncated = f"Section {rank}"
     return truncated
 
 
+def _unique_sheet_name(name: str, used: set) -> str:
+    """Append a counter to repeated sheet names (Excel compares them case-insensitively)."""
+    candidate, n = name, 1
+    while candidate.lower() in used:
+        candidate = f"{name}{n}"
+        n += 1
+    used.add(candidate.lower())
+    return candidate
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Word generation
 # ─────────────────────────────────────────────────────────────────────────────
@@ -291,30 +293,12 @@ def generate_word(report_config: Dict[str, Any]) -> bytes:
 
         # Detail table
         if detail_columns:
-            table = doc.add_table(rows=1, cols=len(detail_columns))
-            table.style = "Table Grid"
-
-            hdr_cells = table.rows[0].cells
-            for i, col_name in enumerate(detail_columns):
-                hdr_cells[i].text = col_name
-                for para in hdr_cells[i].paragraphs:
-                    for run in para.runs:
-                        run.font.bold = True
-                        run.font.size = Pt(8)
-                        run.font.color.rgb = RGBColor(255, 255, 255)
-                tc = hdr_cells[i]._tc
-                tcPr = tc.get_or_add_tcPr()
-                shd = OxmlElement("w:shd")
-                shd.set(qn("w:fill"), "%02x%02x%02x" % colour_rgb)
-                tcPr.append(shd)
-
-            for row_data in detail_rows:
-                row_cells = table.add_row().cells
-                for i, col_name in enumerate(detail_columns):
-                    row_cells[i].text = str(row_data.get(col_name, "") or "")
-                    for para in row_cells[i].paragraphs:
-                        for run in para.runs:
-                            run.font.size = Pt(7)
+            add_data_table(
+                doc,
+                detail_columns,
+                ([str(row_data.get(col_name, "") or "") for col_name in detail_columns] for row_data in detail_rows),
+                colour_rgb,
+            )
 
         doc.add_page_break()
 
@@ -0,0 +1,216 @@
+"""
+Lead statistics rollup.
+
+Keeps lead_stats_rollup in step with the leads table so services_stats can
+read pre-aggregated counters instead of scanning leads. Every lead maps to a
+set of rollup keys (dimension, value, month, staff, deleted); CRUD paths
+snapshot the keys before a change and apply the difference afterwards,
+inside the same transaction as the lead write.
+"""
+from __future__ import annotations
+
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+import app.models as models
+
+RollupKey = Tuple[str, str, str, str, bool]
+
+# Dimension names
+ALL = "all"
+REFERRAL = "referral"
+SOURCE = "source"
+STATUS = "status"
+PRIORITY = "priority"
+EVENT = "event"
+WORD_OF_MOUTH = "word_of_mouth"
+REFERRAL_STATUS = "referral_status"
+REFERRAL_AUTH = "referral_auth"
+REFERRAL_CARE = "referral_care"
+REFERRAL_CCU = "referral_ccu"
+REFERRAL_CCU_CARE_START = "referral_ccu_care_start"
+
+# Lead columns that feed any dimension
+ROLLUP_FIELDS = {
+    "created_at",
+    "staff_name",
+    "deleted_at",
+    "source",
+    "last_contact_status",
+    "priority",
+    "event_name",
+    "word_of_mouth_type",
+    "active_client",
+    "authorization_received",
+    "care_status",
+    "ccu_id",
+}
+
+
+def _text(value) -> str:
+    return "" if value is None else str(value)
+
+
+def rollup_keys(lead) -> List[RollupKey]:
+    """Rollup keys a lead currently contributes one count to."""
+    month = lead.created_at.strftime("%Y-%m")
+    staff = _text(lead.staff_name)
+    deleted = lead.deleted_at is not None
+
+    values = [
+        (ALL, ""),
+        (SOURCE, _text(lead.source)),
+        (STATUS, _text(lead.last_contact_status)),
+        (PRIORITY, _text(lead.priority)),
+    ]
+    if lead.source == "Event" and lead.event_name is not None:
+        values.append((EVENT, lead.event_name))
+    if lead.source == "Word of Mouth" and lead.word_of_mouth_type is not None:
+        values.append((WORD_OF_MOUTH, lead.word_of_mouth_type))
+    if lead.active_client:
+        values.append((REFERRAL, ""))
+        values.append((REFERRAL_STATUS, _text(lead.last_contact_status)))
+        values.append((REFERRAL_AUTH, "1" if lead.authorization_received else "0"))
+        if lead.care_status is not None:
+            values.append((REFERRAL_CARE, lead.care_status))
+        if lead.ccu_id is not None:
+            values.append((REFERRAL_CCU, str(lead.ccu_id)))
+            if lead.care_status == "Care Start":
+                values.append((REFERRAL_CCU_CARE_START, str(lead.ccu_id)))
+
+    return [(dimension, value, month, staff, deleted) for dimension, value in values]
+
+
+def _upsert_counts(db: Session, deltas: Dict[RollupKey, int]) -> None:
+    table = models.LeadStatsRollup.__table__
+    dialect = db.get_bind().dialect.name
+
+    for (dimension, value, month, staff, deleted), delta in deltas.items():
+        if not delta:
+            continue
+        row = {
+            "dimension": dimension,
+            "value": value,
+            "month": month,
+            "staff": staff,
+            "deleted": deleted,
+            "count": delta,
+        }
+        if dialect in ("sqlite", "postgresql"):
+            if dialect == "sqlite":
+                from sqlalchemy.dialects.sqlite import insert as dialect_insert
+            else:
+                from sqlalchemy.dialects.postgresql import insert as dialect_insert
+            stmt = dialect_insert(table).values(**row)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["dimension", "value", "month", "staff", "deleted"],
+                set_={"count": table.c.count + stmt.excluded.count},
+            )
+            db.execute(stmt)
+        else:
+            updated = db.execute(
+                table.update()
+                .where(
+                    table.c.dimension == dimension,
+                    table.c.value == value,
+                    table.c.month == month,
+                    table.c.staff == staff,
+                    table.c.deleted == deleted,
+                )
+                .values(count=table.c.count + delta)
+            )
+            if not updated.rowcount:
+                db.execute(table.insert().values(**row))
+
+
+def apply_rollup_change(db: Session, before: Iterable[RollupKey], after: Iterable[RollupKey]) -> None:
+    """
+    Move one lead's counts from its old keys to its new keys.
+    Pass before=[] for a new lead and after=[] for a permanently deleted one.
+    The caller commits.
+    """
+    deltas = Counter()
+    for key in before:
+        deltas[key] -= 1
+    for key in after:
+        deltas[key] += 1
+    _upsert_counts(db, deltas)
+
+
+def rename_rollup_staff(db: Session, old_staff: str, new_staff: str) -> None:
+    """Move counters to a renamed staff member, merging into any existing rows. The caller commits."""
+    r = models.LeadStatsRollup
+    rows = db.query(r.dimension, r.value, r.month, r.deleted, r.count).filter(r.staff == old_staff).all()
+    if not rows:
+        return
+    deltas = Counter()
+    for dimension, value, month, deleted, count in rows:
+        deltas[(dimension, value, month, new_staff, deleted)] += count
+    db.query(r).filter(r.staff == old_staff).delete(synchronize_session=False)
+    _upsert_counts(db, deltas)
+
+
+def rebuild_stats_rollup(db: Session) -> int:
+    """Recompute every counter from the leads table. Returns the number of leads counted."""
+    counts = Counter()
+    leads = db.query(models.Lead).yield_per(1000)
+    total = 0
+    for lead in leads:
+        counts.update(rollup_keys(lead))
+        total += 1
+
+    db.query(models.LeadStatsRollup).delete(synchronize_session=False)
+    if counts:
+        db.execute(
+            models.LeadStatsRollup.__table__.insert(),
+            [
+                {"dimension": d, "value": v, "month": m, "staff": s, "deleted": dl, "count": c}
+                for (d, v, m, s, dl), c in counts.items()
+            ],
+        )
+    from app.utils.table_versions import bump_table_version
+    bump_table_version(db, "leads")
+    db.commit()
+    return total
+
+
+def ensure_stats_rollup(db: Session) -> None:
+    """Build the rollup on first start against an existing database."""
+    has_rollup = db.query(models.LeadStatsRollup.id).first() is not None
+    if not has_rollup and db.query(models.Lead.id).first() is not None:
+        rebuild_stats_rollup(db)
+
+
+def rollup_counts(
+    db: Session,
+    dimension: str,
+    group_by: str = "value",
+    staff: Optional[str] = None,
+    include_deleted: bool = False,
+) -> List[Tuple[Optional[str], int]]:
+    """
+    Summed counters for one dimension, grouped by "value", "month" or "staff".
+    Groups with a zero total are dropped; "" comes back as None.
+    """
+    r = models.LeadStatsRollup
+    column = getattr(r, group_by)
+    query = db.query(column, func.sum(r.count)).filter(r.dimension == dimension)
+    if staff is not None:
+        query = query.filter(r.staff == staff)
+    if not include_deleted:
+        query = query.filter(r.deleted == False)
+    rows = query.group_by(column).having(func.sum(r.count) > 0).order_by(column).all()
+    return [(key if key != "" else None, int(total)) for key, total in rows]
+
+
+def rollup_total(db: Session, dimension: str, staff: Optional[str] = None, include_deleted: bool = False) -> int:
+    r = models.LeadStatsRollup
+    query = db.query(func.coalesce(func.sum(r.count), 0)).filter(r.dimension == dimension)
+    if staff is not None:
+        query = query.filter(r.staff == staff)
+    if not include_deleted:
+        query = query.filter(r.deleted == False)
+    return int(query.scalar() or 0)
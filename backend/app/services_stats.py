@@ -1,16 +1,20 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from . import models
+from .services import stats_rollup as rollup
+from .utils.date_buckets import date_bucket
+
+# Counts are read from lead_stats_rollup (see app.services.stats_rollup),
+# which the lead CRUD paths keep current.
 
 
 # ------------------------------
 # BASIC COUNTS
 # ------------------------------
 def get_basic_counts(db: Session) -> Dict[str, int]:
-    total_leads = db.query(models.Lead).filter(models.Lead.deleted_at == None).count()
+    total_leads = rollup.rollup_total(db, rollup.ALL)
     total_users = db.query(models.User).count()
 
     return {
@@ -23,12 +27,7 @@ def get_basic_counts(db: Session) -> Dict[str, int]:
 # LEADS BY STAFF
 # ------------------------------
 def leads_by_staff(db: Session) -> List[dict]:
-    rows = (
-        db.query(models.Lead.staff_name, func.count(models.Lead.id))
-        .filter(models.Lead.deleted_at == None)
-        .group_by(models.Lead.staff_name)
-        .all()
-    )
+    rows = rollup.rollup_counts(db, rollup.ALL, group_by="staff")
 
     return [{"staff_name": r[0], "count": r[1]} for r in rows]
 
@@ -37,12 +36,7 @@ def leads_by_staff(db: Session) -> List[dict]:
 # LEADS BY SOURCE
 # ------------------------------
 def leads_by_source(db: Session) -> List[dict]:
-    rows = (
-        db.query(models.Lead.source, func.count(models.Lead.id))
-        .filter(models.Lead.deleted_at == None)
-        .group_by(models.Lead.source)
-        .all()
-    )
+    rows = rollup.rollup_counts(db, rollup.SOURCE)
 
     return [{"source": r[0], "count": r[1]} for r in rows]
 
@@ -51,12 +45,7 @@ def leads_by_source(db: Session) -> List[dict]:
 # LEADS BY STATUS
 # ------------------------------
 def leads_by_status(db: Session) -> List[dict]:
-    rows = (
-        db.query(models.Lead.last_contact_status, func.count(models.Lead.id))
-        .filter(models.Lead.deleted_at == None)
-        .group_by(models.Lead.last_contact_status)
-        .all()
-    )
+    rows = rollup.rollup_counts(db, rollup.STATUS)
 
     return [{"status": r[0], "count": r[1]} for r in rows]
 
@@ -64,70 +53,54 @@ def leads_by_status(db: Session) -> List[dict]:
 # ------------------------------
 # MONTHLY LEADS
 # ------------------------------
-def monthly_leads(db: Session):
+def leads_by_period(
+    db: Session,
+    granularity: str = "month",
+    staff_name: Optional[str] = None,
+    referrals_only: bool = False,
+    include_deleted: bool = False,
+) -> List[dict]:
     """
-    Return count of leads created per month.
-    Simple approach: year-month as string.
+    Lead counts per month/week/day of created_at, grouped in SQL.
+    Rows look like {<granularity>: label, "count": n}, oldest first.
     """
-    leads = db.query(models.Lead).filter(models.Lead.deleted_at == None).all()
-    if not leads:
-        return []
-
-    from collections import defaultdict
-
-    month_counts = defaultdict(int)
-    for lead in leads:
-        month_str = lead.created_at.strftime("%Y-%m")
-        month_counts[month_str] += 1
-
-    # Convert to list of dicts
-    result = []
-    for month_str in sorted(month_counts.keys()):
-        result.append({"month": month_str, "count": month_counts[month_str]})
-
-    return result
+    bucket = date_bucket(models.Lead.created_at, granularity, db.get_bind().dialect.name).label("bucket")
+    query = db.query(bucket, func.count(models.Lead.id))
+    if not include_deleted:
+        query = query.filter(models.Lead.deleted_at == None)
+    if staff_name is not None:
+        query = query.filter(models.Lead.staff_name == staff_name)
+    if referrals_only:
+        query = query.filter(models.Lead.active_client == True)
+    rows = query.group_by(bucket).order_by(bucket).all()
+    return [{granularity: r[0], "count": r[1]} for r in rows]
+
+
+def monthly_leads(db: Session, granularity: str = "month"):
+    """
+    Return count of leads created per month (or per week/day).
+    Months come straight from the rollup; finer buckets are grouped in SQL.
+    """
+    if granularity != "month":
+        return leads_by_period(db, granularity)
+    rows = rollup.rollup_counts(db, rollup.ALL, group_by="month")
+    return [{"month": month, "count": count} for month, count in rows]
 
 
 def leads_by_event(db: Session):
     """
     Return count of leads grouped by event name (for source='Event').
     """
-    from sqlalchemy import func
-
-    results = (
-        db.query(models.Lead.event_name, func.count(models.Lead.id).label("count"))
-        .filter(models.Lead.deleted_at == None)
-        .filter(models.Lead.source == "Event")
-        .filter(models.Lead.event_name.isnot(None))
-        .group_by(models.Lead.event_name)
-        .all()
-    )
-
-    if not results:
-        return []
-
-    return [{"event_name": r[0], "count": r[1]} for r in results]
+    rows = rollup.rollup_counts(db, rollup.EVENT)
+    return [{"event_name": r[0], "count": r[1]} for r in rows]
 
 
 def word_of_mouth_breakdown(db: Session):
     """
     Return count of leads grouped by word_of_mouth_type (for source='Word of Mouth').
     """
-    from sqlalchemy import func
-
-    results = (
-        db.query(models.Lead.word_of_mouth_type, func.count(models.Lead.id).label("count"))
-        .filter(models.Lead.deleted_at == None)
-        .filter(models.Lead.source == "Word of Mouth")
-        .filter(models.Lead.word_of_mouth_type.isnot(None))
-        .group_by(models.Lead.word_of_mouth_type)
-        .all()
-    )
-
-    if not results:
-        return []
-
-    return [{"type": r[0], "count": r[1]} for r in results]
+    rows = rollup.rollup_counts(db, rollup.WORD_OF_MOUTH)
+    return [{"type": r[0], "count": r[1]} for r in rows]
 
 
 # ------------------------------
@@ -135,16 +108,8 @@ def word_of_mouth_breakdown(db: Session):
 # ------------------------------
 def get_user_stats(db: Session, username: str):
     """Get stats for a specific user's leads"""
-    total_leads = db.query(models.Lead).filter(
-        models.Lead.deleted_at == None,
-        models.Lead.staff_name == username
-    ).count()
-    
-    active_clients = db.query(models.Lead).filter(
-        models.Lead.deleted_at == None,
-        models.Lead.staff_name == username,
-        models.Lead.active_client == True
-    ).count()
+    total_leads = rollup.rollup_total(db, rollup.ALL, staff=username)
+    active_clients = rollup.rollup_total(db, rollup.REFERRAL, staff=username)
     
     return {
         "total_leads": total_leads,
@@ -152,146 +117,54 @@ def get_user_stats(db: Session, username: str):
     }
 
 
-def leads_by_month_for_user(db: Session, username: str):
+def leads_by_month_for_user(db: Session, username: str, granularity: str = "month"):
     """Monthly leads for a specific user"""
-    leads = db.query(models.Lead).filter(
-        models.Lead.deleted_at == None,
-        models.Lead.staff_name == username
-    ).all()
-    
-    if not leads:
-        return []
-
-    from collections import defaultdict
-
-    month_counts = defaultdict(int)
-    for lead in leads:
-        month_str = lead.created_at.strftime("%Y-%m")
-        month_counts[month_str] += 1
-
-    result = []
-    for month_str in sorted(month_counts.keys()):
-        result.append({"month": month_str, "count": month_counts[month_str]})
-
-    return result
+    if granularity != "month":
+        return leads_by_period(db, granularity, staff_name=username)
+    rows = rollup.rollup_counts(db, rollup.ALL, group_by="month", staff=username)
+    return [{"month": month, "count": count} for month, count in rows]
 
 
 def leads_by_source_for_user(db: Session, username: str):
     """Leads by source for a specific user"""
-    from sqlalchemy import func
-
-    results = (
-        db.query(models.Lead.source, func.count(models.Lead.id).label("count"))
-        .filter(models.Lead.deleted_at == None)
-        .filter(models.Lead.staff_name == username)
-        .group_by(models.Lead.source)
-        .all()
-    )
-
-    if not results:
-        return []
-
-    return [{"source": r[0], "count": r[1]} for r in results]
+    rows = rollup.rollup_counts(db, rollup.SOURCE, staff=username)
+    return [{"source": r[0], "count": r[1]} for r in rows]
 
 
 # ------------------------------
 # REFERRAL-SPECIFIC STATS FOR USERS
 # ------------------------------
 
-def referrals_by_month_for_user(db: Session, username: str):
+def referrals_by_month_for_user(db: Session, username: str, granularity: str = "month"):
     """Monthly referrals for a specific user"""
-    referrals = db.query(models.Lead).filter(
-        models.Lead.staff_name == username,
-        models.Lead.active_client == True
-    ).all()
-
-    if not referrals:
-        return []
-
-    from collections import defaultdict
-
-    month_counts = defaultdict(int)
-    for referral in referrals:
-        month_str = referral.created_at.strftime("%Y-%m")
-        month_counts[month_str] += 1
-
-    result = []
-    for month_str in sorted(month_counts.keys()):
-        result.append({"month": month_str, "count": month_counts[month_str]})
-
-    return result
+    if granularity != "month":
+        return leads_by_period(db, granularity, staff_name=username, referrals_only=True, include_deleted=True)
+    rows = rollup.rollup_counts(db, rollup.REFERRAL, group_by="month", staff=username, include_deleted=True)
+    return [{"month": month, "count": count} for month, count in rows]
 
 
 def referrals_by_status_for_user(db: Session, username: str):
     """Referrals by contact status for a specific user"""
-    from sqlalchemy import func
-
-    results = (
-        db.query(models.Lead.last_contact_status, func.count(models.Lead.id).label("count"))
-        .filter(models.Lead.staff_name == username)
-        .filter(models.Lead.active_client == True)
-        .group_by(models.Lead.last_contact_status)
-        .all()
-    )
-
-    if not results:
-        return []
-
-    return [{"status": r[0], "count": r[1]} for r in results]
+    rows = rollup.rollup_counts(db, rollup.REFERRAL_STATUS, staff=username, include_deleted=True)
+    return [{"status": r[0], "count": r[1]} for r in rows]
 
 
 def referrals_by_authorization_for_user(db: Session, username: str):
     """Referrals by authorization status for a specific user"""
-    from sqlalchemy import func
-
-    results = (
-        db.query(models.Lead.authorization_received, func.count(models.Lead.id).label("count"))
-        .filter(models.Lead.staff_name == username)
-        .filter(models.Lead.active_client == True)
-        .group_by(models.Lead.authorization_received)
-        .all()
-    )
-
-    if not results:
-        return []
-
-    return [{"authorized": "Yes" if r[0] else "No", "count": r[1]} for r in results]
+    rows = rollup.rollup_counts(db, rollup.REFERRAL_AUTH, staff=username, include_deleted=True)
+    return [{"authorized": "Yes" if r[0] == "1" else "No", "count": r[1]} for r in rows]
 
 
 def referrals_by_care_status_for_user(db: Session, username: str):
     """Referrals by care status for a specific user"""
-    from sqlalchemy import func
-
-    results = (
-        db.query(models.Lead.care_status, func.count(models.Lead.id).label("count"))
-        .filter(models.Lead.staff_name == username)
-        .filter(models.Lead.active_client == True)
-        .filter(models.Lead.care_status.isnot(None))
-        .group_by(models.Lead.care_status)
-        .all()
-    )
-
-    if not results:
-        return []
-
-    return [{"care_status": r[0], "count": r[1]} for r in results]
+    rows = rollup.rollup_counts(db, rollup.REFERRAL_CARE, staff=username, include_deleted=True)
+    return [{"care_status": r[0], "count": r[1]} for r in rows]
 
 
 def referral_status_breakdown(db: Session):
     """All referrals by contact status (for cumulative view)"""
-    from sqlalchemy import func
-
-    results = (
-        db.query(models.Lead.last_contact_status, func.count(models.Lead.id).label("count"))
-        .filter(models.Lead.active_client == True)
-        .group_by(models.Lead.last_contact_status)
-        .all()
-    )
-
-    if not results:
-        return []
-
-    return [{"status": r[0], "count": r[1]} for r in results]
+    rows = rollup.rollup_counts(db, rollup.REFERRAL_STATUS, include_deleted=True)
+    return [{"status": r[0], "count": r[1]} for r in rows]
 
 
 # ------------------------------
@@ -303,21 +176,17 @@ def get_staff_performance(db: Session) -> List[dict]:
     Computes performance metrics for each staff member.
     Metrics: Total Leads, Total Referrals, Conversion Rate (%)
     """
-    staff_list = db.query(models.Lead.staff_name).distinct().all()
+    # Staff with any lead at all (deleted ones included) get a row
+    staff_list = [name for name, _ in rollup.rollup_counts(db, rollup.ALL, group_by="staff", include_deleted=True)]
+    totals = dict(rollup.rollup_counts(db, rollup.ALL, group_by="staff"))
+    referral_totals = dict(rollup.rollup_counts(db, rollup.REFERRAL, group_by="staff"))
     performance = []
 
-    for (name,) in staff_list:
+    for name in staff_list:
         if not name: continue
         
-        total = db.query(models.Lead).filter(
-            models.Lead.deleted_at == None,
-            models.Lead.staff_name == name
-        ).count()
-        referrals = db.query(models.Lead).filter(
-            models.Lead.deleted_at == None,
-            models.Lead.staff_name == name, 
-            models.Lead.active_client == True
-        ).count()
+        total = totals.get(name, 0)
+        referrals = referral_totals.get(name, 0)
         
         rate = round((referrals / total * 100), 2) if total > 0 else 0
         
@@ -336,9 +205,9 @@ def get_system_wide_distribution(db: Session) -> Dict[str, List[dict]]:
     Returns distribution data for all leads in the system.
     Used for global admin pie charts.
     """
-    status_rows = db.query(models.Lead.last_contact_status, func.count(models.Lead.id)).filter(models.Lead.deleted_at == None).group_by(models.Lead.last_contact_status).all()
-    source_rows = db.query(models.Lead.source, func.count(models.Lead.id)).filter(models.Lead.deleted_at == None).group_by(models.Lead.source).all()
-    priority_rows = db.query(models.Lead.priority, func.count(models.Lead.id)).filter(models.Lead.deleted_at == None).group_by(models.Lead.priority).all()
+    status_rows = rollup.rollup_counts(db, rollup.STATUS)
+    source_rows = rollup.rollup_counts(db, rollup.SOURCE)
+    priority_rows = rollup.rollup_counts(db, rollup.PRIORITY)
     
     return {
         "status": [{"label": r[0], "value": r[1]} for r in status_rows],
@@ -347,19 +216,23 @@ def get_system_wide_distribution(db: Session) -> Dict[str, List[dict]]:
     }
 
 
+def _counts_by_ccu_name(db: Session, rows) -> List[dict]:
+    """Map rollup CCU ids to names, dropping ids that no longer have a CCU row."""
+    names = {str(ccu_id): name for ccu_id, name in db.query(models.CCU.id, models.CCU.name).all()}
+    totals: Dict[str, int] = {}
+    for ccu_id, count in rows:
+        name = names.get(ccu_id)
+        if name is None:
+            continue
+        totals[name] = totals.get(name, 0) + count
+    return [{"ccu_name": name, "count": totals[name]} for name in sorted(totals)]
+
+
 def get_referrals_by_ccu(db: Session) -> List[dict]:
     """
     Returns count of all referrals (Sent + Confirm) grouped by CCU.
     """
-    results = (
-        db.query(models.CCU.name, func.count(models.Lead.id))
-        .join(models.Lead, models.Lead.ccu_id == models.CCU.id)
-        .filter(models.Lead.active_client == True)
-        .group_by(models.CCU.name)
-        .all()
-    )
-    
-    return [{"ccu_name": r[0], "count": r[1]} for r in results]
+    return _counts_by_ccu_name(db, rollup.rollup_counts(db, rollup.REFERRAL_CCU, include_deleted=True))
 
 
 def get_referral_segments_by_ccu(db: Session) -> Dict[str, List[dict]]:
@@ -369,26 +242,12 @@ def get_referral_segments_by_ccu(db: Session) -> Dict[str, List[dict]]:
     Confirmed = Active client + 'Care Start' care status
     """
     # 1. Sent Referrals
-    sent_rows = (
-        db.query(models.CCU.name, func.count(models.Lead.id))
-        .join(models.Lead, models.Lead.ccu_id == models.CCU.id)
-        .filter(models.Lead.active_client == True)
-        .filter(models.Lead.deleted_at == None)
-        .group_by(models.CCU.name)
-        .all()
-    )
+    sent_rows = rollup.rollup_counts(db, rollup.REFERRAL_CCU)
     
     # 2. Confirmed Referrals
-    conf_rows = (
-        db.query(models.CCU.name, func.count(models.Lead.id))
-        .join(models.Lead, models.Lead.ccu_id == models.CCU.id)
-        .filter(models.Lead.active_client == True)
-        .filter(models.Lead.care_status == "Care Start")
-        .group_by(models.CCU.name)
-        .all()
-    )
+    conf_rows = rollup.rollup_counts(db, rollup.REFERRAL_CCU_CARE_START, include_deleted=True)
     
     return {
-        "sent": [{"ccu_name": r[0], "count": r[1]} for r in sent_rows],
-        "confirmed": [{"ccu_name": r[0], "count": r[1]} for r in conf_rows]
+        "sent": _counts_by_ccu_name(db, sent_rows),
+        "confirmed": _counts_by_ccu_name(db, conf_rows)
     }
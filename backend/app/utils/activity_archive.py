@@ -0,0 +1,505 @@
+"""
+Activity Log Archive
+Moves activity logs older than a horizon out of activity_logs into one
+gzipped JSONL file per month, and reads them back for history queries.
+
+Files live in ACTIVITY_ARCHIVE_DIR, by default next to the database
+(/app/data/activity_archive on the persistent volume, backend/activity_archive
+locally). activity_archive_months and activity_archive_entities record what
+each file holds, so a read only opens the months it can touch, and
+activity_archive_counts holds per-month counts by user, action and entity
+type, so counts and page offsets are answered without opening files. Each
+line is one log with its field changes and keyword tags, newest first.
+
+Archiving a month that already has a file (e.g. the rest of a month the
+horizon cut through) rewrites the file with old and new rows merged by id.
+The new file is swapped in before the transaction deleting the rows from
+activity_logs commits, so an interrupted run loses nothing and the next run
+simply archives the same rows again.
+"""
+
+import gzip
+import json
+import logging
+import os
+from collections import Counter
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy import and_, case, desc, func
+from sqlalchemy.orm import Session
+
+from app.models import (
+    ActivityArchiveCount,
+    ActivityArchiveEntity,
+    ActivityArchiveMonth,
+    ActivityFieldChange,
+    ActivityLog,
+    ActivityLogKeyword,
+)
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+LOG_COLUMNS = [column.key for column in ActivityLog.__table__.columns]
+CHANGE_COLUMNS = ["field", "old_value", "new_value"]
+# How json.dumps writes the entity_id key; used to skip lines without parsing
+ENTITY_ID_KEY = '"entity_id": '
+SEARCH_FIELDS = ["description", "keywords", "entity_name"]
+
+DEFAULT_HORIZON_DAYS = 180
+# The daily digest and activity summaries only read recent days from activity_logs
+MIN_HORIZON_DAYS = 30
+
+_ID_CHUNK = 500
+
+
+def archive_dir() -> str:
+    configured = os.getenv("ACTIVITY_ARCHIVE_DIR")
+    if configured:
+        return configured
+    if os.path.exists("/app/data"):
+        return "/app/data/activity_archive"
+    return os.path.join(BACKEND_DIR, "activity_archive")
+
+
+def _cache_months() -> int:
+    try:
+        return max(1, int(os.getenv("ACTIVITY_ARCHIVE_CACHE_MONTHS", 12)))
+    except ValueError:
+        return 12
+
+
+def horizon_days() -> int:
+    try:
+        return max(MIN_HORIZON_DAYS, int(os.getenv("ACTIVITY_ARCHIVE_DAYS", DEFAULT_HORIZON_DAYS)))
+    except ValueError:
+        return DEFAULT_HORIZON_DAYS
+
+
+def _chunks(items: List[Any], size: int = _ID_CHUNK) -> Iterator[List[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _month_start(value: datetime) -> datetime:
+    return datetime(value.year, value.month, 1)
+
+
+def _next_month(month_start: datetime) -> datetime:
+    return (month_start + timedelta(days=32)).replace(day=1)
+
+
+def _file_name(month: str) -> str:
+    return f"activity_logs_{month.replace('-', '_')}.jsonl.gz"
+
+
+def _as_datetime(value) -> Optional[datetime]:
+    """A bare date filter means midnight, as it does in the SQL query."""
+    if value is None or isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime.combine(value, time.min)
+    return value
+
+
+# ---------------------------------------------------------------------------
+# Files
+# ---------------------------------------------------------------------------
+
+def _read_records(path: str) -> List[Dict[str, Any]]:
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _write_records(path: str, records: Iterable[Dict[str, Any]]) -> None:
+    """Write to a temp file and swap it in, so readers never see a partial file."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as raw:
+        with gzip.GzipFile(fileobj=raw, mode="wb") as gz:
+            for record in records:
+                gz.write((json.dumps(record) + "\n").encode("utf-8"))
+        raw.flush()
+        os.fsync(raw.fileno())
+    os.replace(tmp_path, path)
+
+
+@lru_cache(maxsize=_cache_months())
+def _month_lines(path: str, mtime_ns: int) -> tuple:
+    """Decompressed lines of one archive file, cached per file version."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return tuple(f.read().splitlines())
+
+
+def _entity_id_text(line: str) -> Optional[str]:
+    """The top-level entity_id of a raw line, without parsing the JSON."""
+    start = line.find(ENTITY_ID_KEY)
+    if start < 0:
+        return None
+    start += len(ENTITY_ID_KEY)
+    return line[start:line.find(",", start)]
+
+
+def _month_records(
+    entry: ActivityArchiveMonth,
+    entity_ids: Optional[set] = None,
+    line_contains: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Records of one archive month, newest first, parsed as they are consumed.
+    Lines for other entity_ids, or whose lower-cased text lacks
+    line_contains, are skipped before parsing.
+    """
+    path = os.path.join(archive_dir(), entry.file_name)
+    try:
+        lines = _month_lines(path, os.stat(path).st_mtime_ns)
+    except FileNotFoundError:
+        logger.warning(f"Activity archive file missing for {entry.month}: {path}")
+        return
+    wanted = {str(entity_id) for entity_id in entity_ids} if entity_ids is not None else None
+    for line in lines:
+        if wanted is not None and _entity_id_text(line) not in wanted:
+            continue
+        if line_contains and line_contains not in line.lower():
+            continue
+        record = json.loads(line)
+        record["timestamp"] = datetime.fromisoformat(record["timestamp"])
+        yield record
+
+
+# ---------------------------------------------------------------------------
+# Compaction
+# ---------------------------------------------------------------------------
+
+def _archive_month(db: Session, start: datetime, end: datetime) -> int:
+    """Move the logs in [start, end) into their month's file; one transaction."""
+    table = ActivityLog.__table__
+    rows = db.query(*table.columns).filter(
+        table.c.timestamp >= start,
+        table.c.timestamp < end
+    ).order_by(table.c.id).all()
+    if not rows:
+        return 0
+
+    ids = [row.id for row in rows]
+    changes: Dict[int, List[Dict[str, Any]]] = {}
+    tags: Dict[int, List[str]] = {}
+    for chunk in _chunks(ids):
+        for change in db.query(
+            ActivityFieldChange.log_id, ActivityFieldChange.field,
+            ActivityFieldChange.old_value, ActivityFieldChange.new_value
+        ).filter(ActivityFieldChange.log_id.in_(chunk)).order_by(ActivityFieldChange.id):
+            changes.setdefault(change.log_id, []).append({col: getattr(change, col) for col in CHANGE_COLUMNS})
+        for tag in db.query(ActivityLogKeyword.log_id, ActivityLogKeyword.keyword).filter(
+            ActivityLogKeyword.log_id.in_(chunk)
+        ).order_by(ActivityLogKeyword.id):
+            tags.setdefault(tag.log_id, []).append(tag.keyword)
+
+    month = start.strftime("%Y-%m")
+    file_name = _file_name(month)
+    path = os.path.join(archive_dir(), file_name)
+    merged = {record["id"]: record for record in _read_records(path)} if os.path.exists(path) else {}
+    for row in rows:
+        record = row._asdict()
+        record["timestamp"] = row.timestamp.isoformat()
+        record["field_changes"] = changes.get(row.id, [])
+        record["keyword_tags"] = tags.get(row.id, [])
+        merged[row.id] = record
+    timestamps = {log_id: datetime.fromisoformat(record["timestamp"]) for log_id, record in merged.items()}
+    records = [merged[log_id] for log_id in sorted(merged, key=lambda log_id: (timestamps[log_id], log_id), reverse=True)]
+
+    try:
+        entry = db.query(ActivityArchiveMonth).filter(ActivityArchiveMonth.month == month).first()
+        if not entry:
+            entry = ActivityArchiveMonth(month=month)
+            db.add(entry)
+        entry.file_name = file_name
+        entry.row_count = len(records)
+        entry.first_timestamp = min(timestamps.values())
+        entry.last_timestamp = max(timestamps.values())
+        entry.archived_at = datetime.utcnow()
+
+        db.query(ActivityArchiveEntity).filter(ActivityArchiveEntity.month == month).delete(synchronize_session=False)
+        entity_counts = Counter(
+            (record["entity_type"], record["entity_id"]) for record in records if record["entity_id"] is not None
+        )
+        db.bulk_insert_mappings(ActivityArchiveEntity, [
+            {"month": month, "entity_type": entity_type, "entity_id": entity_id, "row_count": count}
+            for (entity_type, entity_id), count in entity_counts.items()
+        ])
+        _write_counts(db, month, records)
+
+        # SQLite does not enforce the ON DELETE CASCADE, so remove child rows explicitly
+        for chunk in _chunks(ids):
+            db.query(ActivityFieldChange).filter(ActivityFieldChange.log_id.in_(chunk)).delete(synchronize_session=False)
+            db.query(ActivityLogKeyword).filter(ActivityLogKeyword.log_id.in_(chunk)).delete(synchronize_session=False)
+            db.query(ActivityLog).filter(ActivityLog.id.in_(chunk)).delete(synchronize_session=False)
+        db.flush()
+
+        _write_records(path, records)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return len(rows)
+
+
+def _write_counts(db: Session, month: str, records: Iterable[Dict[str, Any]]) -> None:
+    db.query(ActivityArchiveCount).filter(ActivityArchiveCount.month == month).delete(synchronize_session=False)
+    counts = Counter((record["username"], record["action_type"], record["entity_type"]) for record in records)
+    db.bulk_insert_mappings(ActivityArchiveCount, [
+        {"month": month, "username": username, "action_type": action_type, "entity_type": entity_type, "row_count": count}
+        for (username, action_type, entity_type), count in counts.items()
+    ])
+
+
+def build_missing_counts(db: Session) -> List[str]:
+    """Fill activity_archive_counts for months archived before it existed; returns those months."""
+    counted = {month for (month,) in db.query(ActivityArchiveCount.month).distinct()}
+    built = []
+    for entry in db.query(ActivityArchiveMonth).order_by(ActivityArchiveMonth.month):
+        if entry.month in counted or not entry.row_count:
+            continue
+        path = os.path.join(archive_dir(), entry.file_name)
+        if not os.path.exists(path):
+            logger.warning(f"Activity archive file missing for {entry.month}: {path}")
+            continue
+        try:
+            _write_counts(db, entry.month, _read_records(path))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        built.append(entry.month)
+    return built
+
+
+def archive_logs(db: Session, cutoff: datetime, dry_run: bool = False) -> Dict[str, int]:
+    """
+    Move activity logs older than `cutoff` into the monthly archive files,
+    one month per transaction. Returns {"YYYY-MM": rows moved}; with dry_run,
+    the rows that would be moved.
+    """
+    from app.utils import activity_log_writer
+    activity_log_writer.flush_pending()
+
+    oldest = db.query(func.min(ActivityLog.timestamp)).filter(ActivityLog.timestamp < cutoff).scalar()
+    if oldest is None:
+        return {}
+    if not dry_run:
+        os.makedirs(archive_dir(), exist_ok=True)
+
+    moved: Dict[str, int] = {}
+    month_start = _month_start(oldest)
+    while month_start < cutoff:
+        month_end = min(_next_month(month_start), cutoff)
+        if dry_run:
+            count = db.query(func.count(ActivityLog.id)).filter(
+                ActivityLog.timestamp >= month_start,
+                ActivityLog.timestamp < month_end
+            ).scalar()
+        else:
+            count = _archive_month(db, month_start, month_end)
+        if count:
+            moved[month_start.strftime("%Y-%m")] = count
+        month_start = _next_month(month_start)
+    return moved
+
+
+def compact_database(eng) -> None:
+    """Give the space freed by archiving back to the filesystem (SQLite only)."""
+    if eng.dialect.name != "sqlite":
+        return
+    from sqlalchemy import text
+    from app.utils.activity_search_index import FTS_TABLE, get_index_mode
+
+    with eng.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        if get_index_mode() == "fts5":
+            conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES('optimize')"))
+        conn.execute(text("VACUUM"))
+
+
+# ---------------------------------------------------------------------------
+# Reads
+# ---------------------------------------------------------------------------
+
+def _archived_months(db: Session, start_date=None, end_date=None, months=None) -> List[ActivityArchiveMonth]:
+    """Catalog entries that can hold logs in the date range, newest month first."""
+    query = db.query(ActivityArchiveMonth)
+    if start_date:
+        query = query.filter(ActivityArchiveMonth.last_timestamp >= start_date)
+    if end_date:
+        query = query.filter(ActivityArchiveMonth.first_timestamp <= end_date)
+    if months is not None:
+        query = query.filter(ActivityArchiveMonth.month.in_(months))
+    return query.order_by(desc(ActivityArchiveMonth.month)).all()
+
+
+def _to_log(record: Dict[str, Any]) -> ActivityLog:
+    """Detached ActivityLog for an archived record; never add it to a session."""
+    return ActivityLog(**{col: record[col] for col in LOG_COLUMNS})
+
+
+def _log_filter(
+    username=None, action_type=None, entity_type=None, start_date=None, end_date=None,
+    search_keywords=None, keyword=None
+) -> Callable[[Dict[str, Any]], bool]:
+    """Python version of get_activity_logs' WHERE clause for archived records."""
+    term = search_keywords.lower() if search_keywords else None
+    tag = keyword.strip().lower() if keyword else None
+
+    def matches(record: Dict[str, Any]) -> bool:
+        if username and record["username"] != username:
+            return False
+        if action_type and record["action_type"] != action_type:
+            return False
+        if entity_type and record["entity_type"] != entity_type:
+            return False
+        if start_date and record["timestamp"] < start_date:
+            return False
+        if end_date and record["timestamp"] > end_date:
+            return False
+        if term and not any(term in (record[col] or "").lower() for col in SEARCH_FIELDS):
+            return False
+        if tag and tag not in record["keyword_tags"]:
+            return False
+        return True
+
+    return matches
+
+
+def _catalog_counts(db: Session, months: List[str], username=None, action_type=None, entity_type=None) -> Dict[str, tuple]:
+    """{month: (rows counted, rows matching the filters)} from activity_archive_counts."""
+    conditions = []
+    if username:
+        conditions.append(ActivityArchiveCount.username == username)
+    if action_type:
+        conditions.append(ActivityArchiveCount.action_type == action_type)
+    if entity_type:
+        conditions.append(ActivityArchiveCount.entity_type == entity_type)
+    matching = case((and_(*conditions), ActivityArchiveCount.row_count), else_=0) if conditions else ActivityArchiveCount.row_count
+    rows = db.query(
+        ActivityArchiveCount.month,
+        func.sum(ActivityArchiveCount.row_count),
+        func.sum(matching)
+    ).filter(ActivityArchiveCount.month.in_(months)).group_by(ActivityArchiveCount.month).all()
+    return {month: (total or 0, matched or 0) for month, total, matched in rows}
+
+
+def _month_results(
+    db: Session, username=None, action_type=None, entity_type=None, start_date=None, end_date=None,
+    search_keywords=None, keyword=None
+) -> Iterator[tuple]:
+    """
+    (catalog entry, matching count or None) for each archive month in the date
+    range, newest first. The count comes from the catalog when the filters
+    are ones it records and the month lies wholly inside the date range;
+    otherwise it is None and the month's file has to be scanned.
+    """
+    entries = _archived_months(db, start_date, end_date)
+    counts = {}
+    if entries and not search_keywords and not keyword:
+        counts = _catalog_counts(db, [entry.month for entry in entries], username, action_type, entity_type)
+    for entry in entries:
+        total, matched = counts.get(entry.month, (None, None))
+        inside = (
+            (not start_date or (entry.first_timestamp and entry.first_timestamp >= start_date))
+            and (not end_date or (entry.last_timestamp and entry.last_timestamp <= end_date))
+        )
+        # Months archived before the counts table existed are scanned
+        yield entry, matched if inside and total == entry.row_count else None
+
+
+def _scan_month(entry: ActivityArchiveMonth, filters: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    matches = _log_filter(**filters)
+    # A term JSON writes verbatim must appear in the raw line of any match
+    term = (filters.get("search_keywords") or "").lower()
+    line_contains = term if term and json.dumps(term)[1:-1] == term else None
+    for record in _month_records(entry, line_contains=line_contains):
+        if matches(record):
+            yield record
+
+
+def find_logs(db: Session, limit: int, offset: int = 0, **filters) -> List[ActivityLog]:
+    """
+    Archived logs matching get_activity_logs' filters, newest first.
+    Months the offset skips entirely are counted from the catalog, not opened.
+    """
+    if limit <= 0:
+        return []
+    filters["start_date"] = _as_datetime(filters.get("start_date"))
+    filters["end_date"] = _as_datetime(filters.get("end_date"))
+    logs: List[ActivityLog] = []
+    for entry, count in _month_results(db, **filters):
+        if count is not None and count <= offset:
+            offset -= count
+            continue
+        for record in _scan_month(entry, filters):
+            if offset:
+                offset -= 1
+                continue
+            logs.append(_to_log(record))
+            if len(logs) >= limit:
+                return logs
+    return logs
+
+
+def count_logs(db: Session, **filters) -> int:
+    """Number of archived logs matching get_activity_count's filters."""
+    filters["start_date"] = _as_datetime(filters.get("start_date"))
+    filters["end_date"] = _as_datetime(filters.get("end_date"))
+    total = 0
+    for entry, count in _month_results(db, **filters):
+        total += count if count is not None else sum(1 for _ in _scan_month(entry, filters))
+    return total
+
+
+def _entity_records(db: Session, entity_type: str, entity_ids: Iterable[int]) -> Iterator[Dict[str, Any]]:
+    entity_ids = {entity_id for entity_id in entity_ids if entity_id is not None}
+    months = set()
+    for chunk in _chunks(list(entity_ids)):
+        months.update(month for (month,) in db.query(ActivityArchiveEntity.month).filter(
+            ActivityArchiveEntity.entity_type == entity_type,
+            ActivityArchiveEntity.entity_id.in_(chunk)
+        ).distinct())
+    if not months:
+        return
+    for entry in _archived_months(db, months=list(months)):
+        for record in _month_records(entry, entity_ids):
+            if record["entity_type"] == entity_type and record["entity_id"] in entity_ids:
+                yield record
+
+
+def entity_logs(db: Session, entity_type: str, entity_ids: Iterable[int]) -> Dict[int, List[ActivityLog]]:
+    """Archived logs of the given entities, newest first per entity."""
+    logs: Dict[int, List[ActivityLog]] = {}
+    for record in _entity_records(db, entity_type, entity_ids):
+        logs.setdefault(record["entity_id"], []).append(_to_log(record))
+    return logs
+
+
+def field_changes(
+    db: Session,
+    entity_type: str,
+    entity_id: int,
+    field: str,
+    encoded_new_value: Optional[str] = None
+) -> List[ActivityFieldChange]:
+    """Archived changes of one field of one entity, newest first, as detached rows."""
+    changes = []
+    for record in _entity_records(db, entity_type, [entity_id]):
+        for change in record["field_changes"]:
+            if change["field"] != field:
+                continue
+            if encoded_new_value is not None and change["new_value"] != encoded_new_value:
+                continue
+            changes.append(ActivityFieldChange(
+                log_id=record["id"],
+                entity_type=entity_type,
+                entity_id=entity_id,
+                changed_at=record["timestamp"],
+                **change
+            ))
+    return changes
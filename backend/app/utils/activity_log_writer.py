@@ -0,0 +1,243 @@
+"""
+Activity Log Writer
+Batches standalone audit rows instead of committing one transaction per line.
+
+Two ways an activity log row gets written:
+- Transactional: create_activity_log(..., commit=False) adds the row to the
+  caller's session, so it commits (or rolls back) with the change it
+  describes. Lead create/update use this.
+- Queued: create_activity_log(...) with the default commit=True hands the
+  row to this writer when ACTIVITY_LOG_MODE=async (the default). A
+  background thread inserts queued rows with bulk_insert_mappings every
+  ACTIVITY_LOG_FLUSH_MS milliseconds, or as soon as ACTIVITY_LOG_BATCH_SIZE
+  rows are waiting, followed by each row's child rows (field changes,
+  keyword tags). Pending rows are flushed at interpreter exit and before
+  this process reads the activity log, so a user always sees their own
+  entries. ACTIVITY_LOG_MODE=sync restores a commit per row.
+
+A batch that fails is retried row by row so one bad entry cannot block
+the rest; an entry that fails ACTIVITY_LOG_MAX_ATTEMPTS flushes is dropped
+and printed in full. Once ACTIVITY_LOG_MAX_PENDING rows are waiting, new
+entries are committed synchronously by the caller instead of queued.
+"""
+
+import atexit
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def async_enabled() -> bool:
+    return os.getenv("ACTIVITY_LOG_MODE", "async").strip().lower() != "sync"
+
+
+def _flush_interval_seconds() -> float:
+    try:
+        return max(0.01, float(os.getenv("ACTIVITY_LOG_FLUSH_MS", 250)) / 1000)
+    except ValueError:
+        return 0.25
+
+
+def _batch_size() -> int:
+    try:
+        return max(1, int(os.getenv("ACTIVITY_LOG_BATCH_SIZE", 200)))
+    except ValueError:
+        return 200
+
+
+def _max_pending() -> int:
+    try:
+        return max(1, int(os.getenv("ACTIVITY_LOG_MAX_PENDING", 10000)))
+    except ValueError:
+        return 10000
+
+
+def _max_attempts() -> int:
+    try:
+        return max(1, int(os.getenv("ACTIVITY_LOG_MAX_ATTEMPTS", 5)))
+    except ValueError:
+        return 5
+
+
+class ActivityLogWriter:
+    """In-process queue of activity_logs rows, inserted in batches by a daemon thread."""
+
+    def __init__(self, flush_interval: float, batch_size: int, max_pending: int = 10000, max_attempts: int = 5):
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.max_attempts = max_attempts
+        # (values, children, failed attempts so far)
+        self._pending: List[Tuple[Dict[str, Any], Dict[str, List[Dict[str, Any]]], int]] = []
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # one insert batch at a time
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, values: Dict[str, Any], children: Dict[str, List[Dict[str, Any]]]) -> bool:
+        """
+        Queue one log row (column name -> value) for the next flush, with its
+        child rows keyed by ActivityLog relationship name (e.g. "field_changes").
+        Returns False, queueing nothing, when max_pending rows are already waiting.
+        """
+        with self._pending_lock:
+            if len(self._pending) >= self.max_pending:
+                return False
+            self._pending.append((values, children, 0))
+            full = len(self._pending) >= self.batch_size
+        self._ensure_thread()
+        if full:
+            self._wake.set()
+        return True
+
+    def flush(self) -> int:
+        """Insert everything queued so far; returns the number of rows written."""
+        with self._flush_lock:
+            with self._pending_lock:
+                rows, self._pending = self._pending, []
+            if not rows:
+                return 0
+
+            if len(rows) > 1:
+                try:
+                    self._insert(rows)
+                    return len(rows)
+                except Exception as e:
+                    print(f"[ERROR] Failed to write {len(rows)} activity log entries as a batch, retrying one by one: {e}")
+
+            written, retry = self._insert_one_by_one(rows)
+            if retry:
+                # Keep them (ahead of newer rows) for the next flush
+                with self._pending_lock:
+                    self._pending = retry + self._pending
+            return written
+
+    def _insert(self, rows) -> None:
+        """Insert rows and their child rows in one transaction; raises on failure."""
+        from sqlalchemy import inspect as sa_inspect
+        from app.db import SessionLocal
+        from app.models import ActivityLog
+
+        logs = [values for values, _, _ in rows]
+        db = SessionLocal()
+        try:
+            # return_defaults fills each mapping's "id" for the child rows
+            for start in range(0, len(logs), self.batch_size):
+                db.bulk_insert_mappings(ActivityLog, logs[start:start + self.batch_size], return_defaults=True)
+            child_rows: Dict[str, List[Dict[str, Any]]] = {}
+            for values, children, _ in rows:
+                for name, items in children.items():
+                    for item in items:
+                        item["log_id"] = values["id"]
+                    child_rows.setdefault(name, []).extend(items)
+            relationships = sa_inspect(ActivityLog).relationships
+            for name, items in child_rows.items():
+                model = relationships[name].mapper.class_
+                for start in range(0, len(items), self.batch_size):
+                    db.bulk_insert_mappings(model, items[start:start + self.batch_size])
+            db.commit()
+        except Exception:
+            db.rollback()
+            for values in logs:
+                values.pop("id", None)
+            raise
+        finally:
+            db.close()
+
+    def _insert_one_by_one(self, rows):
+        """
+        Isolate the rows that make a batch fail. Returns (rows written, rows
+        to retry); rows out of attempts are dropped and logged instead.
+        """
+        from sqlalchemy.exc import OperationalError
+
+        written = 0
+        retry = []
+        for index, row in enumerate(rows):
+            try:
+                self._insert([row])
+                written += 1
+            except OperationalError as e:
+                # Locked or unreachable database rather than a bad row: keep
+                # the rest for the next flush instead of waiting on each one
+                retry.extend(self._count_attempt(rows[index:], e))
+                break
+            except Exception as e:
+                retry.extend(self._count_attempt([row], e))
+        return written, retry
+
+    def _count_attempt(self, rows, error) -> list:
+        kept = []
+        for values, children, attempts in rows:
+            attempts += 1
+            if attempts < self.max_attempts:
+                kept.append((values, children, attempts))
+            else:
+                print(
+                    f"[ERROR] Dropping activity log entry after {attempts} failed attempts ({error}): "
+                    f"{json.dumps(values, default=str)}"
+                )
+        return kept
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop the background thread and write whatever is still queued."""
+        self._stopped.set()
+        self._wake.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout)
+        self.flush()
+
+    def _ensure_thread(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        with self._pending_lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="activity-log-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+
+_writer: Optional[ActivityLogWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_writer() -> ActivityLogWriter:
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = ActivityLogWriter(_flush_interval_seconds(), _batch_size(), _max_pending(), _max_attempts())
+                atexit.register(_writer.shutdown)
+    return _writer
+
+
+def enqueue(values: Dict[str, Any], children: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> bool:
+    """
+    Queue an activity_logs row; stamps the time now so queued rows keep their order.
+    Returns False when the queue is full and the caller must write the row itself.
+    """
+    values.setdefault("timestamp", datetime.utcnow())
+    return get_writer().submit(values, children or {})
+
+
+def flush_pending() -> int:
+    """Write queued rows now, waiting for a flush already in progress (cheap when nothing is queued)."""
+    if _writer is None:
+        return 0
+    return _writer.flush()
+
+
+def shutdown() -> None:
+    """Flush and stop the writer (process shutdown hooks)."""
+    if _writer is not None:
+        _writer.shutdown()
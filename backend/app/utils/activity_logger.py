@@ -25,10 +25,12 @@ def log_activity(
     description: str,
     old_value: Optional[dict] = None,
     new_value: Optional[dict] = None,
-    keywords: Optional[str] = None
+    keywords: Optional[str] = None,
+    commit: bool = True
 ):
     """
-    Main logging function - call this to log any activity
+    Main logging function - call this to log any activity.
+    Pass commit=False to add the entry to a larger transaction the caller commits.
     
     Example:
         log_activity(
@@ -56,7 +58,8 @@ def log_activity(
         description=description,
         old_value=old_value,
         new_value=new_value,
-        keywords=keywords
+        keywords=keywords,
+        commit=commit
     )
 
 
@@ -0,0 +1,149 @@
+"""
+Activity Log Search Index
+Substring index behind the Activity Logs search box.
+
+SQLite: an FTS5 virtual table using the trigram tokenizer over description,
+entity_name and keywords, kept in sync with activity_logs by triggers.
+Postgres: pg_trgm GIN indexes on the same columns, which serve the plain
+LIKE '%term%' condition directly.
+
+Both fall back to the LIKE scan when the index is unavailable or the term
+is too short for trigrams, so results never depend on the index.
+"""
+
+import logging
+import os
+
+from sqlalchemy import text, or_, select
+
+logger = logging.getLogger(__name__)
+
+SEARCH_COLUMNS = ["description", "entity_name", "keywords"]
+
+FTS_TABLE = "activity_logs_fts"
+
+# Trigram indexes cannot answer patterns shorter than three characters
+MIN_INDEXED_TERM = 3
+
+# Past this many matches a term is common enough that walking the timestamp
+# index with LIKE finds a page of results sooner than collecting every match
+DENSE_MATCH_THRESHOLD = 5000
+
+_index_mode = None  # None, "fts5" or "pg_trgm"
+
+
+def _index_enabled() -> bool:
+    return os.getenv("ACTIVITY_SEARCH_INDEX", "true").lower() in ("1", "true", "yes", "on")
+
+
+def _create_sqlite_index(conn):
+    cols = ", ".join(SEARCH_COLUMNS)
+    new_cols = ", ".join(f"new.{col}" for col in SEARCH_COLUMNS)
+
+    existing = conn.execute(text(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name=:name"
+    ), {"name": FTS_TABLE}).first()
+
+    if not existing:
+        conn.execute(text(
+            f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5({cols}, tokenize='trigram')"
+        ))
+        conn.execute(text(
+            f"INSERT INTO {FTS_TABLE}(rowid, {cols}) SELECT id, {cols} FROM activity_logs"
+        ))
+        logger.info(f"Created '{FTS_TABLE}' trigram search index")
+
+    conn.execute(text(f"""
+        CREATE TRIGGER IF NOT EXISTS activity_logs_fts_ai AFTER INSERT ON activity_logs BEGIN
+            INSERT INTO {FTS_TABLE}(rowid, {cols}) VALUES (new.id, {new_cols});
+        END
+    """))
+    conn.execute(text(f"""
+        CREATE TRIGGER IF NOT EXISTS activity_logs_fts_ad AFTER DELETE ON activity_logs BEGIN
+            DELETE FROM {FTS_TABLE} WHERE rowid = old.id;
+        END
+    """))
+    conn.execute(text(f"""
+        CREATE TRIGGER IF NOT EXISTS activity_logs_fts_au AFTER UPDATE OF {cols} ON activity_logs BEGIN
+            DELETE FROM {FTS_TABLE} WHERE rowid = old.id;
+            INSERT INTO {FTS_TABLE}(rowid, {cols}) VALUES (new.id, {new_cols});
+        END
+    """))
+
+
+def _create_pg_index(conn):
+    conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    for col in SEARCH_COLUMNS:
+        conn.execute(text(
+            f"CREATE INDEX IF NOT EXISTS ix_activity_logs_{col}_trgm ON activity_logs "
+            f"USING gin ({col} gin_trgm_ops)"
+        ))
+
+
+def ensure_activity_search_index(eng) -> None:
+    """Create the search index for the current dialect if it is missing."""
+    global _index_mode
+    _index_mode = None
+
+    if not _index_enabled():
+        return
+
+    dialect = eng.dialect.name
+    try:
+        with eng.begin() as conn:
+            if dialect == "sqlite":
+                _create_sqlite_index(conn)
+                _index_mode = "fts5"
+            elif dialect == "postgresql":
+                _create_pg_index(conn)
+                _index_mode = "pg_trgm"
+    except Exception as e:
+        # FTS5/trigram needs SQLite 3.34+; pg_trgm needs the extension
+        logger.warning(f"Activity log search index unavailable, using LIKE scan: {e}")
+        _index_mode = None
+
+
+def rebuild_activity_search_index(eng) -> None:
+    """Repopulate the SQLite FTS table from scratch (e.g. after bulk imports)."""
+    if eng.dialect.name != "sqlite":
+        return
+    cols = ", ".join(SEARCH_COLUMNS)
+    with eng.begin() as conn:
+        conn.execute(text(f"DELETE FROM {FTS_TABLE}"))
+        conn.execute(text(
+            f"INSERT INTO {FTS_TABLE}(rowid, {cols}) SELECT id, {cols} FROM activity_logs"
+        ))
+
+
+def get_index_mode():
+    """Return the active index type ("fts5", "pg_trgm") or None."""
+    return _index_mode
+
+
+def _like_condition(log_model, term: str):
+    return or_(
+        log_model.description.contains(term),
+        log_model.keywords.contains(term),
+        log_model.entity_name.contains(term),
+    )
+
+
+def activity_search_condition(db, log_model, term: str):
+    """
+    WHERE clause for "term appears in description, keywords or entity name",
+    served by the FTS index when one is available and the term is selective.
+    """
+    if _index_mode == "fts5" and len(term) >= MIN_INDEXED_TERM:
+        # One quoted phrase: the whole term as a substring of a single column
+        phrase = '"' + term.replace('"', '""') + '"'
+        matches = db.execute(text(
+            f"SELECT count(*) FROM (SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :activity_match LIMIT :cap)"
+        ), {"activity_match": phrase, "cap": DENSE_MATCH_THRESHOLD + 1}).scalar()
+        if matches <= DENSE_MATCH_THRESHOLD:
+            matching_ids = select(text("rowid")).select_from(text(FTS_TABLE)).where(
+                text(f"{FTS_TABLE} MATCH :activity_match").bindparams(activity_match=phrase)
+            )
+            return log_model.id.in_(matching_ids)
+
+    # pg_trgm indexes serve the LIKE condition as written
+    return _like_condition(log_model, term)
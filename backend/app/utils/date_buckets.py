@@ -0,0 +1,32 @@
+"""
+Date Buckets
+Dialect-aware SQL expressions that truncate a timestamp column to a
+period label, so time series can be grouped in the database.
+
+Labels are strings that sort chronologically:
+    month -> "YYYY-MM"
+    week  -> "YYYY-MM-DD" of the Monday starting the week
+    day   -> "YYYY-MM-DD"
+"""
+
+from sqlalchemy import func
+
+GRANULARITIES = ("month", "week", "day")
+
+
+def date_bucket(column, granularity: str, dialect_name: str):
+    """SQL expression labelling `column` with its month/week/day bucket."""
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"Unsupported granularity '{granularity}' (expected one of {GRANULARITIES})")
+
+    if dialect_name == "sqlite":
+        if granularity == "month":
+            return func.strftime("%Y-%m", column)
+        if granularity == "week":
+            # 'weekday 0' moves to the next Sunday (or stays on one); back 6 days is that week's Monday
+            return func.date(column, "weekday 0", "-6 days")
+        return func.date(column)
+
+    # PostgreSQL (date_trunc weeks start on Monday)
+    fmt = "YYYY-MM" if granularity == "month" else "YYYY-MM-DD"
+    return func.to_char(func.date_trunc(granularity, column), fmt)
@@ -3,6 +3,9 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import logging
 import os
+import threading
+import time
+from typing import List, Optional
 from dotenv import load_dotenv
 
 # Load environment variables (Check root then current)
@@ -29,6 +32,213 @@ def get_template_content(slug: str, default_subject: str, default_body: str, dat
     return default_subject.format(**data), default_body.format(**data)
 
 
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return float(default)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: `rate` tokens per second, bursts up to `capacity`.
+    acquire() blocks until a token is available.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class SMTPMailer:
+    """
+    Reusable SMTP sender.
+
+    Keeps one authenticated session open across messages instead of paying
+    EHLO/STARTTLS/login per email. The session is recycled after `batch_size`
+    messages or `idle_timeout` seconds idle, and re-established once if the
+    server drops it mid-send. Throughput is capped by a shared token bucket.
+
+    Port 465 uses implicit TLS; any other port must offer STARTTLS or the
+    connection fails, so credentials and mail never go out in plaintext.
+    allow_plaintext (SMTP_ALLOW_PLAINTEXT=1) lifts that for a local debugging
+    server (e.g. aiosmtpd), skipping STARTTLS and login when not advertised.
+    """
+
+    def __init__(
+        self,
+        server: str,
+        port: int,
+        username: str,
+        password: str,
+        rate_per_second: float = 10.0,
+        burst: float = 20.0,
+        batch_size: int = 50,
+        idle_timeout: float = 60.0,
+        timeout: float = 30.0,
+        allow_plaintext: bool = False,
+    ):
+        self.server = server
+        self.port = port
+        self.username = username
+        self.password = password
+        self.batch_size = max(1, batch_size)
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.allow_plaintext = allow_plaintext
+        self.bucket = TokenBucket(rate_per_second, burst)
+        self._conn = None
+        self._sent_on_conn = 0
+        self._last_used = 0.0
+        self._lock = threading.Lock()
+
+    # -- connection handling (callers hold self._lock) --
+
+    def _connect(self):
+        if self.port == 465:
+            conn = smtplib.SMTP_SSL(self.server, self.port, timeout=self.timeout)
+            conn.ehlo()
+        else:
+            conn = smtplib.SMTP(self.server, self.port, timeout=self.timeout)
+            conn.ehlo()
+            if not self.allow_plaintext or conn.has_extn("starttls"):
+                # Raises SMTPNotSupportedError if the server (or a downgrade
+                # attacker) does not offer STARTTLS
+                conn.starttls()
+                conn.ehlo()
+        if self.password and (not self.allow_plaintext or conn.has_extn("auth")):
+            conn.login(self.username, self.password)
+        logger.info(f"Opened SMTP session to {self.server}:{self.port}")
+        return conn
+
+    def _disconnect(self):
+        if self._conn is not None:
+            try:
+                self._conn.quit()
+            except Exception:
+                try:
+                    self._conn.close()
+                except Exception:
+                    pass
+        self._conn = None
+        self._sent_on_conn = 0
+
+    def _session(self):
+        stale = self._conn is not None and (
+            self._sent_on_conn >= self.batch_size
+            or time.monotonic() - self._last_used > self.idle_timeout
+        )
+        if stale:
+            self._disconnect()
+        if self._conn is None:
+            self._conn = self._connect()
+        return self._conn
+
+    # -- public API --
+
+    def send(self, from_addr: str, recipients: List[str], message: str) -> None:
+        """Send one message, reconnecting once on a dropped session. Raises on failure."""
+        self.bucket.acquire()
+        with self._lock:
+            for attempt in (1, 2):
+                try:
+                    self._session().sendmail(from_addr, recipients, message)
+                    self._sent_on_conn += 1
+                    self._last_used = time.monotonic()
+                    return
+                except smtplib.SMTPRecipientsRefused:
+                    # Session is still usable; nothing to retry
+                    raise
+                except (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, ConnectionError, TimeoutError) as e:
+                    self._disconnect()
+                    if attempt == 2:
+                        raise
+                    logger.warning(f"SMTP session lost ({e}); reconnecting")
+                except Exception:
+                    self._disconnect()
+                    raise
+
+    def close(self) -> None:
+        with self._lock:
+            self._disconnect()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+_mailer: Optional[SMTPMailer] = None
+_mailer_lock = threading.Lock()
+
+
+def _plaintext_allowed() -> bool:
+    return os.getenv("SMTP_ALLOW_PLAINTEXT", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def get_mailer() -> Optional[SMTPMailer]:
+    """
+    Shared SMTPMailer built from the environment, or None when SMTP is not configured.
+    Rebuilt if the SMTP settings change.
+    """
+    global _mailer
+    smtp_server = os.getenv("SMTP_SERVER")
+    smtp_port = int(os.getenv("SMTP_PORT", 587))
+    sender_email = os.getenv("SENDER_EMAIL")
+    sender_password = os.getenv("SENDER_PASSWORD")
+
+    if not all([smtp_server, smtp_port, sender_email, sender_password]):
+        logger.error(f"Missing SMTP configuration. Server: {smtp_server}, Port: {smtp_port}, User: {sender_email}")
+        print(f"[ERROR] Missing SMTP configuration. Server: {smtp_server}, Port: {smtp_port}, User: {sender_email}")
+        return None
+
+    with _mailer_lock:
+        settings = (smtp_server, smtp_port, sender_email, sender_password, _plaintext_allowed())
+        if _mailer is None or (
+            _mailer.server, _mailer.port, _mailer.username, _mailer.password, _mailer.allow_plaintext
+        ) != settings:
+            if _mailer is not None:
+                _mailer.close()
+            _mailer = SMTPMailer(
+                smtp_server,
+                smtp_port,
+                sender_email,
+                sender_password,
+                rate_per_second=_env_float("SMTP_RATE_PER_SECOND", 10),
+                burst=_env_float("SMTP_BURST", 20),
+                batch_size=int(_env_float("SMTP_BATCH_SIZE", 50)),
+                idle_timeout=_env_float("SMTP_IDLE_TIMEOUT_SECONDS", 60),
+                allow_plaintext=_plaintext_allowed(),
+            )
+        return _mailer
+
+
+def close_mailer() -> None:
+    """Release the shared SMTP session (e.g. at the end of a batch run)."""
+    with _mailer_lock:
+        if _mailer is not None:
+            _mailer.close()
+
+
 def send_email(
     to_email: str,
     subject: str,
@@ -39,21 +249,16 @@ def send_email(
     """
     Core SMTP sending function. 
     Consolidated to handle all email communications in the system.
+    Delivery goes through the shared, rate-limited SMTPMailer session.
     """
     try:
-        # Get credentials from environment variables
-        smtp_server = os.getenv("SMTP_SERVER")
-        smtp_port = int(os.getenv("SMTP_PORT", 587))
-        sender_email = os.getenv("SENDER_EMAIL")
-        sender_password = os.getenv("SENDER_PASSWORD")
-        
-        if not all([smtp_server, smtp_port, sender_email, sender_password]):
-            logger.error(f"Missing SMTP configuration. Server: {smtp_server}, Port: {smtp_port}, User: {sender_email}")
-            print(f"[ERROR] Missing SMTP configuration. Server: {smtp_server}, Port: {smtp_port}, User: {sender_email}")
+        mailer = get_mailer()
+        if mailer is None:
             return False
+        sender_email = mailer.username
         
         # Log sending attempt (with masked password)
-        logger.info(f"Attempting to send email to {to_email} via {smtp_server}:{smtp_port} as {sender_email}")
+        logger.info(f"Attempting to send email to {to_email} via {mailer.server}:{mailer.port} as {sender_email}")
         print(f"[DEBUG] Sending email to {to_email} via {sender_email}")
         
         # Create message
@@ -72,18 +277,7 @@ def send_email(
         if include_admin_bcc and ADMIN_EMAIL and ADMIN_EMAIL.lower() != to_email.lower():
             recipients.append(ADMIN_EMAIL)
             
-        # Connect and send
-        if smtp_port == 465:
-            with smtplib.SMTP_SSL(smtp_server, smtp_port) as server:
-                server.login(sender_email, sender_password)
-                server.sendmail(sender_email, recipients, msg.as_string())
-        else:
-            with smtplib.SMTP(smtp_server, smtp_port) as server:
-                server.ehlo()
-                server.starttls()
-                server.ehlo()
-                server.login(sender_email, sender_password)
-                server.sendmail(sender_email, recipients, msg.as_string())
+        mailer.send(sender_email, recipients, msg.as_string())
             
         bcc_note = f" (BCC: {ADMIN_EMAIL})" if include_admin_bcc and ADMIN_EMAIL else ""
         logger.info(f"Email sent successfully to {to_email}{bcc_note}")
@@ -96,7 +290,40 @@ def send_email(
 
 
 
-def send_simple_lead_email(lead_info: dict, recipient_email: str) -> bool:
+def queue_email(
+    to_email: str,
+    subject: str,
+    body: str,
+    html_body: str = None,
+    include_admin_bcc: bool = True,
+    reminder_id: int = None
+) -> bool:
+    """
+    Enqueue an email on the outbound_emails table and return immediately.
+    The email_scheduler worker performs the SMTP delivery with retries and
+    updates the email_reminders row given by `reminder_id`, if any.
+    """
+    from app.db import SessionLocal
+    from app.crud.crud_outbound_emails import enqueue_email
+
+    if not to_email:
+        logger.error(f"Refusing to queue email without recipient: {subject}")
+        return False
+
+    db = SessionLocal()
+    try:
+        enqueue_email(db, to_email, subject, body, html_body, include_admin_bcc, reminder_id=reminder_id)
+        logger.info(f"Queued email to {to_email}: {subject}")
+        return True
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to queue email to {to_email}: {e}")
+        return False
+    finally:
+        db.close()
+
+
+def send_simple_lead_email(lead_info: dict, recipient_email: str, reminder_id: int = None) -> bool:
     """
     Send a simple automatic reminder email with basic lead information.
     Used for automatic 48-hour reminders.
@@ -104,9 +331,10 @@ def send_simple_lead_email(lead_info: dict, recipient_email: str) -> bool:
     Args:
         lead_info: Dictionary with name, phone, creator, dob, source, status, created_date
         recipient_email: Email address to send reminder to
+        reminder_id: email_reminders row to mark sent/failed once delivery settles
     
     Returns:
-        bool: True if email sent successfully, False otherwise
+        bool: True if email was queued for delivery, False otherwise
     """
     
     name = lead_info.get('name', 'N/A')
@@ -205,10 +433,10 @@ SafeLife Lead Management System
     </html>
     """
     
-    return send_email(recipient_email, subject, body, html_body)
+    return queue_email(recipient_email, subject, body, html_body, reminder_id=reminder_id)
 
 
-def send_referral_reminder_email(referral_info: dict, recipient_email: str) -> bool:
+def send_referral_reminder_email(referral_info: dict, recipient_email: str, reminder_id: int = None) -> bool:
     """
     Send a referral-specific reminder email with comprehensive information.
     Used for automatic reminders based on referral type (Interim: 6hrs, Regular: 24hrs).
@@ -218,9 +446,10 @@ def send_referral_reminder_email(referral_info: dict, recipient_email: str) -> b
                       referral_type, payor_name, payor_suboption, ccu_name, ccu_email, 
                       ccu_coordinator
         recipient_email: Email address to send reminder to
+        reminder_id: email_reminders row to mark sent/failed once delivery settles
     
     Returns:
-        bool: True if email sent successfully, False otherwise
+        bool: True if email was queued for delivery, False otherwise
     """
     
     name = referral_info.get('name', 'N/A')
@@ -392,7 +621,7 @@ SafeLife Lead Management System
     </html>
     """
     
-    return send_email(recipient_email, subject, body, html_body)
+    return queue_email(recipient_email, subject, body, html_body, reminder_id=reminder_id)
 
 
 def send_authorization_confirmation_email(auth_info: dict, recipient_email: str) -> bool:
@@ -406,7 +635,7 @@ def send_authorization_confirmation_email(auth_info: dict, recipient_email: str)
         recipient_email: Email address to send confirmation to
 
     Returns:
-        bool: True if email sent successfully, False otherwise
+        bool: True if email was queued for delivery, False otherwise
     """
 
     name = auth_info.get('name', 'N/A')
@@ -495,7 +724,7 @@ def send_authorization_confirmation_email(auth_info: dict, recipient_email: str)
     </html>
     """
 
-    return send_email(recipient_email, subject, "Authorization Confirmed", html_content)
+    return queue_email(recipient_email, subject, "Authorization Confirmed", html_content)
 
 
 def send_lead_reminder_email(lead_data: dict, recipient_email: str) -> bool:
@@ -508,7 +737,7 @@ def send_lead_reminder_email(lead_data: dict, recipient_email: str) -> bool:
         recipient_email: Email address to send reminder to
     
     Returns:
-        bool: True if email sent successfully, False otherwise
+        bool: True if email was queued for delivery, False otherwise
     """
     
     # Extract lead information
@@ -782,7 +1011,7 @@ Lead Manager System
     </html>
     """
     
-    return send_email(recipient_email, subject, body, html_body)
+    return queue_email(recipient_email, subject, body, html_body)
 
 
 def send_referral_reminder(recipient_email, username, client_name, lead_id, payor_name=None, payor_suboption=None, phone=None, source=None, **kwargs):
@@ -0,0 +1,190 @@
+"""
+Lead Search Index
+Optional substring index behind the lead search box.
+
+SQLite: an FTS5 virtual table using the trigram tokenizer, kept in sync with
+the leads table by triggers (insert/update/delete).
+Postgres: a pg_trgm GIN index over the lower-cased searchable columns.
+
+Both fall back to the plain ILIKE scan when the index is unavailable, so
+search results never depend on whether the index exists.
+"""
+
+import logging
+import os
+from typing import List
+
+from sqlalchemy import text, func, or_, and_, select, literal_column
+
+logger = logging.getLogger(__name__)
+
+# Columns matched by the search box. The reversed/forward full-name
+# expressions are covered because tokens never contain whitespace.
+SEARCH_COLUMNS = [
+    "first_name",
+    "last_name",
+    "phone",
+    "email",
+    "medicaid_no",
+    "custom_user_id",
+]
+
+FTS_TABLE = "leads_fts"
+PG_INDEX = "ix_leads_search_trgm"
+
+# Trigram indexes cannot answer patterns shorter than three characters
+MIN_INDEXED_TOKEN = 3
+
+_index_mode = None  # None, "fts5" or "pg_trgm"
+
+
+def _index_enabled() -> bool:
+    return os.getenv("LEAD_SEARCH_INDEX", "true").lower() in ("1", "true", "yes", "on")
+
+
+def _pg_search_expression_sql(prefix: str = "") -> str:
+    # Must stay textually identical (modulo table prefix) to the indexed expression
+    parts = " || ' ' || ".join(f"coalesce({prefix}{col}, '')" for col in SEARCH_COLUMNS)
+    return f"lower({parts})"
+
+
+def _create_sqlite_index(conn):
+    cols = ", ".join(SEARCH_COLUMNS)
+    new_cols = ", ".join(f"new.{col}" for col in SEARCH_COLUMNS)
+
+    existing = conn.execute(text(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name=:name"
+    ), {"name": FTS_TABLE}).first()
+
+    if not existing:
+        conn.execute(text(
+            f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5({cols}, tokenize='trigram')"
+        ))
+        conn.execute(text(
+            f"INSERT INTO {FTS_TABLE}(rowid, {cols}) SELECT id, {cols} FROM leads"
+        ))
+        logger.info(f"Created '{FTS_TABLE}' trigram search index")
+
+    conn.execute(text(f"""
+        CREATE TRIGGER IF NOT EXISTS leads_fts_ai AFTER INSERT ON leads BEGIN
+            INSERT INTO {FTS_TABLE}(rowid, {cols}) VALUES (new.id, {new_cols});
+        END
+    """))
+    conn.execute(text(f"""
+        CREATE TRIGGER IF NOT EXISTS leads_fts_ad AFTER DELETE ON leads BEGIN
+            DELETE FROM {FTS_TABLE} WHERE rowid = old.id;
+        END
+    """))
+    conn.execute(text(f"""
+        CREATE TRIGGER IF NOT EXISTS leads_fts_au AFTER UPDATE OF {cols} ON leads BEGIN
+            DELETE FROM {FTS_TABLE} WHERE rowid = old.id;
+            INSERT INTO {FTS_TABLE}(rowid, {cols}) VALUES (new.id, {new_cols});
+        END
+    """))
+
+
+def _create_pg_index(conn):
+    conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    conn.execute(text(
+        f"CREATE INDEX IF NOT EXISTS {PG_INDEX} ON leads "
+        f"USING gin (({_pg_search_expression_sql()}) gin_trgm_ops)"
+    ))
+
+
+def ensure_lead_search_index(eng) -> None:
+    """Create the search index for the current dialect if it is missing."""
+    global _index_mode
+    _index_mode = None
+
+    if not _index_enabled():
+        return
+
+    dialect = eng.dialect.name
+    try:
+        with eng.begin() as conn:
+            if dialect == "sqlite":
+                _create_sqlite_index(conn)
+                _index_mode = "fts5"
+            elif dialect == "postgresql":
+                _create_pg_index(conn)
+                _index_mode = "pg_trgm"
+    except Exception as e:
+        # FTS5/trigram needs SQLite 3.34+; pg_trgm needs the extension
+        logger.warning(f"Lead search index unavailable, using ILIKE scan: {e}")
+        _index_mode = None
+
+
+def rebuild_lead_search_index(eng) -> None:
+    """Repopulate the SQLite FTS table from scratch (e.g. after bulk imports)."""
+    if eng.dialect.name != "sqlite":
+        return
+    cols = ", ".join(SEARCH_COLUMNS)
+    with eng.begin() as conn:
+        conn.execute(text(f"DELETE FROM {FTS_TABLE}"))
+        conn.execute(text(
+            f"INSERT INTO {FTS_TABLE}(rowid, {cols}) SELECT id, {cols} FROM leads"
+        ))
+
+
+def get_index_mode():
+    """Return the active index type ("fts5", "pg_trgm") or None."""
+    return _index_mode
+
+
+def tokenize_search_query(search_query: str) -> List[str]:
+    """Trim, lowercase and split a raw search string into tokens."""
+    if not search_query:
+        return []
+    return [t for t in search_query.strip().lower().split() if t]
+
+
+def _ilike_token_condition(lead_model, token: str):
+    tok_pat = f"%{token}%"
+    full_name_expr = func.lower(lead_model.first_name + ' ' + lead_model.last_name)
+    full_name_rev_expr = func.lower(lead_model.last_name + ' ' + lead_model.first_name)
+    return or_(
+        lead_model.first_name.ilike(tok_pat),
+        lead_model.last_name.ilike(tok_pat),
+        full_name_expr.ilike(tok_pat),
+        full_name_rev_expr.ilike(tok_pat),
+        lead_model.phone.ilike(tok_pat),
+        lead_model.email.ilike(tok_pat),
+        lead_model.medicaid_no.ilike(tok_pat),
+        lead_model.custom_user_id.ilike(tok_pat),
+    )
+
+
+def _fts_phrase(token: str) -> str:
+    # FTS5 string literal: double any embedded quotes
+    return '"' + token.replace('"', '""') + '"'
+
+
+def lead_token_condition(lead_model, tokens: List[str]):
+    """
+    Build the WHERE clause for a tokenized search.
+    Every token must appear in at least one searchable field (AND across
+    tokens, OR across fields), served by the index when one is available.
+    """
+    if not tokens:
+        return None
+
+    mode = _index_mode
+
+    if mode == "pg_trgm":
+        search_expr = literal_column(_pg_search_expression_sql(prefix="leads."))
+        return and_(*[search_expr.like(f"%{token}%") for token in tokens])
+
+    if mode == "fts5":
+        indexed = [t for t in tokens if len(t) >= MIN_INDEXED_TOKEN]
+        short = [t for t in tokens if len(t) < MIN_INDEXED_TOKEN]
+        conditions = []
+        if indexed:
+            match_expr = " AND ".join(_fts_phrase(t) for t in indexed)
+            matching_ids = select(text("rowid")).select_from(text(FTS_TABLE)).where(
+                text(f"{FTS_TABLE} MATCH :fts_match").bindparams(fts_match=match_expr)
+            )
+            conditions.append(lead_model.id.in_(matching_ids))
+        conditions.extend(_ilike_token_condition(lead_model, t) for t in short)
+        return and_(*conditions)
+
+    return and_(*[_ilike_token_condition(lead_model, t) for t in tokens])
@@ -0,0 +1,100 @@
+"""
+Reminder Schedule
+Intervals for follow-up reminders and the persisted "next due" time.
+
+Lead.next_reminder_due_at is the earliest moment the scheduler needs to
+look at a lead again. NULL means no reminder can ever become due in the
+lead's current state (reminders off, inactive, deleted, or care started).
+"""
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+# Follow-up intervals (hours)
+INTERIM_REFERRAL_INTERVAL_HOURS = 48
+REGULAR_INTERVAL_HOURS = 168  # Regular referrals and plain leads: 1 week
+CARE_START_INTERVAL_HOURS = 24  # Authorized referrals until Care Start
+
+# Lead fields whose change can move the next due time
+SCHEDULE_FIELDS = {
+    "active_client",
+    "referral_type",
+    "care_status",
+    "authorization_received",
+    "authorization_received_at",
+    "send_reminders",
+    "last_contact_status",
+}
+
+
+def reminder_interval_hours(lead) -> int:
+    """Hours between follow-up reminders for this lead type."""
+    if lead.active_client:
+        referral_type = lead.referral_type if lead.referral_type else 'Regular'
+        return INTERIM_REFERRAL_INTERVAL_HOURS if referral_type == 'Interim' else REGULAR_INTERVAL_HOURS
+    return REGULAR_INTERVAL_HOURS
+
+
+def care_start_pending(lead) -> bool:
+    """Authorized referral that has not started care yet."""
+    return bool(lead.active_client and lead.authorization_received and lead.care_status != "Care Start")
+
+
+def compute_next_reminder_due_at(
+    lead,
+    last_reminder_time: Optional[datetime],
+    last_care_reminder_time: Optional[datetime],
+    now: Optional[datetime] = None,
+) -> Optional[datetime]:
+    """Earliest time a follow-up or care start reminder becomes due, or None."""
+    if getattr(lead, "deleted_at", None) is not None:
+        return None
+    if not lead.send_reminders or lead.last_contact_status == "Inactive":
+        return None
+
+    now = now or datetime.utcnow()
+    candidates = []
+
+    # Follow-up reminder (stops once a referral reaches Care Start)
+    if not (lead.active_client and lead.care_status == "Care Start"):
+        if last_reminder_time:
+            candidates.append(last_reminder_time + timedelta(hours=reminder_interval_hours(lead)))
+        else:
+            candidates.append(now)
+
+    # Care start reminder, only once authorization time is known
+    if care_start_pending(lead) and lead.authorization_received_at:
+        if last_care_reminder_time:
+            candidates.append(last_care_reminder_time + timedelta(hours=CARE_START_INTERVAL_HOURS))
+        else:
+            candidates.append(now)
+
+    return min(candidates) if candidates else None
+
+
+def refresh_next_reminder_due_at(db, lead) -> None:
+    """Recompute a single lead's due time from its reminder history (caller commits)."""
+    from app.crud.crud_email_reminders import get_last_reminder_times
+
+    last_reminder_time, last_care_reminder_time = get_last_reminder_times(db, [lead.id]).get(lead.id, (None, None))
+    lead.next_reminder_due_at = compute_next_reminder_due_at(lead, last_reminder_time, last_care_reminder_time)
+
+
+def refresh_due_times_since(db, since: datetime) -> int:
+    """
+    refresh_next_reminder_due_at for every lead created or updated at or after
+    `since`, with one history query per 500 leads. For scripts that write
+    leads directly instead of through crud_leads (caller commits).
+    """
+    from app.crud.crud_email_reminders import get_last_reminder_times
+    from app.models import Lead
+
+    db.flush()
+    leads = db.query(Lead).filter(Lead.updated_at >= since).all()
+    history = {}
+    for start in range(0, len(leads), 500):
+        history.update(get_last_reminder_times(db, [lead.id for lead in leads[start:start + 500]]))
+    for lead in leads:
+        last_reminder_time, last_care_reminder_time = history.get(lead.id, (None, None))
+        lead.next_reminder_due_at = compute_next_reminder_due_at(lead, last_reminder_time, last_care_reminder_time)
+    return len(leads)
@@ -0,0 +1,80 @@
+"""
+Table Versions
+Per-table change counters used as cache keys.
+
+CRUD writes call bump_table_version() before committing, so the new
+version becomes visible together with the data. Readers in any process
+(Streamlit or the API) compare the version they cached against the
+current one instead of expiring on a timer. In-process caches can also
+watch local_generation(), which moves as soon as a bump commits here.
+"""
+
+import threading
+from datetime import datetime
+from typing import Iterable, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+import app.models as models
+
+
+# Count of version bumps committed by this process
+_local_generation = 0
+_generation_lock = threading.Lock()
+_PENDING_KEY = "table_versions_bumped"
+
+
+@event.listens_for(Session, "after_commit")
+def _advance_generation(session) -> None:
+    global _local_generation
+    if session.info.pop(_PENDING_KEY, False):
+        with _generation_lock:
+            _local_generation += 1
+
+
+def local_generation() -> int:
+    return _local_generation
+
+
+def bump_table_version(db: Session, table_name: str) -> None:
+    """Increment `table_name`'s version inside the caller's transaction (caller commits)."""
+    db.info[_PENDING_KEY] = True
+    table = models.TableVersion.__table__
+    now = datetime.utcnow()
+    dialect = db.get_bind().dialect.name
+
+    if dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        stmt = dialect_insert(table).values(table_name=table_name, version=1, updated_at=now)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["table_name"],
+            set_={"version": table.c.version + 1, "updated_at": now},
+        )
+        db.execute(stmt)
+        return
+
+    updated = db.execute(
+        table.update()
+        .where(table.c.table_name == table_name)
+        .values(version=table.c.version + 1, updated_at=now)
+    )
+    if not updated.rowcount:
+        db.execute(table.insert().values(table_name=table_name, version=1, updated_at=now))
+
+
+def get_table_versions(db: Session, table_names: Iterable[str]) -> Tuple[int, ...]:
+    """Current versions for `table_names`, in order (0 for never-written tables)."""
+    names = list(table_names)
+    rows = db.query(models.TableVersion.table_name, models.TableVersion.version).filter(
+        models.TableVersion.table_name.in_(names)
+    ).all()
+    versions = dict(rows)
+    return tuple(versions.get(name, 0) for name in names)
+
+
+def get_table_version(db: Session, table_name: str) -> int:
+    return get_table_versions(db, [table_name])[0]
@@ -0,0 +1,56 @@
+import sys
+import os
+import argparse
+from datetime import datetime, timedelta
+
+# Add the backend directory to sys.path so we can import app modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.db import SessionLocal, engine
+from app.utils import activity_archive
+
+
+def run(days: int, dry_run: bool, vacuum: bool):
+    """
+    Move activity logs older than `days` into the monthly archive files and
+    optionally VACUUM the SQLite database afterwards. Safe to re-run.
+    """
+    if days < activity_archive.MIN_HORIZON_DAYS:
+        print(f"Horizon raised from {days} to the minimum of {activity_archive.MIN_HORIZON_DAYS} days.")
+        days = activity_archive.MIN_HORIZON_DAYS
+    cutoff = datetime.utcnow() - timedelta(days=days)
+    verb = "Would archive" if dry_run else "Archived"
+    print(f"{'Dry run: ' if dry_run else ''}archiving activity logs before {cutoff:%Y-%m-%d %H:%M} UTC "
+          f"into {activity_archive.archive_dir()}")
+
+    db = SessionLocal()
+    try:
+        moved = activity_archive.archive_logs(db, cutoff, dry_run=dry_run)
+        for month, count in moved.items():
+            print(f"  {month}: {verb.lower()} {count} logs")
+        print(f"{verb} {sum(moved.values())} logs from {len(moved)} months.")
+        if not dry_run:
+            built = activity_archive.build_missing_counts(db)
+            if built:
+                print(f"Recorded catalog counts for {len(built)} earlier months: {', '.join(built)}")
+    except Exception as e:
+        print(f"An error occurred during archiving: {e}")
+        db.rollback()
+        sys.exit(1)
+    finally:
+        db.close()
+
+    if vacuum and not dry_run:
+        print("Compacting database...")
+        activity_archive.compact_database(engine)
+        print("Done.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Move old activity logs into monthly gzipped JSONL archive files.")
+    parser.add_argument("--days", type=int, default=activity_archive.horizon_days(),
+                        help="Archive logs older than this many days (default: ACTIVITY_ARCHIVE_DAYS or 180)")
+    parser.add_argument("--dry-run", action="store_true", help="Only report how many logs each month would move")
+    parser.add_argument("--vacuum", action="store_true", help="VACUUM the SQLite database afterwards to shrink the file")
+    args = parser.parse_args()
+    run(args.days, args.dry_run, args.vacuum)
@@ -0,0 +1,61 @@
+import sys
+import os
+import argparse
+
+# Add the backend directory to sys.path so we can import app modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import exists
+from app.db import SessionLocal
+from app.models import ActivityLog, ActivityLogKeyword
+from app.crud.crud_activity_logs import keyword_tags
+
+
+def backfill(batch_size: int):
+    """
+    Split the comma-separated keywords of existing activity logs into activity_log_keywords.
+    Only logs without any tag rows are processed, so the script can be re-run.
+    """
+    db = SessionLocal()
+    try:
+        missing = db.query(ActivityLog.id, ActivityLog.keywords).filter(
+            ActivityLog.keywords != None,
+            ActivityLog.keywords != "",
+            ~exists().where(ActivityLogKeyword.log_id == ActivityLog.id)
+        )
+        print(f"Backfilling keyword tags for {missing.count()} activity logs...")
+
+        last_id = 0
+        logs_done = 0
+        tags_written = 0
+        while True:
+            logs = missing.filter(ActivityLog.id > last_id).order_by(ActivityLog.id).limit(batch_size).all()
+            if not logs:
+                break
+            rows = [
+                {"log_id": log_id, "keyword": tag}
+                for log_id, keywords in logs
+                for tag in keyword_tags(keywords)
+            ]
+            if rows:
+                db.bulk_insert_mappings(ActivityLogKeyword, rows)
+            db.commit()
+
+            last_id = logs[-1].id
+            logs_done += len(logs)
+            tags_written += len(rows)
+            print(f"  {logs_done} logs, {tags_written} tags")
+
+        print(f"Done: {tags_written} tags from {logs_done} logs.")
+    except Exception as e:
+        print(f"An error occurred during backfill: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Populate activity_log_keywords from existing activity log keywords.")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Activity logs per transaction")
+    args = parser.parse_args()
+    backfill(args.batch_size)
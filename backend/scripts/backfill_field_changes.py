@@ -0,0 +1,74 @@
+import sys
+import os
+import argparse
+import json
+
+# Add the backend directory to sys.path so we can import app modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import exists, or_
+from app.db import SessionLocal
+from app.models import ActivityFieldChange, ActivityLog
+from app.crud.crud_activity_logs import field_change_values
+
+
+def _parse(value):
+    if not value:
+        return {}
+    try:
+        parsed = json.loads(value)
+    except (TypeError, ValueError):
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
+
+
+def backfill(batch_size: int):
+    """
+    Split old_value/new_value of existing activity logs into activity_field_changes.
+    Only logs without any field change rows are processed, so the script can be re-run.
+    """
+    db = SessionLocal()
+    try:
+        missing = db.query(ActivityLog).filter(
+            or_(ActivityLog.old_value != None, ActivityLog.new_value != None),
+            ~exists().where(ActivityFieldChange.log_id == ActivityLog.id)
+        )
+        print(f"Backfilling field changes for {missing.count()} activity logs...")
+
+        last_id = 0
+        logs_done = 0
+        changes_written = 0
+        while True:
+            logs = missing.filter(ActivityLog.id > last_id).order_by(ActivityLog.id).limit(batch_size).all()
+            if not logs:
+                break
+            rows = []
+            for log in logs:
+                for change in field_change_values(
+                    log.entity_type, log.entity_id, log.timestamp, _parse(log.old_value), _parse(log.new_value)
+                ):
+                    change["log_id"] = log.id
+                    rows.append(change)
+            if rows:
+                db.bulk_insert_mappings(ActivityFieldChange, rows)
+            db.commit()
+            db.expunge_all()
+
+            last_id = logs[-1].id
+            logs_done += len(logs)
+            changes_written += len(rows)
+            print(f"  {logs_done} logs, {changes_written} field changes")
+
+        print(f"Done: {changes_written} field changes from {logs_done} logs.")
+    except Exception as e:
+        print(f"An error occurred during backfill: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Populate activity_field_changes from existing activity log JSON.")
+    parser.add_argument("--batch-size", type=int, default=2000, help="Activity logs per transaction")
+    args = parser.parse_args()
+    backfill(args.batch_size)
@@ -0,0 +1,91 @@
+import sys
+import os
+import argparse
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Add the backend directory to sys.path so we can import app modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+ACTIONS = ["LEAD_CREATED", "LEAD_UPDATED", "STATUS_CHANGED", "REFERRAL_MARKED", "USER_LOGIN", "CCU_UPDATED"]
+WORDS = ["called", "family", "paperwork", "intake", "referral", "status", "payor", "coordinator", "visit", "assessment"]
+
+
+def seed(rows: int):
+    """Point app.db at a throwaway SQLite file holding `rows` synthetic activity logs (before app.db is imported)."""
+    db_path = os.path.join(tempfile.mkdtemp(), "activity_bench.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    from app.db import engine
+
+    rng = random.Random(7)
+    start = datetime(2024, 1, 1)
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        batch = []
+        for i in range(rows):
+            action = rng.choice(ACTIONS)
+            name = f"Client{rng.randrange(rows // 20 + 1)} Lastname"
+            batch.append((
+                (start + timedelta(seconds=i * 30)).isoformat(" "), rng.randrange(1, 40), f"staff{rng.randrange(40)}",
+                action, "Lead", rng.randrange(1, rows // 20 + 1), name,
+                f"Lead '{name}' {' '.join(rng.sample(WORDS, 3))}", f"lead,{action.split('_')[-1].lower()}"
+            ))
+            if len(batch) == 20000:
+                cursor.executemany(
+                    "INSERT INTO activity_logs (timestamp, user_id, username, action_type, entity_type, entity_id, "
+                    "entity_name, description, keywords) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", batch
+                )
+                batch = []
+        if batch:
+            cursor.executemany(
+                "INSERT INTO activity_logs (timestamp, user_id, username, action_type, entity_type, entity_id, "
+                "entity_name, description, keywords) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", batch
+            )
+        raw.commit()
+    finally:
+        raw.close()
+
+
+def timed(label: str, fn, repeat: int = 3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"  {best * 1000:9.1f} ms  {label} ({len(result)} rows)")
+
+
+def benchmark(rows: int):
+    """Time the Activity Logs page queries with and without the search index."""
+    print(f"Seeding {rows} activity logs...")
+    seed(rows)
+    from app.db import SessionLocal
+    from app.crud import crud_activity_logs
+    from app.utils import activity_search_index
+
+    db = SessionLocal()
+    searches = [
+        ("search 'paperwork' (common)", "paperwork"),
+        ("search 'Client42 '", "Client42 "),
+        ("search 'zzz' (no match)", "zzz"),
+    ]
+    for mode in (activity_search_index.get_index_mode(), None):
+        activity_search_index._index_mode = mode
+        print(f"\nIndex: {mode or 'none (LIKE scan)'}")
+        for label, term in searches:
+            timed(label, lambda: crud_activity_logs.get_activity_logs(db, limit=100, search_keywords=term))
+    print()
+    timed("user 'staff7', newest 100", lambda: crud_activity_logs.get_activity_logs(db, limit=100, username="staff7"))
+    timed("lead 42 history", lambda: crud_activity_logs.get_lead_history(db, 42))
+    db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time Activity Logs search on a synthetic activity_logs table.")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Activity logs to generate")
+    args = parser.parse_args()
+    benchmark(args.rows)
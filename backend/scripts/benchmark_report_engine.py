@@ -0,0 +1,139 @@
+import sys
+import os
+import argparse
+import json
+import resource
+import subprocess
+import tempfile
+import time
+
+# Add the backend directory to sys.path so we can import app modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+DETAIL_COLUMNS = [
+    "Lead ID", "Client Name", "Phone", "City", "Staff", "Source", "Status",
+    "Payor", "CCU", "MCO", "Referral Sent", "Authorization", "Care Status", "Comments"
+]
+
+
+def build_config(rows_per_section: int, sections: int) -> dict:
+    """Synthetic report_config shaped like generic_report's Top-N reports."""
+    config_sections = []
+    for rank in range(1, sections + 1):
+        detail_rows = [
+            {
+                "Lead ID": rank * 1_000_000 + i,
+                "Client Name": f"Client {i} Lastname",
+                "Phone": "(555) 010-%04d" % (i % 10000),
+                "City": "Chicago",
+                "Staff": f"staff{i % 17}",
+                "Source": "Word of Mouth",
+                "Status": "Referral Sent",
+                "Payor": "Community Care Program",
+                "CCU": f"CCU North {rank}",
+                "MCO": "Meridian",
+                "Referral Sent": "01/15/2026",
+                "Authorization": "Received" if i % 3 else "Pending",
+                "Care Status": "Care Start",
+                "Comments": "Called family, waiting on paperwork" if i % 5 else "",
+            }
+            for i in range(rows_per_section)
+        ]
+        config_sections.append({
+            "heading": f"#{rank} — CCU North {rank} ({rows_per_section} referrals)",
+            "sheet_name": f"#{rank} CCU North {rank}",
+            "summary_row": {"CCU Name": f"CCU North {rank}", "Phone": "555-0100", "Total Referrals": rows_per_section},
+            "detail_columns": DETAIL_COLUMNS,
+            "detail_rows": detail_rows,
+        })
+    return {"title": "Benchmark Report", "generated_at": "2026-01-01 00:00:00", "sections": config_sections}
+
+
+def seed_referrals(leads: int):
+    """
+    Point app.db at a throwaway SQLite file holding `leads` active referrals
+    (every other one authorized) with a comment each. Must run before app.db
+    is imported. Returns an open session.
+    """
+    db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    from app.db import SessionLocal, Base, engine
+    from app.models import Lead, LeadComment
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    for i in range(leads):
+        lead = Lead(
+            staff_name=f"staff{i % 17}", first_name=f"Client{i}", last_name="Lastname",
+            source="Word of Mouth", phone="(555) 010-%04d" % (i % 10000), email=f"client{i}@example.com",
+            city="Chicago", state="IL", zip_code="60601", street=f"{i} Main St",
+            e_contact_name="Family Member", e_contact_relation="Daughter", e_contact_phone="555-0199",
+            active_client=True, authorization_received=bool(i % 2), created_by="benchmark"
+        )
+        lead.lead_comments.append(LeadComment(username="benchmark", content="Called family, waiting on paperwork"))
+        db.add(lead)
+    db.commit()
+    return db
+
+
+def run_case(fmt: str, rows_per_section: int, sections: int) -> dict:
+    """
+    Generate one report in this process and measure it. "referral" runs the
+    full referral export against `rows_per_section` seeded leads (sections is ignored).
+    """
+    if fmt == "referral":
+        db = seed_referrals(rows_per_section)
+        from app.services.referral_report import generate_referral_report_docx
+        generate, arg = generate_referral_report_docx, db
+    else:
+        from app.services import report_engine
+        generate = report_engine.generate_excel if fmt == "excel" else report_engine.generate_word
+        arg = build_config(rows_per_section, sections)
+
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    data = generate(arg)
+    elapsed = time.perf_counter() - start
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "seconds": elapsed,
+        # ru_maxrss is KiB on Linux
+        "peak_rss_mb": rss_after / 1024,
+        "rss_growth_mb": (rss_after - rss_before) / 1024,
+        "size_kb": len(data) / 1024,
+    }
+
+
+def benchmark(formats, row_counts, sections: int):
+    """Run every (format, rows) case in a fresh interpreter so peak RSS is not shared."""
+    print(f"{'format':<7} {'rows/section':>12} {'sections':>8} {'seconds':>9} {'peak RSS MB':>12} {'RSS growth MB':>14} {'file KB':>9}")
+    for fmt in formats:
+        for rows in row_counts:
+            result = subprocess.run(
+                [sys.executable, __file__, "--case", fmt, str(rows), str(sections)],
+                capture_output=True, text=True
+            )
+            if result.returncode != 0:
+                print(f"{fmt:<7} {rows:>12} {sections:>8}  failed: {result.stderr.strip().splitlines()[-1] if result.stderr.strip() else 'unknown error'}")
+                continue
+            m = json.loads(result.stdout.strip().splitlines()[-1])
+            print(f"{fmt:<7} {rows:>12} {sections:>8} {m['seconds']:>9.2f} {m['peak_rss_mb']:>12.1f} {m['rss_growth_mb']:>14.1f} {m['size_kb']:>9.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time and peak RSS of report_engine for growing section sizes.")
+    parser.add_argument("--formats", default="excel", help="Comma-separated: excel,word,referral")
+    parser.add_argument("--rows", default="10,1000,50000", help="Comma-separated detail rows per section")
+    parser.add_argument("--sections", type=int, default=5, help="Sections per report (Top N)")
+    parser.add_argument("--case", nargs=3, metavar=("FORMAT", "ROWS", "SECTIONS"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        fmt, rows, sections = args.case
+        print(json.dumps(run_case(fmt, int(rows), int(sections))))
+    else:
+        benchmark(
+            [f.strip() for f in args.formats.split(",") if f.strip()],
+            [int(r) for r in args.rows.split(",") if r.strip()],
+            args.sections
+        )
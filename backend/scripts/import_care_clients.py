@@ -169,6 +169,7 @@ def find_existing(db, client: dict):
 # ── main sync ────────────────────────────────────────────────────────────────
 def run_import(csv_path: str, dry_run: bool = True):
     db = SessionLocal()
+    started_at = datetime.utcnow()
     tag = "[DRY RUN]" if dry_run else "[COMMIT]"
     print(f"\n{tag} Importing from: {csv_path}\n")
 
@@ -319,8 +320,15 @@ def run_import(csv_path: str, dry_run: bool = True):
 
         # ── commit ────────────────────────────────────────────────────────
         if not dry_run:
+            # Leads written here bypass crud_leads, so schedule their reminders
+            from app.utils.reminder_schedule import refresh_due_times_since
+            refresh_due_times_since(db, started_at)
             db.commit()
             print("\n✅  Import committed to database.")
+
+            # Bulk writes bypass crud_leads, so refresh the dashboard counters
+            from app.services.stats_rollup import rebuild_stats_rollup
+            rebuild_stats_rollup(db)
         else:
             print("\n⚠️   Dry-run only — no changes written. Re-run with --commit to apply.")
 
@@ -31,6 +31,7 @@ def get_or_create_agency(db, name):
 
 def import_csv(file_path, default_status):
     db = SessionLocal()
+    started_at = datetime.utcnow()
     print(f"\nImporting {file_path}...")
     
     with open(file_path, mode='r', encoding='utf-8') as f:
@@ -106,8 +107,15 @@ def import_csv(file_path, default_status):
                 db.add(new_lead)
                 added_count += 1
         
+        # Leads written here bypass crud_leads, so schedule their reminders
+        from app.utils.reminder_schedule import refresh_due_times_since
+        refresh_due_times_since(db, started_at)
         db.commit()
         print(f"Finished: {added_count} added, {updated_count} updated, {skipped_count} skipped.")
+
+        # Bulk writes bypass crud_leads, so refresh the dashboard counters
+        from app.services.stats_rollup import rebuild_stats_rollup
+        rebuild_stats_rollup(db)
     
     db.close()
 
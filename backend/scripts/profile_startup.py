@@ -0,0 +1,79 @@
+import sys
+import os
+import subprocess
+import argparse
+
+# Add the backend directory to sys.path so we can import app modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+FRONTEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'frontend_app'))
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(FRONTEND_DIR)
+
+# What every run of streamlit_app.py imports before routing to a page
+SHELL_MODULES = ["streamlit", "frontend.common", "frontend.navigation", "app.db"]
+
+
+def measure_imports(modules):
+    """
+    Import `modules` in a fresh interpreter with -X importtime.
+    Returns (total cumulative ms, [(module, self ms, cumulative ms)]).
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([FRONTEND_DIR, BACKEND_DIR, env.get("PYTHONPATH", "")])
+    code = "; ".join(f"import {name}" for name in modules)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=FRONTEND_DIR, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        errors = [line for line in result.stderr.splitlines() if line.strip() and not line.startswith("import time:")]
+        raise RuntimeError(errors[-1] if errors else "import failed")
+
+    rows = []
+    total = 0.0
+    for line in result.stderr.splitlines():
+        # "import time:       self [us] |  cumulative | imported package"
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        self_ms, cumulative_ms = int(self_us) / 1000, int(cumulative_us) / 1000
+        # Nested imports are indented; top-level ones add up to the whole import time
+        if not name[1:].startswith(" "):
+            total += cumulative_ms
+        rows.append((name.strip(), self_ms, cumulative_ms))
+    return total, rows
+
+
+def profile(top: int):
+    """Print cold-start import cost of the app shell and of each page on top of it."""
+    from frontend.navigation import PAGES
+
+    print("Measuring app shell imports...")
+    shell_total, shell_rows = measure_imports(SHELL_MODULES)
+    print(f"\nShell cold start: {shell_total:.1f} ms")
+    for name, self_ms, cum_ms in sorted(shell_rows, key=lambda r: r[2], reverse=True)[:top]:
+        print(f"  {cum_ms:9.1f} ms cumulative  {self_ms:8.1f} ms self  {name}")
+
+    print("\nPer-page first-open cost (on top of the shell):")
+    modules = sorted({module for module, _ in PAGES.values()})
+    for module in modules:
+        try:
+            total, rows = measure_imports(SHELL_MODULES + [module])
+        except RuntimeError as e:
+            print(f"  {module}: failed ({e})")
+            continue
+        # The page's own cumulative time covers everything it imports beyond the shell
+        page_ms = next((cum for name, _, cum in rows if name == module), total)
+        print(f"  {page_ms:9.1f} ms  {module}")
+        shell_names = {name for name, _, _ in shell_rows}
+        extra = [r for r in rows if r[0] not in shell_names]
+        for name, self_ms, _ in sorted(extra, key=lambda r: r[1], reverse=True)[:min(top, 5)]:
+            print(f"      {self_ms:8.1f} ms self  {name}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report per-module import times for the Streamlit app shell and each page.")
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest modules to list")
+    args = parser.parse_args()
+    profile(args.top)
@@ -0,0 +1,25 @@
+import sys
+import os
+
+# Add the backend directory to sys.path so we can import app modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.db import SessionLocal
+from app.services.stats_rollup import rebuild_stats_rollup
+
+
+def rebuild():
+    """Recompute lead_stats_rollup from the leads table (run after bulk imports or manual SQL)."""
+    db = SessionLocal()
+    try:
+        print("Rebuilding lead statistics rollup...")
+        total = rebuild_stats_rollup(db)
+        print(f"Rollup rebuilt from {total} leads.")
+    except Exception as e:
+        print(f"An error occurred during rebuild: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    rebuild()
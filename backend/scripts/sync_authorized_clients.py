@@ -19,6 +19,7 @@ from sqlalchemy import func
 
 def sync_clients(csv_path: str, dry_run: bool = True):
     db = SessionLocal()
+    started_at = datetime.utcnow()
     print(f"{' [DRY RUN]' if dry_run else ''} Starting sync from {csv_path}")
     
     try:
@@ -232,8 +233,15 @@ def sync_clients(csv_path: str, dry_run: bool = True):
                 inactives_marked += 1
 
         if not dry_run:
+            # Leads written here bypass crud_leads, so schedule their reminders
+            from app.utils.reminder_schedule import refresh_due_times_since
+            refresh_due_times_since(db, started_at)
             db.commit()
             print("\nSync completed successfully.")
+
+            # Bulk writes bypass crud_leads, so refresh the dashboard counters
+            from app.services.stats_rollup import rebuild_stats_rollup
+            rebuild_stats_rollup(db)
         else:
             print("\nDry run completed. No changes were made.")
 
@@ -1 +0,0 @@
-LOGO_BASE64 = 'data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDAAYEBQYFBAYGBQYHBwYIChAKCgkJChQODwwQFxQYGBcUFhYaHSUfGhsjHBYWICwgIyYnKSopGR8tMC0oMCUoKSj/2wBDAQcHBwoIChMKChMoGhYaKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCj/wgARCANdBkADASIAAhEBAxEB/8QAGwABAAIDAQEAAAAAAAAAAAAAAAUGAgMEAQf/xAAYAQEBAQEBAAAAAAAAAAAAAAAAAwIBBP/aAAwDAQACEAMQAAACtQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADXGuSyrR2sXTip7WLJywrXJHTyO526/ADmWzSd7N8Y52d66u5269nz7PmvoCnymdzjRvzoHQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABzOdONcht4s8PFtzyxO4AAAAAAAAAAA9kY07bJb570Ype0HNTpkGgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABoc38kBD7nLxHikgcAAAAAAAAAAAAAAAdPMdt8p88l51tjVtxQHQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGPHVdYmK/gpEO5AAAAAAAAAAAAAAAAAAA6LbSsub+goqVjcHQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABpc21+OjqS98NyAAAAAAAAAAAAAAAAAAAAAA9tVU95r6EjJOPoB0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAARbm+oa8LQDuAAAAAAAAAAAAAAAAAAAAAAAANl1o3Znd3Y5S9AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAgXJKChvKR6dLbrOPbHYu2+U+eTuN2YYqAAAAAAAAAAAAAAAAAAAAAAAAAAAIhzGreLecO5AAAAAAAHp4kpfm6t2XHdjdX7JxzUZu7XO8rqc7xapJ3kJx2d3lK4voWruaCtUNvEcO4AAAAAAAAn7J89u87dYxUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAanIqrbNdYe2NP53hmYrhBWB3Pz3ycg6xtM1RL1OvozsAAAAAAAAAAAAAAAAAAAAAAAAABVrTo7mhujnt5wcAAAAAHp5nNWDNK/O9KdQ5oAAAAAAADjr1tdx88XOrVlyjuAAAAAAEnGHfobg74ekHQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEFO1DWIvfol6StWWtG+xrGxrHPSL9QqT8ulLtDk2J2AAAAAAAAAAAAAAAAAAAAAAAAAAA5aZfeLU6S2a6wAAAAMrJzUTaOr2Vg5sAAAAAAAAAABhmKrDfQ69SNdG5AAAAAASlv+e3mdukYqAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAot6oe56Do3LnSB2PSAj0gI9ICPscZO51LCdgAAAAAAAAAAAAAAAAAAAAAAAAAAAI6n/QYrc6i98pAAB09FtzTn7SVgdAAAAAAAAAAAAAAr1d+h1WkYYbkAAAAAsFf6OavYj6QAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFFvVQ1OLnIPu3O6iXoAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhat9Dr+5VwUil87RivmROwAAAAAAAAAAAAAAADDMUbluVNt5w7gAAAAC691dsUfSHNAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAISbwc+ft+i3nuchRLdO3aM7AAPPQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACtabX5qb0zQAAAAAAAAAAAAAAAAABULfw9xShbzgAAAAd90+fX6dsxioAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEfT/oHDqdK97OKkpXvrbmrRhWhNx3K7y0zVcscrBzQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFL4LRV7eYO5AAAAXOmWbNJ0SuAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4O85AaLM7msbbE6h+/pc6HNAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAaaH9CpW5cIpEAAABNQshzVzEfSAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAeYuZtXhuc+J1OPw7XBj3kijMCWQuBOq93kk895oBW7JFdxURbzgAAAN2k79DYZw9QAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAB5xudqE4dZtKlcvc3nmpbvLZz1t3M7qh3eSevgHXhzu824YgHAAABtd1JqYzqqzFi9xTm6TOwdAc3T4589Z4X8oAAAAF66Y+Qh6gdAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAANMP3M9zVLi1izRsW3jPA7gAAAAAAAAA97neBYpTO6jKWdjcbI+s7B0AAAACkccpF28wdyAAABbpWFmo+kOaAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOCu9xYoKIUl74awAAAAAAAAAdUrzUBtt3fndUlJhnencZ0DoAAAAAAAFWhbBX7ecO4AAAAss9XbFH0BzYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhXJOtRmusQ1MAAAAAAAA3THNQPXa+3O67L9bFA5oAAAAAAAAAAACBrVpq1fOGsAAAAT1lq9ol6AzsAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABr1VDWOyIKwBwAAAAAAAlLBndanZdiuORnYAAAAAAAAAAAAAAERU7fUKwDUwAAAJm1VK2yuGaAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAONTdT90lYg4AAAAAAdFm5qDsfclYObAAAAAAAAAAAAAAAAAjaddKXSAbmAAABKW+n3CVwzQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABz7aXrGnSVgDgAAAAA2Guck5SdsMzFQAAAAAAAAAAAAAAAAAAOKk3ij0iG5AAAASNypd0ncMUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEW5EwxfzA4AAAAAOp3y37N8rhnYAAAAAAAAAAAAAAAAAAAHNRb5Q6RDcgAAAO27Ue8TsGKgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAY0acrdIhuQAAAAAyNt0090rhmgAAAAAAAAAAAAAAAAAAAAGmhX6g0iG5AAAAdN6od8nYMVAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAYZxDlY1F/MDgAAAACyQ13xX0TsAAAAAAAAAAAAAAAAAAAAABh8/8AoHz+kQ3IAAADbfvn/wBAnYMVAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQE/WdYghXzgAAAADc7Zpfz2HpB0AAAAAAAAAAAAAAAAAAAAADH599B+fUiG5AAAAZfQfnv0GdvRioAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACn3CjbnyikAAAAAE1C2nO5oS9AAAAAAAAAAAAAAAAAAAAAAAGPz76D8+pENyAAAAfQPn9/xXYJ2AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAfP75QKRDcgAAAAFypt2xTtE7gAAAAAAAAAAAAAAAAAAAAAAY/PvoPz6kQ3IAAABfaFe8V6BOwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGih3mjUiG5AAAAALlTbRmk2JXAAAAAAAAAAAAAAAAAAAAAAAx+ffQPn9IhuQAAAC80a74r2CdgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOWjXyh0iG5AAAAAJiH2O39hnD1AAAAAAAAAAAAAAAAAAAAAAAa6BfqDSIbkAAAAutKueKSAncAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADH599DoW5aRSIAAAAAFmnaDeJX3DNAAAAAAAAAAAAAAAAAAAAAANFDvVFpENyAAAAXGnW/NJQSuAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAplzrOpwQrAAAAAABJRp36F7VLVH0ejmgAAAAAAAAAAAAAAAAAAAAOWjXak0iG5AAAALbUrXmkwJXAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAARUrg58/Z4X8oAAAAAACQjzt66fn0zOtocPdigOgAAAAAAAAAAAAAAAAAAcFLuNOpANzAAAAWmrWjO5sS9AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFVhrtSa+cNYAAAAAAAAbtJ2U6YJztk2Vdztp9qp21eVY5aFXFnVgWfGtCyq0LIrYsmNdFiV0WD2vOrB5ACf8gROoITvkGcnPIQTaEE15DCZ8hxIR53gOAAAALNWbJnc+JegAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABU7Zo7mhtuq3nBwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABYa9P53ZBL0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAARVR+hwO5VoUiAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAnYKc5uziPoAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAgK39DidyqTZrpEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABNQsxzVrEfSAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABzVa5O4+eLZXax5R3IAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACWiZXmrcI+kAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAB56ImDuTWPni9xO51pJcGsYBwAAAAAAAAAAAAAAAAAAAAAAAAAAABJxkhzVzEfSAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA89HHxTLua7zWt3lO1XZ3lGwvhyhL6KF7fBRc7uKVncjtQztjir52U7XM7AIDKdcQmUydh0wIlLCJSwifJcQ/kyIXGcED5PnK7jZHVYwtQqWu4nKXrvDvKFr+gj54+gau8oi7anKctervKyn9HeQ/ds2FtEfSAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAx4qprFhiopufThpdz0dUadsk7Q77OnozQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABwdtH1jTg20jjOy/ZOvBv6Gd8nFMO8gZ450HQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIWrSkXWC11q+c16J1AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAonPt1W80ncKnbJ2DOwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKJzykXbzyFz+f3zFNgxQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACEq/0Gj0lzWCv+6x9CQU7G4OgHnoAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4e45QNd3q9Y8HZxu5sG6suasXDFiQudAvud5DFAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOGOn3c1daHeV3rl3O6tpzoOgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAf//aAAwDAQACAAMAAAAhAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKOLAhyDSyCwABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFIQDDDDDDDDDDDDBkPAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABbBDDDDDDDDDDDDDDDDSKJAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAUiDDDDDDDDDDDDDDDDDDDDUCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABgjDDDDDDDDDDDDDDDDDDDDDDXKAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACQDDDDDDDDDDDDDDDDDDDDDDDDDDAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACP1cJAAAAAAAAAAAAAAAAAAAAAAAAAAAAG7DDDDDDDDDAiAhChxGALDDDDDDDDpAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAF/5ghUsAAAAAAAAAAAAAAAAAAAAAAAAAAAGKDDDDDDHMgAAAAAAAAADkDDDDDDDVDAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAARotNNQ6AAAAAAAAAAAAAAAAAAAAAAAAAAAADDDDDDO7AAAAAAAAAAAAQFLDDDDDDiAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQ788886AAAAAAAAAAAAAAAAAAAAAAAAAAAAAADDDchAAAAAAAAAAAAAAAhDDDDDDWAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAT/AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAWDGgAAAAAAAAAAAAAAAAQEDDDDDDqAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAC/kAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABgAAAAAAAAAAAAAAAAAATLDDDDDmAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAH/etsqAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABDDDDDQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAATjhBAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAmDDDDDSAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAANJOKBBKOIATDDDDDWIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADENCTxiBSjDDDGLahAAVDDDDDDKAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABGAjDDDDDDDDDAMSCAAAAAACDDDDDKAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAALrjDDDDDDDDDCAghAAAAAAAAAgDDDDDrAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAG4jDDDDDDDDCZgAAAAAAAAAAAAADDDDDDoAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAdBDDDDDDDHfggAAAAAAAAAAAAAAAgDDDDDLAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAHiDDDDDDDNTAAAAAAAAAAAAAAAAAAjDDDDDiAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJiDDDDDDHyAAAAAAAAAAAAAAAAAAAACDDDDDAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACpDDDDDDCQAAAAAAAAAAAAAAAAAAAAAADDDDDpAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAASDDDDDDDxAAAAAAAAAAAAAAAAAAAAAA9DDDDDrAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAASiDDDDDDCAAAAAAAAAAAAAAAAAAAAAAAdDDDDDiAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAUDDDDDDCCAAAAAAAAAAAAAAAAAAAAAAAVDDDDDCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADDDDDDGAAAAAAAAAAAAAAAAAAAAAAAAVDDDDD9AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJDDDDDDTAAAAAAAAAAAAAAAAAAAAAAAAVDDDDDwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIDDDDDDEAAAAAAAAAAAAAAAAAAAAAAAAVDDDDDCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAgDDDDDDBIAAAAAAAAAAAAAAAAAAAAAAA9DDDDDDAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAASDDDDDDDGAAAAAAAAAAAAAAAAAAAAAAAoDDDDDAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADDDDDDDDRAAAAAAAAAAAAAAAAAAAAAAAKDDDDDEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAASDDDDDDDDABDAAAAAAAAAAAAAAAAAAAArDDDDDTAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPDDDDDDDDDCRDgBzjTzDTyggQwBRBRxgDDDDDDAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAASCDDDDDDDDDDDDDDDDDDDDDDDDDDDDDDDDDDDWAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAATDDDDDDDDDDDDDDDDDDDDDDDDDDDDDDDDDDDQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAzDDDDDDDDDDDDDDDDDDDDDDDDDDDDDDDDDDBAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAATNDDDDDDDDDDDDDDDDDDDDDDDDDDDDDDDDSAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQAlJDDDDDDDDDDDDDDDDDDDDDDDDDDDDDGAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAARQwDCShwzAhjCSAAQyCjgwTRy1LLFVAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAANMvMPAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABf6yxiAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAUwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA3CAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA0gAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwoCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABZvNuEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABgSBAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA/9oADAMBAAIAAwAAABDzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzbvUz0z+y5/wD63888888888888888888888888888888888888888888888888888888888888888888888888888888888888/0t/wD/AP8A/wD/AP8A/wD/AP8AOr3888888888888888888888888888888888888888888888888888888888888888888888888888888887g9//AP8A/wD/AP8A/wD/AP8A/wD/AP8A/wA2/wDPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPX/8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/ALffPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPz3/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AI18888888888888888888888888888888888888888888888888888888888888888888888889d/8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/APu8888888888888888888888888888888888888863D+788888888888888888888888888886s/wD/AP8A/wD/AP8A70uNNdd8503/AP8A/wD/AP8A/wDT8888888888888888888888888888888888889/H8deT88888888888888888888888888858/wD/AP8A/wD/APX/AM88888888/U/wD/AP8A/wD/AOrzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzi7/8A/wBKfPPPPPPPPPPPPPPPPPPPPPPPPPPPKdf/AP8A/wAbvPPPPPPPPPPPLPN//wD/AP8A/wDXzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzz73333nzzzzzzzzzzzzzzzzzzzzzzzzzzzzzj/wD/AJvvPPPPPPPPPPPPPPOP/wD/AP8A/wD3Tzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzy6rzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzwn/TzzzzzzzzzzzzzzzzyzD//AP8A/wD93zzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzy77bzzzTzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzyfzzzzzzzzzzzzzzzzzzy/f/AP8A/wD9Xzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzw3Qw13Tzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzz//AP8A/wD/AO888888888888888888888888888888888888MPsN88888888888888888888888888888888888888888888888888888d/wD/AP8A/t888888888888888888888888888888888888888888888888888888888888888888888888888888888841+xy924408v/wD/AP8A/wDPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPNajHb7rvP/AP8A/wCMF3/PP9//AP8A/wD3vPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPMMrP8A/wD/AP8A/wD/AP8A/wD+H9888888e/8A/wD/APV88888888888888888888888888888888888888888888888888888888888888888888y0/8A/wD/AP8A/wD/AP8A8Z3f/PPPPPPPPPP/AP8A/wD/ALzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzz4Z//AP8A/wD/AP8A/wDKW/zzzzzzzzzzzzz3/wD/AP8A97zzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzjz/8A/wD/AP8A/wC6nnPPPPPPPPPPPPPPPF//AP8A/wD9fPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPOXP/AP8A/wD/AP8A7+888888888888888888e/8A/wD/AP8A/PPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPJPP8A/wD/AP8A/mfzzzzzzzzzzzzzzzzzzzzz/wD/AP8A9zzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzz3X//AP8A/wD/AMe8888888888888888888883/8A/wD/AP388888888888888888888888888888888888888888888888888888888888888M//AP8A/wD/AOz/ADzzzzzzzzzzzzzzzzzzzzwr/wD/AP8A9Tzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzpz/8A/wD/AP8Ao88888888888888888888888A/8A/wD/APf88888888888888888888888888888888888888888888888888888888888889/8A/wD/AP8A/FvPPPPPPPPPPPPPPPPPPPPPPAf/AP8A/wDyvPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPOP/AP8A/wD/AOvzzzzzzzzzzzzzzzzzzzzzzzwH/wD/AP8A9Dzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzx3/wD/AP8A/wDr888888888888888888888888B/8A/wD/APP8888888888888888888888888888888888888888888888888888888888888X/8A/wD/AP8A6/PPPPPPPPPPPPPPPPPPPPPPPCf/AP8A/wD7PPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPP8A/wD/AP8A/wDt088888888888888888888888C/8A/wD/AP8A/PPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPCv/AP8A/wD/AP8Ab88888888888888888888888/wD/AP8A/wD6fPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPLP/AP8A/wD/AP8A+78888888888888888888888c/8A/wD/AP68888888888888888888888888888888888888888888888888888888888888u3//AP8A/wD/AP73uPPPPPPPPPPPPPPPPPPPPFv/AP8A/wD6fPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPf/wD/AP8A/wD/AP8A7DjLj/XfDLjj7XfDPfz7zv8A/wD/AP8A+rzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzyzT//AP8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A/PPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPOP/8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A/jzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzxzX/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A/wC88888888888888888888888888888888888888888888888888888888888888888r7//AP8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A+3zzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzyz3Tb/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A+rzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzyzx5xw01/xw4z8z0888xw7256+8bvH/vzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzB8z5nzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzB4/337zzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzx+TzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzxTTzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzx5TzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzS3rzzTzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzz5CyxzTzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzw70z/zzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzz/xAAxEQABAwICCQMEAgMBAAAAAAABAAIDBBEhMRIUIDJAQVBRYBMiMDNCUnEQYYCBkSP/2gAIAQIBAT8A6Y2Nz90JtG854JtE0ZlCmiHJCNgyAQAH8EA5oxMOYCNLEeSdRD7Sn0kjcsUQRgfFQC42Cjo3OxdgmU0bOV/lcxrxZwUlEDiwp8bozZw8RAJNgoqMnF6ZG1gs0cCQHCxU1Hzj/wCIi2B8OhpnSY5BRxNjHt4WaBso/tPYWHRd4WASbBQUgHufxE0QlFinsLDonwljC82aoYGxD++KqIfUbcZjo8cZkNgo6Zjc8V7W4Isa7MKalsNJnGsYXu0QoomxCw+J9RGzMp1aftCdVSHmjK88ytN3dCV4yJTamQc02tP3BMqI35H4quLROmOfRQL4BRRiNtlUVBvot/hkjozcKN4e3SCqY9B1xz4yCT036RQIIuPglq2swbiVJO+TM/FHUPjyyUVQ2TDn8D2h7S0pzS0lp6JTN0pP0pHaLSVYqxViqMmxCqxdl+Np6j0zouyQN9mWVsYu5S1DpMMh8uSp6q/tf8FbHYh46JR5lEgYleqzuF6rO4Xqs7heqzuFUSNMZAPHU1Roex2WxPUiP2tzTnFxueApai/sdtzM02FvRKQ2cQpm6TCOiU1Rb2O/ioqdH2Mz4LJU8vqNvz252aEhHQ436Dg5Agi4U8BYdIZdEFU8M0effhKeT03/ANHbrW4h3RIKjQ9rskHBwuE6CN2YWrR9k2JjcgqgASG3Vad+nGDtVjbx37dFa4txBQqZBzRqZO6dK92Z6tRPxLdqYaUZHillonstB3Zem/sV6T/xK9CT8ShTyHknQPaLuw/mndoyDaIuLeFtaXZBNpZHckKJ3MoUTeZQpIxyQp4xyQiYPtC0GjkrDZJAxKfVRtyxT6x7t3BElxuf5abG+3ILPI8HZC9+6Eyi/IptPG3krW+JzmtzKfVxtyxT6x53cE57n7x24jdgP9bU4tI7wWKnfJjkFHSsZnifjfMxmZT60faE+qkdzsiScT8VMbxDaqfqnwNkbpDZqipWsxdififKxm8U+t/AJ8735n5qQ/8AkNqr+qfAoKcy48kxjWCzfhkqWMwzKkqnvyw4Gj+ntVn1PAaen9T3OyQAAsPglnbHnmpah8mGQ4Oi3D+9qs+p/rwCnh9V2OSAAFhtk2xKmq7+2P8A6r34Si3DtVu+P119jC9waFGwRt0RtkhouVPUGQ2GXDUW6dqt3x1+ji0W6Z5/BUz+obDLh6HI7VbvDr0bNNwagLCw26uXRGgOfEUOTtquzb16lF5Rtk2FypHl7i48RQ5O2q77f99eoh7ydupdoxniaHJ21XZN69QjeO3W7g/fE0OTtqu3R16i3Tt1gvHfiaHJ21W7o69Rbp25GabS1ZcRQ5O2q3cH769QneHwVcWi7SGR4ii3TtVn0/8AfXqN1pLd/gewPGiVNCYjY8PRbp2qz6fXo3aDg5Z/A5oeLOUtGRizFOaW4OHC0W4f3tVf0z1+lk02W5j4iAc0YIzmFqkXZapGtUjWqR9lqkXZapF2WqRdlqsXZarF2Wqxdlq0XZatF2WrRdlq0XZavF2Wrxdlq8fZavH+K9CP8U1gaLNG1VfSPX4JfTffkgb4jolV9I+AUs+j7HdEqfpHwGnqre16Bv0Ko+m7wKKodFhyUc7JMs+gzfTd+vBI6p7P7TKxh3sE17Xbp46Xcd+vB2zPbkUKuQc0K1/YLXndlrx7LXj2Wuu7LXX9gtckWty91rUvdazL3WsSd168n5L15PyXryfkvXk/JevJ+S1iTutZl7rWpe61uRa5J/SFa/sEK482oVw5hCtZzBQq4zzQqIzzT5GOYbHl/lbFTukxOATaeNvJBoHJFjTmFUxsYRo+P08XqOucgsAFLVEmzEXuOZTZXtyKfIZDd3j9O3RjCq32AaOfkbcAFV7/AJHGdJoKrG4h3kdJJcaBUjBI3RKfG5hs7yJri03CiqGyYHAotDhYo00Z5JsEbcgqxtiD5C2Z7citakRqJDzRN8/8Lf/EADcRAAECAwMJBwQCAwEBAAAAAAECAwAEEQUhMRITFCAyQVBRUjAzQGBxgZEiI0JhELEVgKHB8P/aAAgBAwEBPwDhi3UN7RpC7QbGyKwq0VnZAEKnHlflBecOKj8wSTj/AAFEYGA+4MFH5hM68nfCLSV+SYRPNLxNICgoVB8qqUEipMO2ghNyL4cnHXN9PTtUOKQapNIatFQucFYbeQ6KoPlEqCRUw9aAFzYrDjq3DVZr4FKik1SYl5/8XfmAQRUeTpibQzcLzDr63jVR8LLzSmTTEQ24lxOUnyWSEipiZnir6W8OfiGH1MqqMIbcS4kKTh5JccS2nKUYmJpTxpgPFSkxmVUOBjHgzrqWhlKh2ccXhcI+tV+MJcWjAwxO1OS58+NccS0kqVD76nlVPZNyjrmAp6wizR+aviEyTKd1YDDYwSPiM2jkILDZxSPiFSTKt0Ls0fgqHJR1vEV9OykH8oZtWIw4KTQVMPul1dd0SsqKZa4pSHGUuiihDrZbUUmJN3LRQ4jxkyznmykYwpJSaHsGZBa713CGpZtrZF/ZPSrbuIoYflVs3m8c+wbWW1BQ3QhYWkKG/gk4vJaP7hpOWsJMVEVEVET4GUCIkVUcpz8bNyudGUnagilx1WWFvGiYYlEM34nn2pFbjE1JU+tv47CznagtnglobKYAKjQRmXOk/EZlzpPxGZc6T8RmXOk/ESrS0ugkHx05KZz60Y/3qS0mXfqVcP7hKAgZKRd4CdlafcR768u5m3Argk+mqAYYVkuJPBJ2Ur9xHv8AxKSeX9bmHgiK3GJpjMroMDhryy840k8DdbziCmCCDQxKzIcGSrHghkkFzL3cvCTbOdbIGI17NXVKk8EmZXOfUnGFJKDQ3QmZdTgYM47zhbzi9oxKkloV4rNN5t0jdrWeqjtOfBVISoUUKwZRo7oEm0N0JZbRsji1pIuC/bWllZLqT+/KlRGUOcZxPOM631D5jPt9Q+Y0lrqEGbZH5QmabWaIv9j/ADNoymVDWBoawDXyUpaU7RpCp1lO+sKtJP4phVpL3AQZ9474M28fygvunFR+YLiziTFTqgEmghuRdXiKesN2e2m9V8JSEigH8qGUCIw1mjVtJ/Q8juPttbRhy0ugfMLm3V4mCa49klCl3JFYRIOqxuhuz207V8IbSi5IprvjJcUP3rSpqyn08ivTbbV2Jh2dccuFw7NuXcc2RDdmqO2YRJNI3V9YAAuHZTgo8rWkjVlPkNx1LQylGH51blybh2TbDjuyIbs7e4fiG5ZpvZHbTw+8daRP2R5CmZpLIpiYccU4cpR7FmSccvNwhqSabvN58DaHe+2tZ5+z7+QZubDQyU4/1BJJqewYlVvYYc4ZlG2r8T4O0e9HprWd3R9fIE1MBlN2JgkqNTrgEmgiXkAPqd+IApcPCWltj01rO7s+vH3HA2kqVuh1wuqKla6UlRoMYlpQMip2vDWltJ1rN2D68fn3spWbGA7CUls0MpWJ8PaW0nWs3ZVx51zNoK+UEkmp15BjKOcVgPEWlin31rNwV7cenTRk64BJoIabDaAgbvEWlin31rN/L2/949aKqNgfvXkkZTw/XibSxT761m4q9uPWkdkeuvZw+4fTxNpYp99azdpXHrS2k69nqo7TmPE2lin31rN2z6cetLaTrsrzawrlANbx4i0sU++tZ3eH049aQ2T69hIP5aMg4j+vEWltJ1rO73249aCatV5dg2stqCk4ww+l5NRj4e0tsemtZ/fe3HnUZxBTzginYIWpBykm+GbQSbnLoStKxVJr4W0e9HprSHfDj881m3KjA9kCReITNPJwVAnnucae9Gnvc4097nGnPc4057nGnPc4057n/wAEaa91f8Eaa/1f8Eaa91f1GmPdX9Rpj3VGmPdUaW91Rpb3VGlvdUaU91RpT3VC1qWaqNdaR74cfmWc8jJ37oIINDwSS75P/wBu8gTsrlfcRjv4JKd8nyDNSWV9bePKCKXHgUr3yfIT8qh683HnD0q41iLufAZbvU+vkR2SacvpQ/qHLPcTs3wttaNoU8cx3qfUeR1S7SsUiDIsndBs5vcTH+NT1R/jU9Uf41PVH+NR1GBZzfMwLPa/cCQZ5RoTPT/caGz0xojPTGis9IjRmukRozXSI0ZrpEaKz0iNEZ6Y0NnpjQWeX/TBkGeUGz2v3Bs1vcTBs0blQbNVuVBs5zcRBkHhugyjw/GG2nEuJJScRu/2tfmktXC8wuadXvpBWo4mEurTgYk3VuA5W7y/NP5pNBiYAKjDMkkCrl5gNoGAhTLasRDbSWhRPl+aXlun9RIt1UVnd5jUakmJEfb9/MbqclZESC/pKfMc81RWWN8NOFpWUIbdS4Kp8xKSFjJVD8qpo1F4hKik1SYE26N8KmXVYmJBRKSD5hXLtrxEaE1yhMq0ndAAFw/0t//EAEwQAAEDAQIFDA8GBgIDAQAAAAECAwQABREGEiExURMWMDJBUFJTYGFwcRAUIiMzNUBCQ2JygZGSoRU0VKKxwSBEY3OC0SQloLLhZP/aAAgBAQABPwLk47JYZ8K6hPWadtuE3mWpfsinMI0+jYJ61U5hDJO0bbT9aXbM5XpbupIpVozFZ5DnxpUh5W2ecPWqionOT2QtQzKIpMqQnavuj/I0m05ic0hfvpFuTU+elXWmm8Inh4RlB6slNYQsHwjS09WWmbVhu7V9I9rJSVJWL0kEc3Rm882ym91aUDnNSLdiN+DxnTzCn8IJCvAoQ39aenSnvCPrPNf5E24ts3trUk8xqPbUxrOsOD1xUfCFpWR9tSOcZajy2JPgXUq5t3otcWltOM4oJTpNSrejNZGr3Vc2QVKtuW9kQQ0n1aWtS1XrUVHSfKASDeMhqJbEuPkK9UToXUO3Yz2R29lXPmpKgoXpII0joolTWIo784AdG7UzCBaskVGKOErPT8h19WM84pZ5/Losx+Kq9lwjm3Kg2+253MoamrhDNSFJWkKQQpJ3R0STZ8eGO+r7rgjPU23X3r0sd6R9aUSo3qN53ihTn4ar2V5N1JzGrOthmVchzvTug5j0Qy5bMRGM+sJ5t01Pt1569MbvSNO7RJJvOU7zWZbLsa5D97jX1FR325DYcZUFJ6HVqShJUshKRumrRt4C9ELKeGadcW6srcUVKO6d6Yct2G7jsqu0jcNWbaLU5Hc9y4M6Ohu0bSZhJ7o4zm4gVPtB+arvirkbiBm3sacU0sLbUUqGYirHtVMwam7cl/8A9uhgkJF5NwFWpbmduF73P9UolSiVG8nd3uSSkgg3EVYlq9tDUXz38bvC6FpUlqK1qjyrh+tWnajs04o7hng/73xSopUFJNxG7Vi2kJrWIvI+nPz8/QpaVotQW+67pw5kVMlOy3cd5V+gbg3zYdWw6lxs3KTVmzEzYwcTtsyhoPQla9qphjU27lP/APrTri3XCtxRUo7p31suaqFJC/MORQ5qbWlxAWg3pOUHkdOtGPDHfFXr4Iz1Jt99Z7wlLafiadnSndu+4ffWqL4avjSJL6No84nqVUe25jR7pYcGhQqBbLEkhC+9OaDm38tq1hGBZjm97dPBpRKlEqN5Pkoy5qYs2W9tGFXaTkprB6QrwjjaPrTeDrI8I8tXVkpNiQk+jJ61ULKhD+XRX2fD/DNfLX2fE/DNfLRsuEf5dFKsWCr0RHUo05g9HO0ccT9adwdeHgnkK68lP2VMZ2zJI0py0QUm4i4+S4NTrldquHIdp/rkbbFs6mSzEPdecvR1USVG9RvPYQhazchJUeYV2nJ4h35aWhSDctJSecdmxbXLZDEpV7fmqO5v1b1omI2GmfDL3dAom83nP5GBebhnqLY0t/LiamnSuo2D7CMr6lOH4CmIrDA7y0hPUNlejtPi51tK+sVKsCO5lYUpo/EVLsiXHy4mqJ0o8jSopUFJNxGWrLliZES552ZQ5+ReEFodrt6gye+KznQOwASbhlJqzLCSEhyZlPF022htOK2kJHMOw42h1OK4kKHOKtSwxil2Hn4v/VZuxg5O1Zntdw92jNzjfnChpSZiXfMUm7yJppbq8VpJUrQKhYPrVcqUvEHBTnqLBjxR3lsA6d3yOZZ0aX4RFyuEnIan2I/HvUz31vmz+RWBM7VmYqj3tzIeRUl5Mdhbq8yRfUh1T7y3V7ZRv7GDcC5PbToynaf7/iwlhBp0SGx3K9t19iBIMaW26Nw5eqgbwCMx34mRkS2FNO5j9KnRHIb5bc9x07OlJWoJSCSdwVAsBa7lSziDgjPUeO1GRisoCR5PaFlMTATdiO8IVOgvQl3Op7ncUMx8hsWX23BSSe+J7lXInCl/FYbYHnm89iGyZEptoecaQkIQEpyAZB/Fa7OrWc+nduvHu7NiO6rZjJOcdzvzaENuawW15/NVoqVHcivqadFyhstnWU/MuVtGuEagwGIae9J7rdUc/lTraHUFDiQpJ3DVrWMqPe7HvU1ujdT5Bg9K1CcEK2jvc+/kThE7qlpqG4gBPYwaSnt4rWQMVO7WrN8Yj41qzfGI+Nas3xiPjWrN8Yj41qzfGI+Nas3xiPjS3WihQ1RGbTRz9jBVd8R1Ohe/VqQETmbjkcG1VT7S2HVNupxVDYm0KcWEISVKOYCrLsNLdzkzul8DcFDIMnlttWPnfiJ9pA/bZwbjeM9WdI7ahtO7pGXr5EWkrGtCQfXOyYJ7ST1p/ffu2LOTOavTkeTmOnmpxCm1lCxcoZxsEGG7NdxGh1q3BVnWezBR3GVZzrO8FvWVtpMYc60/vs+CsjK7HPtDkRN++P8Atn9exFiPyyoR0Y2Lny19jz+I/MK+x5/EfmFfY8/iPzCvsefxH5hX2PP4j8wr7Hn8R+YV9jz+I/MK+x5/EfmFfY8/iPzCsHojsRl3V0YqlHTv5bdmCWjVGhc+PzUQQSDkI/isqzHJqsY9yyM6tPVUdhuO0G2U4qRvFb9ndrOauyO9KzjgnZrPf7WmtO7gOXq5EWknFnyB657GCqrpTydKOQ9u2Xq4MiOO+jbDhfw2NZJlEOv3hj/2pCUoSEoACRmA3jdbS62ptwXpVkNWjEVClKaVmzpOkbNYr+r2c0rdAxTyHwia1O01HcWArsWK9qFotKOYnFPIi3rKxsaTGGXz0j9ezYlk9sXPyB3ncHCoAAXDIN5bchduRDijvqMqf9bNgo94Zk+0OQ+FEfHjIeHozcers2NNEyILz31GRXIi3rL1O+THHceenRz1Ydl9tK1Z8d5GYcKgLhcM28+EEPtaZjpHe3co69lsN7UbTZO4ruTyHebS80ptYvSoXGpsZUSStpe5mOnsQpTkR8ONHLujTVn2izNR3Buc3UH+NKgoXpII5uQBy56SAlICRcBub0WzF7agrSB3ae6TsqFFCwoZwb6aXqjSFjMoX8h7Ys8Tme5yPJ2p/anG1NLKHAUqGcdhJKTekkHmqNbctkXKIdHrU3hGj0jCh1GtcUfinfpSsI2/NjqPWqncIXz4NtCfrUifJkeFeURozCsF3caEtvgK5VW3G7WtBwDaq7obLYTuq2WzpT3PIi0rOZnJ7ruXBmWKnWbIhnu03o4ac2wYMNPtvLUptQaUnOeVWFEfHiofGdBuPVsuCjl8d5vQq/kVIsmG+by1iq0pyU7g4j0T6h7Qo4Ovbjzda3XuObpGDh8+R8E01g/FTt1OL+lMQYzHgmUA6eVctrV4zrR85N1KGKSDnGyYLOXTXEcJHR5bbOo2k8NxRxh79ksFeJajPPk6PMK2rnGHdIxdkhL1OWyrQsdE9401qiOGn40X2hndR81GVHGd9r5xRmxh/MNfMK7fifiG/mr7Sh/iG/jX2rC/EJo2vBHpx8DRtmDx35TRtyDw1fLRt+H/AFD/AI0cIYu4298BRwja3GF/GtcV+REbL7VRpE+RlMdtlOlZ/ahfdlz/AMOEjePZpVwFA7IM9NKx2kK0i/oaclR29u82P8qXa8FPpweoUu34idqHFdQpWEaPMjqPWqlYRu+awj3mlYQSzmS0PdSrcnHz0jqTSrWnH059wFG0Zh/mXPjRmSTnfd+ajIeOd1z5qLiznUr41n2SNDfknvLSlc+5UTB455Tl3qoqLCjxR3loA6d3+O0W9Vgvo0oOy2arGs+OfUHQopQSL1EAc9PWpDa2z6SfVy09hCwnwTS19eSncIZB8G22n607a01zO+oezkpbzrm3cWrrPkzEd583MtqX1CouD768r6ktjRnNRbHiMZcTVFaV0AALgLhsJF4up1OI6tOg3bJYSsaymPePr0IyJ0aP4V5IOjdqRhC0PANKXzqyU/bcx3aqDY9UU4646b3FqUec+UR4ciR4FpSueo+Dzysr7iUDQMpqNY0NnOjVD69JSEi5IAHNstroxLSkD1r9kwaN9mDmUeg6RKZjC95xKalYQoGSM2Vc6qk2nLkbd0hOhOTygAqNwF5qPZMx/M0UjSvJUfB0Z5D3uRUezIjG0ZSTpVl8hwjTi2or1gDsmCx/4Lg0L6DJtqxYuRS8ZfBTlqZbsl68M96RzZ6UorN6iSdJ8nZYdfNzTal9QqPYMpzwmK0OfKaj2BGb8KVOn4CmIzLAuZaSjqHkmFSbprZ0o2TBQ94fHrDoKn2pHh5FKx3OAmp1ryZV4B1Nvgp8njwJMjwTKiNOYVHwdWcsh0J5k5aj2PDZ9HjnSvLSQEi5IAHk+Fie7jK5iNkwTP3kdXQRLlMxW8Z9eL+9Wjbb0i9DHem/qfJo1nSpPgmjdpOQVGwd3ZL3uRUazosfwbKb9JynyvCwd5YPrHZMEz36QPVHQPadtoYvbjXOOadwU+84+4VvLKlc/kkeM9IVcy2pfVUTB5xWWS4EDgpymotmRY20aBVwlZfLsKh/wm/b2TBQ/wDMdHqfv0CvOoZbK3VBKRumrVthyTe2xehn6q8kh2VKlXEIxEcJWSolhR2bi9e8rnzUhCUJxUJCRoG8GE4/64e2NkwW+/r/ALf79Ak6Y1DZx3T1DdNWhPdnOXuZEjMkbnkcGxZEi5S+9I9bPUKyo0XKlGOvhK3jwkH/AFavaGyYM+Mv8D0B2lPbgtXqyrO1TpqXJclPFx5V5/TyKBZEiVcojU2+EqoNmR4eVCcZfDVvLhCP+qd9367Jg340T7J6ArTnNwWcZWVZ2qdNSX3JLxcdN6j5DDhvTF4rKb9J3BVnWMxGuU5313nzDee3fFUjqH67Jg741b6j+nQDOltw45cc9w01LkuSny66cp+nkNmWGp25yXehHA3TTTaGUBDSQlI3BvRbPiuR7OyWB41Z9/6dADriWW1OOG5Kcpq05qp0grORA2qdHkEdlyQ6G2klSjVlWQ3EAW5ct/TuDeq1vFsn2DslheNWOv8AboAwhtDV3e12j3pGfnPkEGG7MexGh1nRVnwWoTWK2O63Vbp3rtLxfJ/tn9NksXxpH9rl/b07tSNiNnvzmbmHkFnw3Jr+I3m85WiocVuIyG2hk3Tp3sn5YT/sHZLJ8ZR/bHL5xaW21LWbkpF5qfJVLlLdVu5hoGzwoy5b6Wms5znRUKK3DYDTXvOne2Z90e9g7JZuS0I39wcvsJ5lyUxUHKcq9nQkrWEoF6jkAqyYCYMe7O6rbHe6T93d9k7JByTY/wDcT+vL11YaaUte1SLzUp5UiQt1edR2fBqBcntt0ZTtP973veBX7J2SL96Z9scvcJntTgBA9Iq7Z7MiGZLQ35udXVSUhKQlIuAyb3veCX1bIz4ZHWOXuFngo/Wdnwbi6jD1VQ7t3L7t8HPBq6tkRt09fL3Cty99lvQm/ZojJkSW2h5xupKQlISnMMm+Dng1dWyDOKTtRy8wiXj2oscEAbNguzjzFuH0af13xc8Grq2VrwSOrl5aase0JB9c7Ngs3dCcXwl74ueDV1bLHysN+yOXjysZ1atJv2awE4tlM895+u+Lng1dWywzfEZPqDl2+cVlxWhJ2exfFcf2d8XPBq6tls/7hH9gcu55ugyD/TP6bPg+rGsprmvH13xd8Grq2Wy/Fsb2By7tM3WdI9g7Pgq5fDcRwVb4veBX7J2Wx8tmR/Z5d2mL7PkewdnwZe1OeWzmcTvjIyMOeydlsTxVH6uXc4Xwnx6h/TZ2HSy8hxOdJvplwOtJcRtVC8b4SskZ32TstgeKWPf+vLt0YzahpHkGDEvGaVGWcqcqerfCbkhv+wdlweP/AFTXWf15eS04kp5OhZ2eM8uO+h1vbJqJIRJjodbzK3vtHJAkf2zsuDfitPtHl5brep2o9z915BYtomE9ir8CvPzc9JIUkFJvB3utXxbJ9g7Lgz4t/wAzy8wqaukMu8JN3kNi2qYpDL+VjTwaSoLSFJIKTuje22cllyPZ2XBfxer2zy8wkZ1WzirdbON5FZlpuwTdt2t1BqFNYmIvZVl3UnON7LdyWVI6h+uy4LH/AILnt8vHmw60ttWZQup1BadUhWdJu8iQtTagpCilQ3RUO33W7kyU6onSM9RrViSNq6Eq0Kyb1YQm6ynfd+uy4K/dHfb/AG5e4TRtTlh4DuXB9fJWZLzPgnVp6jTVuTUZ1pX7SaRhE757CD1G6k4Ro86Or3KoYRR91p36VrhjcW78K1wxeA78K1wxeA78K1xRuKd+la4o/FO/StcUfinfpWuJjiXPpWuJjiXK1xMcS5WuNriF/GtcbXEL+Na42uIX8a1xo/Dq+atcaPwyvmrXGj8Mr5q1yD8L+f8A+VrkH4X8/wD8rXJ/+X8//wArXGfw3561xn8N+etcZ/DD5q1xr/Dp+atca/w6fmrXG5+HT81a43eIR8a1xu8Qj41rie4hv41rif4lv61rif4lv61rif4pr61rikcU19a1xSOKa+tHCGTxbVa4ZXAa+Fa4ZXAa+FHCCXwWvhUy1pEtgtOBGKdA2XBT7u/7XL21ovbcJaBtxlT18i8Ez3uQOccvsIoXa8nVkDvbn0PIrBL+Z/x/fl9NjIlxlNL3d3RUhlcd5TTguUnkTgnt5PUOX9u2d221qjQ7+j8wrNn5EYKfeH/Z6ALesrHvkxx3Xnp08/IjBT7297H79ANtWPj3vxE915yNPVyHwV+/Of2/36ArWshEu9xm5D/0VTzS2HCh1JSobh5C4L+MFewegObCZmN4ryepQzirRsp+H3XhGuEOQmDPjL/A9AtoWIzIvUz3pz6GpkCREPfkdzwhm5BYNeM0+yegYgKFxF4qZYcZ7K13lfNmqXY8uPlxNUTpRRyZ9/8AB3xo31HoJkwo8nwzSVHTu1IwebOWO6U8ystP2LMazI1QeoacbW2bnEKSecb+WD41Y9/6dBikhQuUARz07ZkN3bMI92SncH4qtopxHvvpeDh8yR8U0vB+UNqppXvpVizh6IHqUKNlTR/LqowJY/l3flrtST+Hd+Q12s/xLnymu1n+Jc+U12s/xLnymu1JP4d75DQgSz/Lu/LQs2Yf5dz4V9kzvw6qFizj6H8woWFN4KR/lQwflndaHvoYOyN11r60MHHd19HwrW4r8SPloYODdkflrW4j8Qr5a1uNcev4VrdY41ytb0Xhu/Gtb8ThPfGtb8ThPfNX2BD/AKnzV9gQ/wCp81fYEP8AqfNX2BD/AKnzV9gQ/wCp81GwIel35q1vxOE98a1vReG78aOD0bccdo4Osbjzla3GuPX8K1uJ3JB+Wjg5ok/lo4OL3JCflo4OvbjzdHB6VuLZPvNGwZg4s/5UbEnD0Y+YUbInD0B+IpVnTE547nwpUWQnOw6P8TRQtOdKh7tisPJasfr/AG6P1NNq2yEn3UqHGVnYa+WlWZCVnjo91KsSCfREdSjSsH4hzKdHvpWDjXmvr94pWDi/MkJ96aXg/KG1U0r30uxZyfRX9ShVmwZTFosKcYWEhWU/+Nk4tLaSpaglI3TUu32G8jCS6dOYU9bkxzaqS2PVFLnSl7aQ781dsPcc581JmSU7V935qZtma36THHrCouEKSbpLV3rJptYcQladqoXjo/tO0moKbj3TpzJqZMemLxnldQ3B/HFa1eQ22POVdSQEgAZh0fWvaAgsZMrqtqKcWp1ZW4SpRznsNNrdWENpKlHcFQ8HyRjS3LvVTTVkwm/QBXtZa7Tjfh2vlFLs6IvPHb9wup+wIq/BlbZ+NWXZDkW0NUcKVISO5I09Hzi0ttqWs3JSLzU+SqXJW6rdzDQOxGYXJeS00L1GrOgtQmrkC9Z2ytPSJhPI1OKlkZ3Dl6uzg5D1GLqyh3xz9OkXCJ3VLSUNxACexFa1eS03wlXUkBKQBmHSLaCsec+rSs9jB5GNajfqgnpGk/eHfaPYwZ8Zf4HpGtBOJOfToWexYTmp2ozz9z0jYRNanaSjuLAV2G1ltxK050m+o7qX2EOIzKF/SLhPG1SMh5IytnL1dnBueE/8V05DtP8AXSK4hLjakLF6VC41PiqiSVNK9x0jsDIbxVk20lYDUs4q9xemhlzfw4wxsW8Y2jo/taAmcxdmdTtTTzS2XC26kpUNzsxLQkxfBOHF4JyimsI1elYB9k1rja4hfxpeEfAj/FVSLblu5EqDY9WrJkKTarK1qJKjiknn6QLQgMzUXOC5YzLGcVOsyREJKk4zfDT/ABsheqp1MErvyXUg3oBIuvGbpBk2VEkZVNYqtKMlO4OJ9E+R7Qo4OyNx1r61rdkbrrX1pGDh9JIHuTTNgxEbfHc6zTEdlgXMtpR1D/xev//EAC0QAAECAgYKAwEBAAAAAAAAAAEAESExQVFhcYHwMEBQYHCRobHB0RDh8SCg/9oACAEBAAE/Id3J49QXT4COWaF7dKQ3cS7qhd2Ltvb2XViSpmLz8tMKqK6CCu/s/dToSyXVHn2XN7YkzCr2oZPVJOOGdpOGk6jBYcyn0BKzGn1iNBg5DUrfhGCZRVNzrNNxbckOc3UPZwtLAJMrBOQc4OU61FT80bHWkc6wJFIJEJkxHdZph558yFz3Ijg8KHvR6csE6D3zyK+wCWvDwXTOWCaseB+lFQgCODwkgnqRywTUXqRE8aEUmEmSXJ2E4QLQwFPw0nIPCFiwomuAmhHmvpGRSSZOxqkz9daNxdIov4OxWIEjAJsVARQwCms+I+yb+IyLVHplGMbxWODZcKzMcak4Wg1B72YSwb0BBLYGFoeuDByMA5JMAp6syOqKkKckXJ2cUsQ4IoQAgAEKn3wWMAxyrKoI7cHITPaI2IpwEwU4EAwVanBR5QKEYm01BFbxQSKhtN9vnBTGgDgkQ3dYlRaPpHXG52qAa5vn7IBgVhSNzmFVkf6I+FYigobseByCJ58wjLkLQIAyNRUfBpYrjtwIAsKD7ooQpyTM6qBJgJNQTGXqxdU2Nljkp8Vgeyn17FK8ZygL0kSlzyanOE4UsRD7jrAnnAZ9k9kOy2T4QKCNVtbBmg07mmj2wD0eyOTCRJJifizTjyhv1qsc418m8EhNX7FOW2TgMB+6vRCEJKJJ1MgAElIBNZO7DpNCxUWP0TCtGJz0rVdfJ0qBQ+wG26TRDFjPUjOCmEUFQXAbluWPAo4Rj7j8CYyQwApUQXiAMBehIH0NfBwX6Hk10gImZ8qEQSIIYij4IZ0NzOWG2TmEEBqIo1IWN1C6B4lXNIK+zMebUxhI8sVqVKqQ4IhixnqLI2w80HcqkMy1F5d0+AjewhNA/owMKwCivj8EeLYykhHDgcHbAqKgiZVhCbtHIaxp4cNgByV1t/XmhV8+YRN51e6iud4pU+IdRxGO5oKdySnscDH32+KFfBNQpQJ2YAKB/UCXDHRfJzBwuwh22zDZGLETXSBgisaUyxZ87hSmW7bRa1MZEBVnXN9g1B7DRHYc17kxjgDv5+GPc5DmiYe1+JX4lfiV+JX4lfiVOQEJUDEPgxeu5j621D9h6w2IoAtiDoi6jYByUwYTh3laAAAAAQAGuhIj0+69NOYRGAuCECpBdT3IzTx3HggjG94iCzWJQdAOwYnSU2Qv0PobAeEVkezTsmZw+h8bkZ/W+HwNhgBuatuW1W3LarbltVty2q25bVbctqtuW1W3LarbltQZalgwwAs24VjB8lV6E2SGINH9Dbp3oIJTQhTfsKWA8DI2mM5NzZA9EC4cS3Hybx+Bla7kfvcccMZw0PaIYsZ/wDIKQkfqgvVYCA2GLgMwnwDppHOL46EPW48K4I7Ht8BPWeF8NyL4ulWPkhkgE/OCEggAYAUbFCRObavTJmqF0PjccovHEX33+BAwRhoj847kPo2iDoWIoCAa8+kAAAAgAKNjvLJyypDNeliBE532248EUAgRxO4UH4gLECSCooUZaiIj3/RhNW36JxuAAAgHBmCg5BmABgNkRMucCjSkFYIL0KUyOI3HdrMSWkaybEo+AkRyJMQhga1Y80QIpZlFmD+VaE6UBO4t8uSewaUT0An5MekcnepiTcvP2+lcBkEsD6bciCbKsY1hENnRPpoJI10wJBh53qaD1w+9K4RlDiPrckhwxiEZBEyqEQ5sR1O4oWgoU/LKoWMfyozZpLOij9aAc8zvWOnFioRQtiMRpHpk9iD9nh4xobvJ3fSXjHnB4eNrTFhHzpLR714TOK1YERzBgUmN4KQC9BKKYiLHlkRlQh+1Uh3ehB0jd6EBI1xoGWF9kNMYHlUz3iEXnJKQ/KaiXSiUEBeDSIDfzD6PgfOkJgNSsh+YcGSQBEspr9RB1PbxFdONHcoXoQERIXhXdMnypBdXypqO4eFNE/KKpkryUwV5IklEk6RjCLDBiim68c0GW2x5v7rOYXs40ttfa4KWkAJk5sSj0p0BKtgqRja5KRLUA7E+Y5nVnWZDHU2/BM5NrTpJCQQJAaFwKRDJ8afq0j0qHILgiJusL8gTqDFYxPgqd5ircPGOsEYNYYc5JoTSMpLXk/SSBxFIA2lvP80fOkbVX8+eB11WkxOCfS27HJPIPLJ0U9XGCiSADpgJ3k0oZijZeSmMhNt6oAAMAw1B8/iN40j9Yew4GOLCt2NSIMsZzo1PcyOTq78dfJkJ2x0Amo2sPQC6iEc9UyGxOkuqTpwKBHEAcakUd6l7nV2tyUx1Cmiw27mmMhrSdkkEACQAbV74dl70nWPfgQyoFApuBRQ14PWoRLlzE6q0F3zhUi8C8n0meA5w627VwdPrSXkJ14D1USc90VI6dUOLliAxTBnADJMRErVrzh6vE6S8T+jgLP8ArIKmST9yyzVIoZYvZT8gbnKhIKyAw2A4artHSEw6y7OAhFdubYnrXLfbUgHLCaDgv0hFcExsG3OFWw3rAvXSGza/BwDsv5n9E5kZCgKhqUdDoJ3BAhWWIcKtiuWJPo0htah6cAqkur3pdsf7BqL1YUsLwplYBSHIGxwdrIGkNsjFwBMvZTnUnlUoUBUNQAJLCJQqlgdxUpdFgbIF3cn0htkTcAB0RnE/TBVT3qFCLILImi3vZQPpKJr13cAHSJIxnYagJW48htUTYp+ywXEJ6REzWTb/AMskDqDqAcJhjQCmu4XhVnZgEMTPb0htHbf4fSASxQ03NygacPHIArKGZARJM6zs0CQifh0hujlO/wB4sGoGnPsNYUlALREW9V2zsqq0huquw39PMxBLAirT11mnsIAmgU7PZpVpDYgo7u/p5zeXCPrTia9IqBCQBMAoGz4r/wBtITFMh3t/c/qGnfKIO3aHXtJDcEIjfyI07nP1ppx47gpQnGGwWbQ69pOuRuezfyrbpL+dM0qEC/6PtHr2liJZ7b+W7g66auhrADaPXtKTuvsb9ksCVad9Wmtk45to9e0rgU9nfu1wdNPlLTtHr2lNyT9e/eSGLT27ec20er9tKbsZxv28czaeJcX8CPraOaVaUndkb9sPM2nfBJYiI87RJ3V2NKTuV+537tu77Tyv+KJo4GJtAgWZDtaUnue/v3aujoiGLGent5P5hz77QN0ZDt6V6wD1b+UetOunOgxHvsREoUqjVs83dXZ0pPYh67+NOgwGI1B4pJoayBCBOCKdnE2ThpTzLN/GoECHeD96icAkMKX1QqaOCODs0plpdKTiq7Q38ZUQOCR76kzcUxErqkyqQqGBswsEdGleBUfYb+Apc88UOdjDw1KVWAjEJqAVl6lNQKLcgQQ4LjZN4CPRpTz6m/td0rmRqpPnKEBa6Dwg+pCFSWL4VCV32QZiHB7X4T2vwntFyBcPZfi+y/F9kXoc1P2wv2wvwq/Cr8Ks19LMfSzH0rQq0KZWVZMrlZMrkW4OZ1L9x6X7j0ixB28v1S/VItQ5hZn2WZ9kaHMvWU9llPZFSBgfa/Qe1+g9oqQsftDDTAl4GGOlOBZ7b+t+7GyyIILGB3Kxk99/pC48MX3uUUtEW/yQOMKygp80mNtu5Jwssd/6BhBuQiCRAMRRuQcGlvfgBRfxD0LdyChVv6OAMlEweq1YiCCQQxG4xQbXZwCtxjyW2qffbcULG7w4BxkCPQCjhAWPK8UbiG1/wcBCHDGSgzNGA6VCM3RQjFjuETW3AZOQiQIIcFPr+J5E8hibpNASIBiKDt8mjz7HAkXgA3MEfNhxnNRsNY50mrHBGG3Da2Pc4GOZqgHTw2JpHxUwzAVG7vuUvS8PHwoEywWKmnOIiDkIyUfx999mDwiDDnFJsZAT2D2qAC/2Imd+FTq+H6RsrcS8KgK4yhTZN6dRcPuhS8h7QpeSWXC/DekGomN30vxHpZf0WX9Fl/RZf0WX9EVIFwel+Z9IuwCLnpFSWI9IqQwCNByqOd+6+0+6pSvP2qfrwQhcoYKXC4SkO5VMd3sXZE5dWhXXMYm0JYiOrh/1RhKm2wqSO43ZSlNdomfCMlLgoaYvB5XR0IeFQhRLuIHAH+bKZWAjAJ5WJfOcHmVMBiX7hS1Y1NRqBn7QQRbXHJEpcAjUHh/LJoZ6moJ+kihhcD+yTcJAlsBgOHzkZBn7mxHsm5KfiWzYCCOo+JQkMVWoDTZLq5CSaJsWcig8pppUkufD59IBLFS9m5QPh6geVpQW0EWZeuIj55i4+2+QV2Q9FHnPiK35+0efgwGiQIbAYDiLlpv8COMug/fEbKq/gxPYdOI2Wm/w8zIzzDiNn9DePiUZAwRBoYOIsZRpefff5MlqRzNdPEU+gAFilegvyg/BEBCCIghCfggWV6oogAJAgyI/kjEngcOieH8kozxmxGcGxL5ZwyfiIQAHq2V+HQmp81CHmwfHmno6Rd5OIGdgQrCq8EBxjV/ZDOgIA5dENhAJKjiBOafgCWz0ieXO9k8jhazwg7Aiw+ieyFX3IoCZrgdEwjf5ej//xAAtEAEAAQIDBgYCAwEBAAAAAAABEQAhMUFRYXGBkaHBMFBgcLHwEEDR4fEgoP/aAAgBAQABPxD05LAzEbkmaaDOTpzgdaljRkukGp8SYKJxQdKnAJ9C1TOI1u1S8q/SloiDZm43/Ow2JyOVRlpyMcpooGBofE1BxLK74gNGBrb8vR0Npg/I1FC+19dAVhA+OnE9s1RaTAlunHhVsQsdjOg1OpcDerB0aUzRJ6YUqqqq5v6O13zejSwUxmOSOZaZTFl495ZOE0VgiWCN6h6e1ofVkEuLUSGtJh+TgNTBHIw7XflFYqVFtxf2FIhKIR2NORHjI42YXNNlQETa6d2HDiFB8GQAaiY+1E2yJB4IX44U9hjCG2mA4zSOVZF03DA4fvEjbKPFu3emS2tG7wY9RuoSsQoGontIsURn+hm9gp0i2nhfTDnSSPlZGqvkUnxZ5pdxDSkSwxD9rN9/tDMCDWGgXfilUFJeJ78OC+2lazK5V1XyZ1YYCshtODY8ErNJi3WgxHY+zpjxhgNVagduWM32O95U+IJST/Wzyko1MF5oh3xKJQTlifQnn7NlGUkTjWTfwGmV0Frwc216eWB+I1CqazBxYTkOvEbPZdpXBwBiq4FcXknwflwM6ePhUhxVcfLgpUXhRgjV74qsBnu5meOvstZcMMdAZtPWxnG2jF2YHXzEHPnYBcRqHIuUYEHyZO/2UmCSX2gMeVPOwbLRGXy5+Zrahd1HUSyVm1o7xXNziOnslg2CxzdXTmqRAxJV+5ea2/VE52JsYnLOgVnQkQkfRzyUEw33mA2sVPHVgnNq2OVJgziOlB0pZVriv81CxT6w0GkcQKm5D1qTW1AK6dljj54W/odw+HZyz0p8mF5RxV/VEsLAErRoHCA50J4VIMwEV0DrQInsQ15y61FTZv8AySsbm/8AKtICTGrdqv49g/BR6F3fhSpiR2b5Wk004EB0HrUoCMBV5QrVA4BvzHEprioUJwf1Xd86xtNw4m2dfRrrhG8Cz1HXJlsaR8mU1Vx/G1QwfIpLA4n6lbajB8n8qzUalcAWe3luwEAoRuJ5yO1FbdENpkNy6UmNVCVXFX9NsaQCVdAoEu4nWmz+Khl0u9/cXc+FENlTLfieL4qR10UbnE4UFeTE7+5uc6F3/MTbgcopGBAwjiP6QYjrQgyJRZbHMkvwbJv9FnLx708jToG8/BqyDSpwAoc0ZAN7LrsLb6HnUBDyPwFGoSHrQxerlBzk3naxy0pyyoUQjp+H0nrS4Eb7DcmnnKzGGNls8iPF/SwHvpXTKjzLew5o/AmiBG4Tn4r8C36a4SWsLqpbiGhZExWMdufeTwpEBAwjifo3G0TNv59h2Oz0U0cNAxWQbVg405NS5hOAbAgN34HtLD2TvOBsnX/oisZkEE8ieI6/gsQcTMsOS0eYAGYkj5xL1vGIeG0P5K2MsNl7hk+O3JpQjQCgFVuMJcjqd1HIfBcZxF3/AK8ab3DXcr5bavWKLjdOTsb/AKAoyWSsAIz4oW4iHfPomMCgjPDOKn8LajxUFwBeFGpFFYCA/wCijCfKHOI4/lli7O3D4ecmQTAS1JqOZnTgE2eCTMfFlTdvhPO3sNtFjIQM1d8jYW/aM7sTg0cMc4BfS+Jnr+hZtRK2P5VvRJSpDU4MS6rl+GOjExMZtjT693r693r693r693r693r693pCqRGNJvrO6FPwiUhHYD3XnSEA1huuov7ruVLMajk+FeJQIN1D4BEzvubZhvoYjAEAGQfuIIiSOVEjDJ1nUtdeTSkhhx8ZbxSEImCVO0jgZWOoXj6IVpmQ5M7fmampqampqfz9Zp52ho2msDV00cnjSOPkwhiPgZsCkmoXXQxasB6AcM+A4z5AUWGRcTMtdTjr4+F+R2pAnCXB9FLGEGCRzMYicHDwosWLFixYsWLPIu8vESnNfPNxGkEY/g8NzoSDQoxE/wCrLXHLwxDN24HShqbbEWasVdXyFBESRoULCmsvdlo208YUoP7HM0BIKJEzPQ6vYic29/w4UIHaj6HCYIh4RiGnrvpGBAwjiP8AwtNJxgZGmp5ahkGRADIPI3cnTmPesyRAibB35O0fGTe3jgp4S4+h3Cg1bY+Rc/wN95mAGC7BR4eiIFhCZhzDXUzx1n8OZaZQrV0+dCdEFADADyWQIaQuY6gW2hSIokJ4t/bDeh3MHZBsYeAPwSCoS40KCAzKxbdHWfRGK+JeNxDVmZbsJD5ktA4bmbnhrRe1AIAYAeT5EyRab5kf6eKzEH3MQwfJw9DlcW2RPmmgZAgXA3nWT8Q9uYHDT4pFJyjGzTRtOMf9ICoAxWhy+oHkGEk2+gBKCQEiaNGHoKAYAGHlBlhcO+cN5JxKbN/EnHITIMnxXRgUB7+hyMHK9g5po5aPGmuiLhX4X2MqI1EwqyrImt3YXjNBTNKa8EKuKNKA50MZjLtI0WDuEK6h0rOwb4QDxqCpahocnU9VLiatlrsnCDgeLMadgUweiCUJEFIbB0OSU0PPYKb81sf+wVgu1HazZSWDds3FvVQ40M1t9Ic3xXwkhsifRMGAQhEkavD9XWusF3KkQXIvWJ8UDeIN+GpJAM0XtTUgsxOpFICDMKck9abBP/bj6rHuwTpC7gw0lBBmSMJ4k1IQDUUdPbw6fAAl8HDxJlMDXBfMe3kA7LwzUPly8RZ+BV2BnpPtMhiDjSWI8SiVOMVKOtBSPqHvShd8IHeoJK2N3p9ImiUsGYoArb0H2oAmRqqKpYaukLd9x5lbZGR3FdQmhD9mt9MashJK5WKm30pNNghnfFEJswAuwljn/wAjcBh0Fn4hCMUNXenpY9/ZmZENVipANYj8kzQLImXw5UwLZQnQqeNAekg00x/1oipiD3rrSV48Y5GpW7fRKN77ZnxTYr+utQlkwl96DQVZZHepwxqs+JrWY8QcHWiyA3b+4sjkO+iQKQlPvd/+41JgOx8gPFdxlC7wHb2URhWIAcWo1io6vkdaWCWCI+XpUqT6yBdQ6UizDRPED1rH14nyr+sRzxmQ3uBxpDGU4Pws5u6pYs1xnZb0ULSIGAGwPBLHiW5pjELRpCO3iTsyu7IHwHsi2iBN7cxo3JaDfwSvSpYLkRjiPKKfrTKt6v7BUfZIu9wOdO4xEXdZBzaiUOm8kcw1aBkIDgeLAxAlNnib62sexwlPxJycLvArI1I8e0F3mULjqYfo4nitKpVVcV/Xat0LJ3BT1xCaHJu4FIXFlgn22U5fiBualwcIokILAEB+gRZ4jjbWufsZwP21kXaw4mdlTIaQbw2vDgG+nv7KaNq/r3YpDKDelihn7iWTiHWoZrid6OtBQWpi34ni/qAKYQu0/mPENlX5qjt7FCMGwoLtYcV9lPJthApzXobKWWX9Z54R8UWCiwzPqxAcmsImZq/TKh6tAwDYH68UDEncvxDrfg3V49vYhE2zntoF2oAMkwVtHQc2kZFGVWVf1S1OVcYYTwmufXRqgTZgHe1mUcIrDD9r/R5D4iK8+CX8+wzYlwp+PZxacMe623KsbhrTBoGAbD9TUkqvEwHFqZoY9UwOE0dvGD1vY4B+8ouX18TglM2WVv5fYUMxyiDcauwvUrbqDBbRhsOP6ZdtRy2q0NQ+ArGiBLJ3ceK1geHMuB5BawVk6WfEcCIK832EvZW0PYB8uBRGeGdb76l/SQgVMAYtBmjMyDXF5xRZmQQnYw4CdvkclCeGYO/iDImQnV7Byngo65q6DNpJFuFsgGR+lmZ6QJ57vsbaKWJGIejg8lBzNojcd/EhUf2jt7BK4goG+o6DNpP6OAyDINP0RJwx9TNMdlA35sdfe7fdRYgw8mc0JEvsft4jQWJJ9gQgqlgxkR3cipnMgNxLIP0AQqMAEq1OJLOxbWXZjuozlxFB/Lt8oM2C/kHt4gy2JiewA1o6cg77KvwC5tqu1ivDL9BAz2PAzVwA1aLeFMiV0LntX0jyqAxNyI0J8TAcyPsANO137FjvwN8un6FhqRxOL4MWgcKkW7t0ND/fK2OSjObxGbis5o9frZIWG/zORtZypVVbr47i2CSda6uhnQWrxN+TN+PLMM4zn8QWuBTvY9fE6cXIEtS4C4MDsdV8eWqkoWeOyOtisqCNtP8ABkeWijKIOPxBkEQ8yevsHZGHAvXSXca+OOWIMqWAppCg95yF0dbvl33+unHw3PJUQ+vQdraZBLTGFLNGQ2BBw8cYimlbDeOBsnXy8ibc7inF8NmEKB0t9erNBGnKl1Bx8eKoWPv3FsG1oPRxoAIA8vCIxTOanF8MmUJO6Hr1EE38eIMhREuDBxu8TzD7fRpxfDUrROtKB1J9eRNIeNGLxsrksTUu4EvCiykiwAQHmH2+jTi+G0YxB80yGKV5evICZD8q6rxhnSIttB0eYvt9GnF8MxKcAyKzrZ68h1kG3CD48YHQmSjJR1XzH7fRpxfDMSjFwWcvruZMiavbN23p8Y4pHNkXQPMft9GnF8MpCgKLbvru+kXncnx74dXmJ9vo04viM0yWnW313fJEhTXxwCmJwyfCeYoHWA+VTi+IbcEXIHrtiiWHmjxxbFrMwXdeY/WaqcXxLJRHKSdvXd7ou8k+OcUMIv3CHHzGyMyo4qcfEZuKLkXruzcozfY8dqo2oQzG5woLLaNBPmDjwm89OPiBCZQHZ67Rfw52ikQIDCeOGPHMxTY3Kf6eYHYyDz+KRgSY5nf12kkNOoWGbB+PG3M6DNbEk41Iimqb5y2jby8V5hNt/wAVzMWDq7+vFiIeNYl6z+giIwxsoHczNxQ5MPyBuI6eXK0JkuaO/iyRmYPdb14a6EW9fH6PNTqlHTXWZYmlHOEIA5ieWyluKW9Dv4oiYyPXjcKNJq7EuH6RFGWgNpebo1GWQ80u4k8sVQTPMH38W0+q1n15kgEuwJ3pxg5clQ/pOS6X9wSjw0C0Rq/0b6B31naS2eC0aEmCMj5TE75ZvO3isnkevQsbX0LBg8yXP9Ugw+RHLChgM2jnCo+JzWus0Bfdh8hSBlsrnZTwoaflChREBa/k+fMlLMlDvX2HvX2HvTMwp9cq+3dq+3dq/wArT/I0/wAj+UUTGxJlNX+6r/uqz0TJLT8zhxyi5FQ+Pyee6yOqtf69H+vQ8tnVlT/Bo/waAjn/APkaNQHO2ickqUKS6vFJlXFj72evSFkJngHEnipkCDCOI+igYjJM3n8PX2OgrhbEGycHHT0Urput/T18Q8YSlHB2j3KZwmWQyGokJv8ARMUzF4nGH+fr84zJgLhd38zlnTlFQohHT0QZmSnD+/sAgLgTcJiHUZ444+h4YOo3fyewJR66bBmQ6s2V8WbIhEhH0MgRsyewSEaBORfh/pTxDgEcTU2noUglhgGvsGxXiyj/AEs2pX8jFwfsnDb6EsOj6rt7CAgCiEc6xNsrybfkOTQZLI6HMNzD6CQRgJ5T29hinfBgaI41cdJbJXa8OCUgyeElu3C5RtpSioQhHz+HWQccb7exKjLkYXIetOo24bhCEOdMobrPNHRT/X5vU88OZkT2MnuMIgeDQeZBS5sqXU2AAOCT1qYrTJJ1OypBy0DOsOtTsB2qetYy974GmTGaN8FMhTFSKfTu1fTu1fTu1D4Xq1wDtP5KPGIsYHzWGhvOm2hFhSJxaP6E1BXvVRyVQW1bB0U6MavgHMq+5V1grPOChy/dhUgktzg6ISZfvSiKpFBrAOoaXNlPacqm05VNpyqbTlU2nKoEG0+4/BuyWmF6xm1ZWjBtaV7VOtja3eojcZSKLJFtphLlsHdQ52HdujUqiZWlqk4/GD8hWHb6O9I33yUGXiX4VKW7MRzinId0b5FKGER2+DK4meYDv7fIIiCOI1JXfHvBXWf/AIaNeIHzFS8y/RK0IyGwBzoEy/1Iipp0c66KpKCylOtAVN+nylDAy4MEVSQP/NkLLpPBtWkiPaVh3t3lxp8t8AGHEeUUuuyQzkNfd+9Nyrs/lpYBH9xI6qBerDCNq78l3UzJhESEjDfD2/sMmIaNF/scqcnbk3p3Mf8AuWqVpkKS8CWgIGGwAID2+Lw43ANS0dW1OdEzKn8L+uJ5futPolDZRsW3Id9ExfOW8G3SgACCwf1UWl/iiucGmVrR/U60+K0cSwVcQVnlf2+J04uQJadlC4LFgcMdqv4dzDGgzTIKNMJG3Q00HuIsHxkdNjiuR/OHcyC81h9MNPcVpUCXtMS6rl+Jyr3GQpLymgXnGwAID3FVtmQbpx0/BqzxEMOo9xvpdf4AgSp3YM9k+4zrkQDdOOn4JjDrjh1j3GYcQJpMS69X4fKEvapPipwmyqS47Rk4e4rIiThp3dwOb8kSbasL5MTbOp7igMUXNENA+tkYGwO+0fwuBxCETBGjFAMx95fB2ZiUKUSJqf8AITakmIxQxj2/g28JMHPbOlmofBFjiam38/cZSLDhFBQRd8+CPzWrQ4pbVnkUTBso+YryipxGEoDEu1PcCyxoAbh+B6U6Mm4Q7GPFba/9tjQfQMkBWPpYhpKO09wEAgEbI0lcMU5wXcSmVB0fWj4oW95p0VN3mI7acEWZa83so0AZie4AetWShCkLvcXj/wCXr//+AAMA/9k='
@@ -15,6 +15,7 @@ import json
 from app.db import SessionLocal
 from app import services_stats
 from app.crud import crud_users, crud_leads, crud_activity_logs, crud_agencies, crud_email_reminders, crud_ccus
+from app.services import reference_data
 from sqlalchemy import func
 from app.schemas import UserCreate, LeadCreate, LeadUpdate
 from app.utils.activity_logger import format_time_ago, get_action_icon, get_action_label, format_changes, utc_to_local
@@ -67,7 +68,7 @@ def view_activity_logs():
             # User filter
             if st.session_state.user_role == "admin":
                 # Get all users for the dropdown
-                all_users = crud_users.get_all_users(db)
+                all_users = reference_data.get_users()
                 user_options = ["All Users"] + [u.username for u in all_users]
             
                 user_filter = st.selectbox("**User**", user_options)
@@ -100,9 +101,14 @@ def view_activity_logs():
                 entity_filter = None
     
         # Search box
-        col_search, col_client = st.columns(2)
+        col_search, col_tag, col_client = st.columns(3)
         with col_search:
             search_query = st.text_input("**General Search (keywords)**", "")
+        with col_tag:
+            # Exact tag match through the activity_log_keywords index
+            tag_filter = st.selectbox("**Tag**", ["All Tags"] + crud_activity_logs.get_keyword_tags(db))
+            if tag_filter == "All Tags":
+                tag_filter = None
         with col_client:
             client_search = st.text_input("**Client Search (Lead Name)**", "")
         
@@ -122,7 +128,8 @@ def view_activity_logs():
             entity_type=entity_filter,
             start_date=start_date,
             end_date=end_date,
-            search_keywords=final_search if final_search else None
+            search_keywords=final_search if final_search else None,
+            keyword=tag_filter
         )
     
         # Display count and Export
@@ -15,11 +15,12 @@ import json
 from app.db import SessionLocal
 from app import services_stats
 from app.crud import crud_users, crud_leads, crud_activity_logs, crud_agencies, crud_email_reminders, crud_ccus, crud_events, crud_agency_suboptions
+from app.services import reference_data
 from sqlalchemy import func
 from app.schemas import UserCreate, LeadCreate, LeadUpdate
 from app.utils.activity_logger import format_time_ago, get_action_icon, get_action_label, format_changes, utc_to_local
 from app.utils.email_service import send_referral_reminder, send_lead_reminder_email
-from frontend.common import prepare_lead_data_for_email, get_call_status_tag, clear_leads_cache
+from frontend.common import prepare_lead_data_for_email, get_call_status_tag
 
 
 def add_lead():
@@ -127,7 +128,6 @@ def add_lead():
                                 st.session_state.get('db_user_id')
                             )
                             if success:
-                                clear_leads_cache()
                                 st.session_state.pop('_del_lead_id', None)
                                 st.session_state['success_msg'] = (
                                     f"Lead '{del_lead.first_name} {del_lead.last_name}' restored successfully!"
@@ -191,7 +191,7 @@ def add_lead():
             soc_date = st.date_input("SOC Date", value=date.today(), key="transfer_soc_date", label_visibility="collapsed", format="MM/DD/YYYY")
     
         elif source == "Event":
-            events = crud_events.get_all_events(db)
+            events = reference_data.get_events()
             event_names = [e.event_name for e in events]
             st.markdown("<h4 style='font-weight: bold; color: #111827;'>Select Event</h4>", unsafe_allow_html=True)
         
@@ -239,7 +239,7 @@ def add_lead():
             st.divider()
     
         elif source == "Direct Through CCU":
-            agencies = crud_agencies.get_all_agencies(db)
+            agencies = reference_data.get_agencies()
             agency_names = [a.name for a in agencies]
             st.markdown("<h4 style='font-weight: bold; color: #111827;'>Select Payor</h4>", unsafe_allow_html=True)
         
@@ -287,7 +287,7 @@ def add_lead():
                             st.rerun()
 
             if agency_id:
-                suboptions = crud_agency_suboptions.get_all_suboptions(db, agency_id=agency_id)
+                suboptions = reference_data.get_suboptions(agency_id)
                 if suboptions:
                     st.write("**Select Suboption:**")
                     suboption_names = [s.name for s in suboptions]
@@ -300,7 +300,7 @@ def add_lead():
                                 break
             st.divider()
             st.markdown("<h4 style='font-weight: bold; color: #00506b;'>Select CCU</h4>", unsafe_allow_html=True)
-            ccus = crud_ccus.get_all_ccus(db)
+            ccus = reference_data.get_ccus()
             ccu_names = [c.name for c in ccus]
             if not ccu_names:
                 st.info(" No CCUs available.")
@@ -367,7 +367,7 @@ def add_lead():
 
 
         # Fetch approved users for admin selection
-        approved_users = crud_users.get_approved_users(db)
+        approved_users = reference_data.get_approved_users()
         user_options = [u.username for u in approved_users]
         user_map = {u.username: u for u in approved_users}
 
@@ -396,7 +396,7 @@ def add_lead():
                 staff_name = st.session_state.username
                 current_owner_id = st.session_state.get('db_user_id')
                 # For non-admin, try to fetch their own user_id if not in session
-                curr_user_obj = crud_users.get_user_by_username(db, staff_name)
+                curr_user_obj = reference_data.get_user_by_username(staff_name)
                 if curr_user_obj:
                     auto_user_id = curr_user_obj.user_id or ""
             
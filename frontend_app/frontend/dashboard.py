@@ -15,6 +15,7 @@ import json
 from app.db import SessionLocal
 from app import services_stats
 from app.crud import crud_users, crud_leads, crud_activity_logs, crud_agencies, crud_email_reminders, crud_ccus, crud_mcos
+from app.services import reference_data
 from sqlalchemy import func
 from app.schemas import UserCreate, LeadCreate, LeadUpdate
 from app.utils.activity_logger import format_time_ago, get_action_icon, get_action_label, format_changes, utc_to_local
@@ -36,41 +37,13 @@ def show_drill_down(filtered_df, title):
 
 def dashboard():
     """Main dashboard view"""
-    from frontend.common import prepare_lead_data_for_email, get_leads_cached, get_stats_cached, clear_leads_cache, render_download_csv
+    from frontend.common import prepare_lead_data_for_email, get_leads_cached, get_stats_cached, render_download_csv
+    from frontend.lead_snapshot import get_lead_snapshot
     db = SessionLocal()
     try:
     
-        # Load all leads for drill-down mapping
-        all_leads_list = crud_leads.list_leads(db, limit=10000)
-    
-        # FIX: If no leads, initialize with expected columns to prevent KeyError
-        if not all_leads_list:
-            expected_cols = [
-                'id', 'first_name', 'last_name', 'phone', 'source', 
-                'last_contact_status', 'staff_name', 'created_at', 
-                'active_client', 'care_status', 'priority', 'ccu_id',
-                'event_name', 'word_of_mouth_type', 'authorization_received'
-            ]
-            df_all_leads = pd.DataFrame(columns=expected_cols)
-        else:
-            df_all_leads = pd.DataFrame([l.__dict__ for l in all_leads_list])
-    
-        # Pre-map CCU names
-        ccus = crud_ccus.get_all_ccus(db)
-        ccu_map = {c.id: c.name for c in ccus}
-    
-        if not df_all_leads.empty:
-            if '_sa_instance_state' in df_all_leads.columns:
-                df_all_leads = df_all_leads.drop('_sa_instance_state', axis=1)
-        
-            # Ensure critical columns exist even if list_leads returned partial data 
-            # (though SQLAlchemy usually provides them all, this is defensive)
-            for col in ['active_client', 'care_status', 'priority', 'source', 'ccu_id']:
-                if col not in df_all_leads.columns:
-                    df_all_leads[col] = None
-
-            df_all_leads['ccu_name'] = df_all_leads['ccu_id'].map(ccu_map).fillna("N/A")
-            df_all_leads['month_str'] = pd.to_datetime(df_all_leads['created_at']).dt.strftime('%Y-%m')
+        # Shared columnar snapshot for drill-downs (cached until leads change)
+        df_all_leads = get_lead_snapshot()
 
         st.markdown(f'<div class="main-header">PERFORMANCE METRICS DASHBOARD</div>', unsafe_allow_html=True)
     
@@ -387,12 +360,10 @@ def dashboard():
 def discovery_tool():
     """Discovery tool for custom analysis"""
     from frontend.common import render_download_csv
+    from frontend.lead_snapshot import get_lead_snapshot
     db = SessionLocal()
     try:
-        all_leads_list = crud_leads.list_leads(db, limit=10000)
-        df_all_leads = pd.DataFrame([l.__dict__ for l in all_leads_list])
-        if not df_all_leads.empty and '_sa_instance_state' in df_all_leads.columns:
-            df_all_leads = df_all_leads.drop('_sa_instance_state', axis=1)
+        df_all_leads = get_lead_snapshot()
     
         st.markdown('<div class="main-header">LEAD DISCOVERY TOOL</div>', unsafe_allow_html=True)
         if df_all_leads.empty:
@@ -401,10 +372,6 @@ def discovery_tool():
         is_admin = st.session_state.user_role == "admin"
         analysis_df = df_all_leads if is_admin else df_all_leads[df_all_leads['staff_name'] == st.session_state.username]
     
-        ccus = crud_ccus.get_all_ccus(db)
-        ccu_map = {c.id: c.name for c in ccus}
-        analysis_df['ccu_name'] = analysis_df['ccu_id'].map(ccu_map).fillna("N/A")
-    
         feature_map = {
             "Lead Source": "source",
             "Staff Name": "staff_name",
@@ -455,13 +422,12 @@ def discovery_tool():
 def view_all_user_dashboards():
     """Admin view for all staff dashboards"""
     from frontend.common import render_download_csv
+    from frontend.lead_snapshot import get_lead_snapshot
     st.markdown('<div class="main-header">ALL USER DASHBOARDS</div>', unsafe_allow_html=True)
     if st.button("Back"): st.session_state.show_user_dashboards = False; st.rerun()
-    db = SessionLocal(); approved = crud_users.get_approved_users(db)
+    db = SessionLocal(); approved = reference_data.get_approved_users()
     try:
-        all_leads_list = crud_leads.list_leads(db, limit=10000)
-        df_all_leads = pd.DataFrame([l.__dict__ for l in all_leads_list])
-        if not df_all_leads.empty and '_sa_instance_state' in df_all_leads.columns: df_all_leads = df_all_leads.drop('_sa_instance_state', axis=1)
+        df_all_leads = get_lead_snapshot()
 
         for u in approved:
             with st.expander(f"{u.username} Dashboard"):
@@ -0,0 +1,164 @@
+"""
+Lead card details for the list pages: attachments, activity history and
+comment history.
+
+A page builds one LeadDetailsLoader for the cards it renders. The first
+card that needs a section triggers one IN query covering every visible
+card that needs it; the other cards read the result from memory. Each
+section renders inside an st.fragment, so uploading, deleting or toggling
+inside a card reruns that card section only, not the whole page.
+"""
+import os
+import sys
+from pathlib import Path
+
+# Add backend to Python path
+backend_path = Path(__file__).parent.parent.parent / "backend"
+sys.path.insert(0, str(backend_path))
+
+import streamlit as st
+
+from app.db import SessionLocal
+
+HISTORY_LIMIT = 10
+COMMENT_HISTORY_KEY = "comment_history_{}"
+
+
+class LeadDetailsLoader:
+    """
+    Batched, per-render loader for card details.
+    `history_key` is the page's "history open" session-state key template,
+    e.g. "show_history_ref_{}"; only open histories are fetched.
+    """
+
+    def __init__(self, lead_ids, history_key: str = "show_history_{}"):
+        self.lead_ids = list(dict.fromkeys(lead_ids))
+        self.history_key = history_key
+        self._loaded = {}  # kind -> (ids covered, {lead_id: rows})
+
+    def _open_ids(self, key_template):
+        return [i for i in self.lead_ids if st.session_state.get(key_template.format(i), False)]
+
+    def _get(self, kind, lead_id, ids, fetch):
+        covered, data = self._loaded.get(kind, (set(), {}))
+        if lead_id not in covered:
+            ids = set(ids) | covered | {lead_id}
+            db = SessionLocal()
+            try:
+                data = fetch(db, list(ids))
+            finally:
+                db.close()
+            covered = ids
+            self._loaded[kind] = (covered, data)
+        return data.get(lead_id, [])
+
+    def attachments(self, lead_id):
+        from app.crud.crud_attachments import get_attachments_for_leads
+        return self._get("attachments", lead_id, self.lead_ids, get_attachments_for_leads)
+
+    def history(self, lead_id):
+        from app.crud.crud_activity_logs import get_lead_histories
+        return self._get(
+            "history", lead_id, self._open_ids(self.history_key),
+            lambda db, ids: get_lead_histories(db, ids, limit_per_lead=HISTORY_LIMIT),
+        )
+
+    def comments(self, lead_id):
+        from app.crud.crud_notes import get_comments_for_leads
+        return self._get("comments", lead_id, self._open_ids(COMMENT_HISTORY_KEY), get_comments_for_leads)
+
+    def invalidate(self, kind: str) -> None:
+        self._loaded.pop(kind, None)
+
+
+@st.fragment
+def render_attachments_section(lead_id: int, loader: LeadDetailsLoader, key_prefix: str):
+    """Upload form and attachment list for one card."""
+    from app.crud import crud_attachments
+    from frontend.common import render_time, open_modal, clear_modal_state
+
+    st.markdown("### 📎 Attachments")
+    try:
+        with st.expander("➕ Upload New Attachment", expanded=False):
+            # GHOST UPLOAD FIX: Use a versioned key to force a reset after successful upload
+            ver_key = f"up_ver_{key_prefix}_{lead_id}"
+            up_key_ver = st.session_state.get(ver_key, 0)
+            uploaded_file = st.file_uploader("Choose file", type=['pdf', 'docx', 'doc', 'png', 'jpg', 'jpeg', 'csv', 'txt'], key=f"att_upload_{key_prefix}_{lead_id}_{up_key_ver}")
+            if uploaded_file is not None and st.button("Upload", key=f"att_upload_btn_{key_prefix}_{lead_id}_{up_key_ver}", type="primary"):
+                # GHOST POPUP KILLER: Proactively clear any stale modal state before rerunning
+                clear_modal_state()
+
+                upload_dir = Path(__file__).parent.parent.parent / "backend" / "uploads"
+                upload_dir.mkdir(exist_ok=True)
+                file_path = upload_dir / f"{lead_id}_{uploaded_file.name}"
+                with open(file_path, "wb") as f:
+                    f.write(uploaded_file.getbuffer())
+                db = SessionLocal()
+                try:
+                    crud_attachments.create_attachment(db, lead_id=lead_id, filename=uploaded_file.name, file_path=str(file_path), file_size=uploaded_file.size, uploaded_by=st.session_state.username)
+                finally:
+                    db.close()
+
+                # UPLOADER RESET: Increment version to force a new widget
+                st.session_state[ver_key] = up_key_ver + 1
+                loader.invalidate("attachments")
+                st.rerun(scope="fragment")
+
+        for att in loader.attachments(lead_id):
+            at_col1, at_col2, at_col3, at_col4 = st.columns([4, 1, 1, 1])
+            with at_col1:
+                st.markdown(f"📄 **{att.filename}** - Uploaded by **{att.uploaded_by}** on {render_time(att.uploaded_at)}", unsafe_allow_html=True)
+            with at_col2:
+                if st.button("👁️", key=f"att_view_{key_prefix}_{att.id}", use_container_width=True, help="Preview Document"):
+                    open_modal('file_preview', att.id, title=att.filename, lead_data={'file_path': att.file_path, 'filename': att.filename})
+            with at_col3:
+                if os.path.exists(att.file_path):
+                    with open(att.file_path, "rb") as f:
+                        st.download_button("⬇️", f, file_name=att.filename, key=f"att_dl_{key_prefix}_{att.id}", use_container_width=True)
+            with at_col4:
+                if st.session_state.user_role == "admin" and st.button("🗑️", key=f"att_del_{key_prefix}_{att.id}", use_container_width=True):
+                    db = SessionLocal()
+                    try:
+                        crud_attachments.delete_attachment(db, att.id)
+                    finally:
+                        db.close()
+                    loader.invalidate("attachments")
+                    st.rerun(scope="fragment")
+    except Exception as e:
+        st.error(f"Attachment error: {str(e)}")
+
+
+@st.fragment
+def render_history_section(lead_id: int, loader: LeadDetailsLoader, title: str = None):
+    """Newest activity log entries for one card (call only when its history is open)."""
+    from app.utils.activity_logger import get_action_label, format_changes
+    from frontend.common import render_time
+
+    if title:
+        st.info(f"Activity History for {title}")
+    history_logs = loader.history(lead_id)
+    if not history_logs:
+        st.caption("No history recorded yet.")
+        return
+
+    for log in history_logs[:HISTORY_LIMIT]:
+        st.markdown(f"**{render_time(log.timestamp, style='ago')}** &bull; **{get_action_label(log.action_type)}** by **{log.username}**", unsafe_allow_html=True)
+        st.markdown(f"<div style='font-size: 0.85rem; color: #6B7280;'>Time: {render_time(log.timestamp)}</div>", unsafe_allow_html=True)
+        if log.description and log.description != get_action_label(log.action_type):
+            st.caption(log.description)
+
+        # Show changes if available
+        if log.old_value and log.new_value:
+            changes = format_changes(log.old_value, log.new_value)
+            if changes:
+                for field, old_val, new_val in changes:
+                    st.markdown(f"<div style='font-size: 0.85rem; color: #6B7280; margin-left: 20px;'>&bull; <b>{field}:</b> {old_val} &rarr; {new_val}</div>", unsafe_allow_html=True)
+        st.divider()
+
+
+@st.fragment
+def render_comments_section(lead, loader: LeadDetailsLoader):
+    """Comment stack for one card; the "Show all updates" toggle reruns only this section."""
+    from frontend.common import render_comment_stack
+
+    render_comment_stack(lead, loader)
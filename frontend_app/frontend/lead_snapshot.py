@@ -0,0 +1,108 @@
+"""
+Lead analytics snapshot: one typed DataFrame of the live leads shared by the
+dashboard, the Lead Discovery tool and the all-user dashboards.
+
+Only the scalar columns the charts need are selected (no ORM objects, no
+relationship loads), and the frame is cached process-wide until the leads or
+ccus table version changes. Treat the returned frame as read-only; copy it
+before adding columns.
+"""
+import sys
+import threading
+from pathlib import Path
+
+# Add backend to Python path
+backend_path = Path(__file__).parent.parent.parent / "backend"
+sys.path.insert(0, str(backend_path))
+
+import pandas as pd
+from sqlalchemy import select
+
+from app.db import SessionLocal
+import app.models as models
+from app.utils.table_versions import get_table_versions
+
+SNAPSHOT_COLUMNS = [
+    "id",
+    "first_name",
+    "last_name",
+    "phone",
+    "email",
+    "source",
+    "event_name",
+    "word_of_mouth_type",
+    "staff_name",
+    "created_by",
+    "created_at",
+    "updated_at",
+    "last_contact_status",
+    "priority",
+    "active_client",
+    "referral_type",
+    "care_status",
+    "authorization_received",
+    "agency_id",
+    "ccu_id",
+    "city",
+    "zip_code",
+    "medicaid_status",
+]
+
+_BOOL_COLUMNS = ["active_client", "authorization_received"]
+_DATETIME_COLUMNS = ["created_at", "updated_at"]
+_ID_COLUMNS = ["agency_id", "ccu_id"]
+
+_snapshot_lock = threading.Lock()
+_snapshot = None  # (versions, DataFrame)
+
+# ccu_name comes from the CCU table
+SNAPSHOT_TABLES = ("leads", "ccus")
+
+
+def _load_snapshot():
+    lead_columns = [getattr(models.Lead, name) for name in SNAPSHOT_COLUMNS]
+    stmt = (
+        select(*lead_columns, models.CCU.name.label("ccu_name"))
+        .outerjoin(models.CCU, models.Lead.ccu_id == models.CCU.id)
+        .where(models.Lead.deleted_at == None)
+        .order_by(models.Lead.created_at.desc(), models.Lead.id.desc())
+    )
+
+    db = SessionLocal()
+    try:
+        # Version read first: a write landing mid-load just triggers one more rebuild
+        version = get_table_versions(db, SNAPSHOT_TABLES)
+        rows = db.execute(stmt).all()
+    finally:
+        db.close()
+
+    df = pd.DataFrame.from_records(rows, columns=SNAPSHOT_COLUMNS + ["ccu_name"])
+    for col in _BOOL_COLUMNS:
+        df[col] = df[col].fillna(False).astype(bool)
+    for col in _DATETIME_COLUMNS:
+        df[col] = pd.to_datetime(df[col])
+    for col in _ID_COLUMNS:
+        df[col] = df[col].astype("Int64")
+    df["ccu_name"] = df["ccu_name"].fillna("N/A")
+    df["month_str"] = df["created_at"].dt.strftime("%Y-%m")
+    return version, df
+
+
+def get_lead_snapshot() -> pd.DataFrame:
+    """Live (non-deleted) leads as a DataFrame, rebuilt only after lead or CCU writes."""
+    global _snapshot
+    db = SessionLocal()
+    try:
+        version = get_table_versions(db, SNAPSHOT_TABLES)
+    finally:
+        db.close()
+
+    cached = _snapshot
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    with _snapshot_lock:
+        if _snapshot is not None and _snapshot[0] == version:
+            return _snapshot[1]
+        _snapshot = _load_snapshot()
+        return _snapshot[1]
@@ -11,6 +11,7 @@ sys.path.insert(0, str(backend_path))
 
 from app.db import SessionLocal
 from app.crud import crud_users, crud_messages
+from app.services import reference_data
 from frontend.common import render_time
 
 
@@ -35,7 +36,7 @@ def view_messages():
             
             # Start New Chat
             with st.expander("➕ Start New Chat"):
-                all_users = crud_users.get_approved_users(db)
+                all_users = reference_data.get_approved_users()
                 # Filter out current user
                 other_users = [u for u in all_users if u.id != current_user_id]
                 user_map = {u.username: u.id for u in other_users}
@@ -0,0 +1,57 @@
+"""
+Page registry for the router in streamlit_app.py.
+
+Page modules (plotly, pandas, the CRUD layer...) are imported the first
+time their page is opened instead of at app start, so a cold start only
+pays for the shell and the page actually shown. Python keeps the module in
+sys.modules afterwards, so later reruns cost nothing extra.
+
+Set LEAD_MANAGER_PROFILE=1 to print per-run and first-import timings to
+the server log; backend/scripts/profile_startup.py reports per-module
+import times for each page.
+"""
+import importlib
+import os
+import sys
+import time
+
+# Page name -> (module, view function)
+PAGES = {
+    "Dashboard": ("frontend.dashboard", "dashboard"),
+    "All User Dashboards": ("frontend.dashboard", "view_all_user_dashboards"),
+    "Lead Discovery": ("frontend.dashboard", "discovery_tool"),
+    "Add Lead": ("frontend.add_lead", "add_lead"),
+    "View Leads": ("frontend.view_leads", "view_leads"),
+    "Mark Referral Page": ("frontend.view_leads", "mark_referral_page"),
+    "Referrals Sent": ("frontend.referrals_sent", "view_referrals"),
+    "Authorizations": ("frontend.referral_confirm", "referral_confirm"),
+    "Activity Logs": ("frontend.activity_logs", "view_activity_logs"),
+    "User Profile": ("frontend.user_management", "user_profile_page"),
+    "User Management": ("frontend.user_management", "admin_panel"),
+}
+
+
+def profiling_enabled() -> bool:
+    return os.getenv("LEAD_MANAGER_PROFILE", "false").lower() in ("1", "true", "yes", "on")
+
+
+def dev_reload_enabled() -> bool:
+    """Re-import backend modules on every run so local edits apply without a restart (never in production)."""
+    return os.getenv("LEAD_MANAGER_DEV_RELOAD", "false").lower() in ("1", "true", "yes", "on")
+
+
+def load_view(module_name: str, func_name: str):
+    """Import `module_name` on first use and return its view function."""
+    if module_name not in sys.modules and profiling_enabled():
+        start = time.perf_counter()
+        module = importlib.import_module(module_name)
+        print(f"[PROFILE] Imported {module_name} in {(time.perf_counter() - start) * 1000:.1f} ms")
+    else:
+        module = importlib.import_module(module_name)
+    return getattr(module, func_name)
+
+
+def get_page(page: str):
+    """View function for a registered page name, or None."""
+    target = PAGES.get(page)
+    return load_view(*target) if target else None
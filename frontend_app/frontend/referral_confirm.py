@@ -11,23 +11,27 @@ sys.path.insert(0, str(backend_path))
 import streamlit as st
 import pandas as pd
 from datetime import datetime, date
-import json
 import os
 from app.db import SessionLocal
 from app import services_stats
 from app.crud import crud_users, crud_activity_logs, crud_agencies, crud_email_reminders, crud_ccus, crud_agency_suboptions
+from app.services import reference_data
 # Local import to fix circular dependency
 from sqlalchemy import func
 from app.schemas import UserCreate, LeadCreate, LeadUpdate
 from app.utils.activity_logger import format_time_ago, get_action_icon, get_action_label, format_changes, utc_to_local
 from app.utils.email_service import send_referral_reminder, send_lead_reminder_email
-from frontend.common import prepare_lead_data_for_email, get_call_status_tag, render_time, render_confirmation_modal, open_modal, close_modal, show_add_comment_dialog, render_comment_stack, clear_leads_cache, get_pagination_params, render_pagination, export_leads_to_excel
+from frontend.common import prepare_lead_data_for_email, get_call_status_tag, render_time, render_confirmation_modal, open_modal, close_modal, show_add_comment_dialog, get_pagination_params, get_page_cursor, get_page_total, render_pagination, render_lead_export
 
 
-def display_referral_confirm(lead, db, highlight=False):
+def display_referral_confirm(lead, db, highlight=False, loader=None):
     """Helper function to display a single referral in the confirm page"""
     from app.crud.crud_leads import update_lead
     from frontend.common import get_tag_color_dot, render_tag_color_picker
+    from frontend.lead_details import LeadDetailsLoader, render_history_section, render_attachments_section, render_comments_section
+
+    if loader is None:
+        loader = LeadDetailsLoader([lead.id], history_key="show_history_conf_{}")
 
     # Show care status indicator in the expander title
     # Layout: Expander
@@ -102,26 +106,15 @@ def display_referral_confirm(lead, db, highlight=False):
 
         # Show authorization received info if applicable
         if lead.authorization_received:
-            # Find when authorization was received from activity logs
-            auth_received_time = None
-            try:
-                history_logs = crud_activity_logs.get_lead_history(db, lead.id)
-                for log in history_logs:
-                    if log.old_value and log.new_value:
-                        try:
-                            old_val = json.loads(log.old_value) if isinstance(log.old_value, str) else log.old_value
-                            new_val = json.loads(log.new_value) if isinstance(log.new_value, str) else log.new_value
-
-                            # Check if authorization_received changed from False to True
-                            if (isinstance(old_val, dict) and isinstance(new_val, dict) and
-                                old_val.get('authorization_received') == False and
-                                new_val.get('authorization_received') == True):
-                                auth_received_time = log.timestamp
-                                break
-                        except (json.JSONDecodeError, TypeError):
-                            continue
-            except Exception:
-                pass
+            # Stamped on the lead when authorization is set; older rows fall back to the activity logs
+            auth_received_time = lead.authorization_received_at
+            if not auth_received_time:
+                try:
+                    flips = crud_activity_logs.get_field_changes(db, "Lead", lead.id, "authorization_received", new_value=True)
+                    if flips:
+                        auth_received_time = flips[0].changed_at
+                except Exception:
+                    pass
 
             # Show prominent authorization confirmation
             st.info("**AUTHORIZATION CONFIRMED - This referral has received authorization and is ready for care coordination**")
@@ -204,7 +197,7 @@ def display_referral_confirm(lead, db, highlight=False):
             st.write(f"**Status:** {lead.last_contact_status}")
             st.success(f"**Referral Type:** {lead.referral_type or 'Regular'}")
             st.write(f"**City:** {lead.city or 'N/A'}")
-            render_comment_stack(lead)
+            render_comments_section(lead, loader)
             st.divider()
             render_tag_color_picker(lead.id, lead.tag_color, db, page_type="confirmations")
 
@@ -248,7 +241,10 @@ def display_referral_confirm(lead, db, highlight=False):
             
             with sub_col1:
                 if st.button("Edit", key=f"edit_btn_confirm_{lead.id}", use_container_width=True):
-                    lead_dict = {c.name: getattr(lead, c.name) for c in lead.__table__.columns}
+                    # List rows are read-only snapshots; the edit dialog works from the full lead
+                    from app.crud.crud_leads import get_lead as _get_full_lead
+                    full_lead = _get_full_lead(db, lead.id, include_deleted=True)
+                    lead_dict = {c.name: getattr(full_lead, c.name) for c in full_lead.__table__.columns}
                     open_modal('save_edit_modal', lead.id, title=f"{lead.first_name} {lead.last_name}", lead_data=lead_dict)
             
             with sub_col2:
@@ -318,69 +314,13 @@ def display_referral_confirm(lead, db, highlight=False):
                         st.rerun()
 
         st.divider()
-        st.markdown("### 📎 Attachments")
-        try:
-            from app.crud import crud_attachments
-            with st.expander("➕ Upload New Attachment", expanded=False):
-                # GHOST UPLOAD FIX: Use a versioned key to force a reset after successful upload
-                up_key_ver = st.session_state.get(f"up_ver_auth_{lead.id}", 0)
-                uploaded_file = st.file_uploader("Choose file", type=['pdf', 'docx', 'doc', 'png', 'jpg', 'jpeg', 'csv', 'txt'], key=f"upload_{lead.id}_{up_key_ver}")
-                if uploaded_file and st.button("Upload", key=f"btn_upload_{lead.id}_{up_key_ver}", type="primary"):
-                    from frontend.common import clear_modal_state
-                    # GHOST POPUP KILLER: Proactively clear any stale modal state before rerunning
-                    clear_modal_state()
-                    
-                    upload_dir = Path(__file__).parent.parent.parent / "backend" / "uploads"
-                    upload_dir.mkdir(exist_ok=True)
-                    file_path = upload_dir / f"{lead.id}_{uploaded_file.name}"
-                    with open(file_path, "wb") as f: f.write(uploaded_file.getbuffer())
-                    crud_attachments.create_attachment(db, lead_id=lead.id, filename=uploaded_file.name, file_path=str(file_path), file_size=uploaded_file.size, uploaded_by=st.session_state.username)
-                    
-                    # UPLOADER RESET: Increment version to force a new widget
-                    st.session_state[f"up_ver_auth_{lead.id}"] = up_key_ver + 1
-                    st.rerun()
-            
-            attachments = crud_attachments.get_attachments_by_lead(db, lead.id)
-            if attachments:
-                for att in attachments:
-                    a_col1, a_col2, a_col3, a_col4 = st.columns([4, 1, 1, 1])
-                    with a_col1:
-                        time_str = render_time(att.uploaded_at)
-                        st.markdown(f"📄 **{att.filename}** - Uploaded by **{att.uploaded_by}** on {time_str}", unsafe_allow_html=True)
-                    with a_col2:
-                        if st.button("👁️", key=f"view_{att.id}", use_container_width=True, help="Preview Document"):
-                            open_modal('file_preview', att.id, title=att.filename, lead_data={'file_path': att.file_path, 'filename': att.filename})
-                    with a_col3: 
-                         if os.path.exists(att.file_path):
-                             with open(att.file_path, "rb") as f:
-                                 st.download_button("⬇", f, file_name=att.filename, key=f"dl_{att.id}", use_container_width=True)
-                    with a_col4:
-                         if st.session_state.user_role == "admin" and st.button("🗑️", key=f"del_{att.id}", use_container_width=True):
-                             crud_attachments.delete_attachment(db, att.id)
-                             st.rerun()
-        except Exception as e: st.error(f"Attachment error: {e}")
+        render_attachments_section(lead.id, loader, "auth")
         if st.session_state.get(f"show_history_conf_{lead.id}", False):
-            history_logs = crud_activity_logs.get_lead_history(db, lead.id)
-            if history_logs:
-                for log in history_logs[:10]:
-                    st.markdown(f"**{render_time(log.timestamp, style='ago')}** &bull; **{get_action_label(log.action_type)}** by **{log.username}**", unsafe_allow_html=True)
-                    st.markdown(f"<div style='font-size: 0.85rem; color: #6B7280;'>Time: {render_time(log.timestamp)}</div>", unsafe_allow_html=True)
-                    if log.description and log.description != get_action_label(log.action_type):
-                        st.caption(log.description)
-                    
-                    # Show changes if available
-                    if log.old_value and log.new_value:
-                        changes = format_changes(log.old_value, log.new_value)
-                        if changes:
-                            for field, old_val, new_val in changes:
-                                st.markdown(f"<div style='font-size: 0.85rem; color: #6B7280; margin-left: 20px;'>&bull; <b>{field}:</b> {old_val} &rarr; {new_val}</div>", unsafe_allow_html=True)
-                    st.divider()
-            else:
-                st.caption("No history recorded yet.")
+            render_history_section(lead.id, loader)
 
 def referral_confirm():
     """Authorizations Received page - Shows all clients with authorization received"""
-    from app.crud.crud_leads import search_leads, count_search_leads
+    from app.crud.crud_leads import search_leads, search_leads_with_count, lead_cursor, count_search_leads
     # Display persistent status messages if they exist
     if 'success_msg' in st.session_state:
         msg = st.session_state.pop('success_msg')
@@ -512,11 +452,12 @@ def referral_confirm():
             )
             if selected_sort != st.session_state.confirmations_sort_by:
                 st.session_state.confirmations_sort_by = selected_sort
+                st.session_state.conf_page = 0  # cursors are per sort order
                 st.rerun()
 
         # Payor Filter
         st.write("**Filter by Payor:**")
-        agencies = crud_agencies.get_all_agencies(db)
+        agencies = reference_data.get_agencies()
     
         # Payor filter is now initialized in init_session_state() in common.py
     
@@ -530,7 +471,7 @@ def referral_confirm():
 
         # CCU Filter
         st.write("**Filter by CCU:**")
-        ccus = crud_ccus.get_all_ccus(db)
+        ccus = reference_data.get_ccus()
     
         # CCU filter is now initialized in init_session_state() in common.py
     
@@ -667,13 +608,14 @@ def referral_confirm():
     
         # --- DATA FETCHING & FILTERING (PERFORMANCE OPTIMIZED) ---
         skip, limit, page_index, rows_per_page = get_pagination_params("conf", default_limit=20)
+        page_cursor = get_page_cursor("conf")
     
 
         auth_val = True # All leads on this page should have authorization received
         owner_id = None # Not filtering by owner on this page
         only_my_referrals = False # Not filtering by owner on this page
 
-        leads = search_leads(
+        leads, total_leads = search_leads_with_count(
             db,
             search_query=search_name if search_name else None,
             staff_filter=filter_staff if filter_staff else None,
@@ -697,29 +639,9 @@ def referral_confirm():
             caregiver_type_filter=st.session_state.confirm_caregiver_type_filter,
             ccu_filter=st.session_state.confirm_ccu_filter,
             agency_filter=st.session_state.confirm_payor_filter,
-            sort_by=st.session_state.confirmations_sort_by
-        )
-    
-        # Post-filter (Now handled at SQL level)
-        pass
-
-        total_leads = count_search_leads(
-            db,
-            search_query=search_name if search_name else None,
-            staff_filter=filter_staff if filter_staff else None,
-            source_filter=filter_source if filter_source else None,
-            exclude_clients=False,
-            only_clients=False,
-            auth_received_filter=True,
-            include_deleted=filter_deleted,
-            care_status_filter=st.session_state.confirm_status_filter if not filter_deleted else None,
-            care_sub_status_filter=st.session_state.confirm_care_filter if st.session_state.confirm_status_filter == "Active" else "All",
-            lead_id_search=lead_id_search,
-            tag_color_filter=st.session_state.confirm_tag_color_filter,
-            caregiver_type_filter=st.session_state.confirm_caregiver_type_filter,
-            ccu_filter=st.session_state.confirm_ccu_filter,
-            agency_filter=st.session_state.confirm_payor_filter,
-            lead_type_filter=st.session_state.confirm_lead_type_filter
+            sort_by=st.session_state.confirmations_sort_by,
+            cursor=page_cursor,
+            total=get_page_total("conf")
         )
     
         # UI Metadata
@@ -729,49 +651,32 @@ def referral_confirm():
         # Excel Download Button
         download_all_col1, download_all_col2 = st.columns([4, 1])
         with download_all_col2:
-            if st.button(" Download Excel", key="download_confirm_excel_btn", use_container_width=True):
-                # Fetch all matching authorized referrals
-                all_filtered_leads = search_leads(
-                    db,
-                    search_query=search_name if search_name else None,
-                    staff_filter=filter_staff if filter_staff else None,
-                    source_filter=filter_source if filter_source else None,
-                    status_filter=None, 
-                    priority_filter=None, 
-                    active_inactive_filter=None,
-                    owner_id=None,
-                    only_my_leads=False,
-                    include_deleted=filter_deleted,
-                    exclude_clients=False, 
-                    auth_received_filter=True, 
-                    only_clients=False,
-                    skip=0,
-                    limit=2000,
-                    lead_id_search=lead_id_search,
-                    lead_type_filter=st.session_state.confirm_lead_type_filter,
-                    care_status_filter=st.session_state.confirm_status_filter,
-                    care_sub_status_filter=st.session_state.confirm_care_filter if st.session_state.confirm_status_filter == "Active" else "All",
-                    tag_color_filter=st.session_state.confirm_tag_color_filter,
-                    caregiver_type_filter=st.session_state.confirm_caregiver_type_filter,
-                    ccu_filter=st.session_state.confirm_ccu_filter,
-                    agency_filter=st.session_state.confirm_payor_filter,
-                    sort_by=st.session_state.confirmations_sort_by
-                )
-            
-                # Post-filter (Now handled at SQL level)
-                pass
-
-                if all_filtered_leads:
-                    excel_data = export_leads_to_excel(all_filtered_leads)
-                    st.download_button(
-                        label="Click here to download",
-                        data=excel_data,
-                        file_name=f"authorizations_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
-                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                        key="trigger_download_confirm"
-                    )
-                else:
-                    st.warning("No authorized referrals found to download.")
+            render_lead_export(
+                "confirm",
+                "authorizations",
+                "No authorized referrals found to download.",
+                sort_by=st.session_state.confirmations_sort_by,
+                search_query=search_name if search_name else None,
+                staff_filter=filter_staff if filter_staff else None,
+                source_filter=filter_source if filter_source else None,
+                status_filter=None,
+                priority_filter=None,
+                active_inactive_filter=None,
+                owner_id=None,
+                only_my_leads=False,
+                include_deleted=filter_deleted,
+                exclude_clients=False,
+                auth_received_filter=True,
+                only_clients=False,
+                lead_id_search=lead_id_search,
+                lead_type_filter=st.session_state.confirm_lead_type_filter,
+                care_status_filter=st.session_state.confirm_status_filter,
+                care_sub_status_filter=st.session_state.confirm_care_filter if st.session_state.confirm_status_filter == "Active" else "All",
+                tag_color_filter=st.session_state.confirm_tag_color_filter,
+                caregiver_type_filter=st.session_state.confirm_caregiver_type_filter,
+                ccu_filter=st.session_state.confirm_ccu_filter,
+                agency_filter=st.session_state.confirm_payor_filter
+            )
 
         # Show filtered count
         st.write(f"**Showing {len(leads)} clients of {total_leads} total**")
@@ -789,14 +694,17 @@ def referral_confirm():
             return
     
         # Display each authorized referral
+        from frontend.lead_details import LeadDetailsLoader
+        # One batched query per card section for the whole page
+        details = LeadDetailsLoader([lead.id for lead in leads], history_key="show_history_conf_{}")
         for lead in leads:
             # Avoid duplicating focused lead if it happens to be on this page
             if 'specific_lead_id' in locals() and lead.id == specific_lead_id:
                 continue
-            display_referral_confirm(lead, db)
+            display_referral_confirm(lead, db, loader=details)
     
         # --- PAGINATION UI CONTROLS ---
-        render_pagination(total_leads, "conf")
+        render_pagination(total_leads, "conf", next_cursor=lead_cursor(leads[-1], st.session_state.confirmations_sort_by) if leads else None)
     
     finally:
         db.close()
@@ -16,17 +16,18 @@ import os
 from app.db import SessionLocal
 from app import services_stats
 from app.crud import crud_users, crud_activity_logs, crud_agencies, crud_email_reminders, crud_ccus, crud_agency_suboptions
+from app.services import reference_data
 # Local import to fix circular dependency
 from sqlalchemy import func
 from app.schemas import UserCreate, LeadCreate, LeadUpdate
 from app.utils.activity_logger import format_time_ago, get_action_icon, get_action_label, format_changes, utc_to_local
 from app.utils.email_service import send_referral_reminder, send_lead_reminder_email
-from frontend.common import prepare_lead_data_for_email, get_call_status_tag, render_time, render_confirmation_modal, open_modal, close_modal, get_leads_cached, clear_leads_cache, show_add_comment_dialog, render_comment_stack, render_pagination, get_pagination_params, render_tag_color_picker, export_leads_to_excel
+from frontend.common import prepare_lead_data_for_email, get_call_status_tag, render_time, render_confirmation_modal, open_modal, close_modal, get_leads_cached, show_add_comment_dialog, render_pagination, get_pagination_params, get_page_cursor, get_page_total, render_tag_color_picker, render_lead_export
 
 
 def view_referrals():
     """View and manage referrals only"""
-    from app.crud.crud_leads import search_leads, count_search_leads, update_lead
+    from app.crud.crud_leads import search_leads, search_leads_with_count, lead_cursor, update_lead
     # Display persistent status messages if they exist
     if 'success_msg' in st.session_state:
         msg = st.session_state.pop('success_msg')
@@ -224,6 +225,7 @@ def view_referrals():
             )
             if selected_sort != st.session_state.referrals_sort_by:
                 st.session_state.referrals_sort_by = selected_sort
+                st.session_state.refs_page = 0  # cursors are per sort order
                 st.rerun()
         
         # Referral Type Filter Buttons
@@ -306,7 +308,7 @@ def view_referrals():
     
         # CCU Filter
         st.write("**Filter by CCU:**")
-        ccus = crud_ccus.get_all_ccus(db)
+        ccus = reference_data.get_ccus()
         if ccus:
             ccu_names = ["All"] + [c.name for c in ccus]
             selected_ccu = st.selectbox("Select CCU", ccu_names, index=ccu_names.index(st.session_state.referral_ccu_filter) if st.session_state.referral_ccu_filter in ccu_names else 0, key="referral_ccu_filter_select")
@@ -317,7 +319,7 @@ def view_referrals():
     
         # Payor Filter
         st.write("**Filter by Payor:**")
-        agencies = crud_agencies.get_all_agencies(db)
+        agencies = reference_data.get_agencies()
     
         # Payor filter is now initialized in init_session_state() in common.py
     
@@ -334,6 +336,7 @@ def view_referrals():
     
         # --- DATA FETCHING & FILTERING (PERFORMANCE OPTIMIZED) ---
         skip, limit, page_index, rows_per_page = get_pagination_params("refs", default_limit=10)
+        page_cursor = get_page_cursor("refs")
     
         # Owner filter logic
         owner_id = st.session_state.get('db_user_id')
@@ -341,12 +344,12 @@ def view_referrals():
         if st.session_state.user_role != "admin" and st.session_state.show_only_my_referrals:
             only_my_referrals = True
     
-        # SQL-level search and count
+        # SQL-level search; page rows and total come back from one query
         # Use raw string for partial ID ILIKE matching (e.g. "3" returns all IDs containing 3)
         lead_id_search = search_id.strip() if search_id and search_id.strip() else None
 
         # Strict Separation: ONLY show leads WITHOUT authorization on this page
-        leads = search_leads(
+        leads, total_leads = search_leads_with_count(
             db,
             search_query=search_name if search_name else None,
             staff_filter=filter_staff if filter_staff else None,
@@ -367,29 +370,9 @@ def view_referrals():
             caregiver_type_filter=st.session_state.referral_caregiver_type_filter,
             ccu_filter=st.session_state.referral_ccu_filter,
             agency_filter=st.session_state.payor_filter,
-            sort_by=st.session_state.referrals_sort_by
-        )
-    
-        # Get total count for pagination
-        total_leads = count_search_leads(
-            db,
-            search_query=search_name if search_name else None,
-            staff_filter=filter_staff if filter_staff else None,
-            source_filter=filter_source if filter_source else None,
-            status_filter=st.session_state.referral_status_filter,
-            priority_filter=st.session_state.referral_call_status_filter,
-            active_inactive_filter="Active",
-            owner_id=st.session_state.db_user_id,
-            only_my_leads=only_my_referrals,
-            include_deleted=False,
-            lead_type_filter="Referral Sent",
-            auth_received_filter=False,
-            lead_id_search=lead_id_search,
-            referral_category_filter=st.session_state.referral_type_filter,
-            tag_color_filter=st.session_state.referral_tag_color_filter,
-            caregiver_type_filter=st.session_state.referral_caregiver_type_filter,
-            ccu_filter=st.session_state.referral_ccu_filter,
-            agency_filter=st.session_state.payor_filter
+            sort_by=st.session_state.referrals_sort_by,
+            cursor=page_cursor,
+            total=get_page_total("refs")
         )
     
         # UI Metadata
@@ -399,42 +382,29 @@ def view_referrals():
         # Excel Download Button
         download_all_col1, download_all_col2 = st.columns([4, 1])
         with download_all_col2:
-            if st.button(" Download Excel", key="download_referrals_excel_btn", use_container_width=True):
-                # Fetch all matching referrals (Match display logic exactly)
-                all_filtered_leads = search_leads(
-                    db,
-                    search_query=search_name if search_name else None,
-                    staff_filter=filter_staff if filter_staff else None,
-                    source_filter=filter_source if filter_source else None,
-                    status_filter=st.session_state.referral_status_filter,
-                    priority_filter=st.session_state.referral_call_status_filter,
-                    active_inactive_filter="Active",
-                    owner_id=owner_id,
-                    only_my_leads=only_my_referrals,
-                    include_deleted=False,
-                    lead_type_filter="Referral Sent",
-                    auth_received_filter=False,
-                    skip=0,
-                    limit=2000,
-                    lead_id_search=lead_id_search,
-                    referral_category_filter=st.session_state.referral_type_filter,
-                    tag_color_filter=st.session_state.referral_tag_color_filter,
-                    caregiver_type_filter=st.session_state.referral_caregiver_type_filter,
-                    ccu_filter=st.session_state.referral_ccu_filter,
-                    agency_filter=st.session_state.payor_filter,
-                    sort_by=st.session_state.referrals_sort_by
-                )
-                if all_filtered_leads:
-                    excel_data = export_leads_to_excel(all_filtered_leads)
-                    st.download_button(
-                        label="Click here to download",
-                        data=excel_data,
-                        file_name=f"referrals_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
-                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                        key="trigger_download_referrals"
-                    )
-                else:
-                    st.warning("No referrals found to download.")
+            render_lead_export(
+                "referrals",
+                "referrals",
+                "No referrals found to download.",
+                sort_by=st.session_state.referrals_sort_by,
+                search_query=search_name if search_name else None,
+                staff_filter=filter_staff if filter_staff else None,
+                source_filter=filter_source if filter_source else None,
+                status_filter=st.session_state.referral_status_filter,
+                priority_filter=st.session_state.referral_call_status_filter,
+                active_inactive_filter="Active",
+                owner_id=owner_id,
+                only_my_leads=only_my_referrals,
+                include_deleted=False,
+                lead_type_filter="Referral Sent",
+                auth_received_filter=False,
+                lead_id_search=lead_id_search,
+                referral_category_filter=st.session_state.referral_type_filter,
+                tag_color_filter=st.session_state.referral_tag_color_filter,
+                caregiver_type_filter=st.session_state.referral_caregiver_type_filter,
+                ccu_filter=st.session_state.referral_ccu_filter,
+                agency_filter=st.session_state.payor_filter
+            )
 
         # Show count with filter info
         filter_info = f"Active Status: {st.session_state.referral_active_inactive_filter} | Status: {st.session_state.referral_status_filter} | Call Status: {st.session_state.referral_call_status_filter} | Tag: {st.session_state.referral_tag_color_filter}"
@@ -446,6 +416,9 @@ def view_referrals():
         st.write(f"**Showing {len(leads)} referrals of {total_leads} total** ({filter_info})")
     
         if leads:
+            from frontend.lead_details import LeadDetailsLoader, render_history_section, render_attachments_section, render_comments_section
+            # One batched query per card section for the whole page
+            details = LeadDetailsLoader([lead.id for lead in leads], history_key="show_history_ref_{}")
             for lead in leads:
                 from frontend.common import get_tag_color_dot
                 from app.crud.crud_leads import update_lead as _ul
@@ -565,7 +538,7 @@ def view_referrals():
                                 st.write(f"**Comments:** {lead.comments}")
 
                             # Display chronological comment stack
-                            render_comment_stack(lead)
+                            render_comments_section(lead, details)
 
                         # Creator/Updater Info
                         st.divider()
@@ -590,7 +563,10 @@ def view_referrals():
                     
                         with sub_col1:
                             if st.button("Edit", key=f"edit_btn_ref_{lead.id}", use_container_width=True):
-                                lead_dict = {c.name: getattr(lead, c.name) for c in lead.__table__.columns}
+                                # List rows are read-only snapshots; the edit dialog works from the full lead
+                                from app.crud.crud_leads import get_lead as _get_full_lead
+                                full_lead = _get_full_lead(db, lead.id, include_deleted=True)
+                                lead_dict = {c.name: getattr(full_lead, c.name) for c in full_lead.__table__.columns}
                                 open_modal('save_edit_modal', lead.id, title=f"{lead.first_name} {lead.last_name}", lead_data=lead_dict)
                     
                         with sub_col2:
@@ -617,72 +593,11 @@ def view_referrals():
 
                         # ATTACHMENTS SECTION
                         st.divider()
-                        st.markdown("### 📎 Attachments")
-                        try:
-                            from app.crud import crud_attachments
-                            with st.expander("➕ Upload New Attachment", expanded=False):
-                                # GHOST UPLOAD FIX: Use a versioned key to force a reset after successful upload
-                                up_key_ver = st.session_state.get(f"up_ver_{lead.id}", 0)
-                                uploaded_file = st.file_uploader("Choose a file", type=['pdf', 'docx', 'doc', 'png', 'jpg', 'jpeg', 'csv', 'txt'], key=f"upload_ref_{lead.id}_{up_key_ver}")
-                                if uploaded_file is not None:
-                                    if st.button("Upload", key=f"btn_upload_ref_{lead.id}_{up_key_ver}", type="primary"):
-                                        from frontend.common import clear_modal_state
-                                        # GHOST POPUP KILLER: Proactively clear any stale modal state before rerunning
-                                        clear_modal_state()
-                                    
-                                        upload_dir = Path(__file__).parent.parent.parent / "backend" / "uploads"
-                                        upload_dir.mkdir(exist_ok=True)
-                                        file_path = upload_dir / f"{lead.id}_{uploaded_file.name}"
-                                        with open(file_path, "wb") as f:
-                                            f.write(uploaded_file.getbuffer())
-                                        crud_attachments.create_attachment(db, lead_id=lead.id, filename=uploaded_file.name, file_path=str(file_path), file_size=uploaded_file.size, uploaded_by=st.session_state.username)
-                                    
-                                        # UPLOADER RESET: Increment version to force a new widget
-                                        st.session_state[f"up_ver_{lead.id}"] = up_key_ver + 1
-                                        st.success(f"✅ Uploaded: {uploaded_file.name}")
-                                        st.rerun()
-                        
-                            attachments = crud_attachments.get_attachments_by_lead(db, lead.id)
-                            if attachments:
-                                for att in attachments:
-                                    att_col1, att_col2, att_col3, att_col4 = st.columns([4, 1, 1, 1])
-                                    with att_col1:
-                                        time_str = render_time(att.uploaded_at)
-                                        st.markdown(f"📄 **{att.filename}** - Uploaded by **{att.uploaded_by}** on {time_str}", unsafe_allow_html=True)
-                                    with att_col2:
-                                        if st.button("👁️", key=f"view_ref_{att.id}", use_container_width=True, help="Preview Document"):
-                                            open_modal('file_preview', att.id, title=att.filename, lead_data={'file_path': att.file_path, 'filename': att.filename})
-                                    with att_col3:
-                                        if os.path.exists(att.file_path):
-                                            with open(att.file_path, "rb") as f:
-                                                st.download_button("⬇️", f, file_name=att.filename, key=f"dl_ref_{att.id}", use_container_width=True)
-                                    with att_col4:
-                                        if st.session_state.user_role == "admin" and st.button("🗑️", key=f"del_ref_{att.id}", use_container_width=True):
-                                            crud_attachments.delete_attachment(db, att.id)
-                                            st.rerun()
-                        except Exception as e:
-                            st.error(f"Attachment error: {str(e)}")
+                        render_attachments_section(lead.id, details, "ref")
 
                         # History View
                         if st.session_state.get(f"show_history_ref_{lead.id}", False):
-                            st.info(f"Activity History for {lead.first_name} {lead.last_name}")
-                            history_logs = crud_activity_logs.get_lead_history(db, lead.id)
-                            if history_logs:
-                                 for log in history_logs[:10]:
-                                     st.markdown(f"**{render_time(log.timestamp, style='ago')}** &bull; **{get_action_label(log.action_type)}** by **{log.username}**", unsafe_allow_html=True)
-                                     st.markdown(f"<div style='font-size: 0.85rem; color: #6B7280;'>Time: {render_time(log.timestamp)}</div>", unsafe_allow_html=True)
-                                     if log.description and log.description != get_action_label(log.action_type):
-                                         st.caption(log.description)
-                                 
-                                     # Show changes if available
-                                     if log.old_value and log.new_value:
-                                         changes = format_changes(log.old_value, log.new_value)
-                                         if changes:
-                                             for field, old_val, new_val in changes:
-                                                 st.markdown(f"<div style='font-size: 0.85rem; color: #6B7280; margin-left: 20px;'>&bull; <b>{field}:</b> {old_val} &rarr; {new_val}</div>", unsafe_allow_html=True)
-                                     st.divider()
-                            else:
-                                st.caption("No history recorded yet.")
+                            render_history_section(lead.id, details, title=f"{lead.first_name} {lead.last_name}")
 
                 with cs_col:
                     bg_color = {"Not Called": "#FF3B30", "Pending": "#FFCC00", "Called": "#34C759"}.get(cur_cs, "#f0f2f6")
@@ -817,7 +732,6 @@ def view_referrals():
                             call_status_updated_by=st.session_state.username,
                             call_status_updated_at=datetime.utcnow()
                         ), st.session_state.username, st.session_state.get('db_user_id'))
-                        clear_leads_cache()
                         st.rerun()
         else:
             if search_name or search_id:
@@ -829,7 +743,7 @@ def view_referrals():
                 st.info("No referrals found")
     
         # --- PAGINATION UI CONTROLS ---
-        render_pagination(total_leads, "refs")
+        render_pagination(total_leads, "refs", next_cursor=lead_cursor(leads[-1], st.session_state.referrals_sort_by) if leads else None)
     
     finally:
         db.close()
@@ -0,0 +1,61 @@
+"""
+Static assets for the Streamlit frontend.
+
+Raster images live in frontend_app/static and are served by Streamlit's
+static file handler (server.enableStaticServing) at app/static/<name>.
+URLs carry a content hash as ?v=<hash>; Tornado answers versioned
+requests with a 10 year Cache-Control, so browsers fetch each file once
+and a changed file gets a new URL.
+
+Streamlit serves anything but jpg/png/gif/webp/pdf from that folder as
+text/plain with nosniff, so SVG icons (frontend_app/assets) and the
+global CSS/JS cannot be linked; they are inlined into the page head once
+per browser session by frontend.common.inject_custom_css instead.
+"""
+import base64
+import hashlib
+import re
+from functools import lru_cache
+from pathlib import Path
+
+FRONTEND_APP_DIR = Path(__file__).parent.parent
+STATIC_DIR = FRONTEND_APP_DIR / "static"
+INLINE_ASSETS_DIR = FRONTEND_APP_DIR / "assets"
+
+_ASSET_REF = re.compile(r"asset:([\w.-]+)")
+
+
+@lru_cache(maxsize=None)
+def file_hash(path: Path) -> str:
+    """Short content hash used for cache busting."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:12]
+
+
+def static_url(filename: str) -> str:
+    """Versioned URL of a file in frontend_app/static."""
+    path = STATIC_DIR / filename
+    version = file_hash(path) if path.exists() else "0"
+    return f"app/static/{filename}?v={version}"
+
+
+@lru_cache(maxsize=None)
+def inline_svg(filename: str) -> str:
+    """Data URI for an SVG in frontend_app/assets."""
+    data = (INLINE_ASSETS_DIR / filename).read_bytes()
+    return "data:image/svg+xml;base64," + base64.b64encode(data).decode()
+
+
+def resolve_asset_refs(text: str) -> str:
+    """Replace `asset:<file>` references with a versioned static URL (or an inline data URI for SVGs)."""
+    def _resolve(match):
+        name = match.group(1)
+        return inline_svg(name) if name.endswith(".svg") else static_url(name)
+    return _ASSET_REF.sub(_resolve, text)
+
+
+def content_version(*parts: str) -> str:
+    """Hash of the given strings, used to detect a changed stylesheet/script bundle."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode())
+    return digest.hexdigest()[:12]
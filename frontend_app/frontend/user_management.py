@@ -13,6 +13,7 @@ import base64
 from app.db import SessionLocal
 from app import services_stats
 from app.crud import crud_users, crud_leads, crud_activity_logs, crud_agencies, crud_email_reminders, crud_ccus, crud_mcos, crud_agency_suboptions, crud_events
+from app.services import reference_data
 from sqlalchemy import func
 from app.models import User
 from app.schemas import UserCreate, LeadCreate, LeadUpdate
@@ -121,9 +122,8 @@ def user_profile_page():
                                         if n_eml: st.session_state.user_email = n_eml
                                         
                                         # Clear dashboard caches to reflect name/ID changes immediately
-                                        from frontend.common import clear_stats_cache, clear_leads_cache
+                                        from frontend.common import clear_stats_cache
                                         clear_stats_cache()
-                                        clear_leads_cache()
                                         
                                         # Critically Important: Re-mint the authentication token!
                                         # If we change the username, the old cookie becomes invalid.
@@ -370,7 +370,7 @@ def admin_panel():
     
     with tab3:
         st.markdown("<h4 style='font-weight: bold; color: #111827;'>Approved Users</h4>", unsafe_allow_html=True)
-        approved_users = crud_users.get_approved_users(db)
+        approved_users = reference_data.get_approved_users()
         
         if approved_users:
             st.write(f"**Total Approved Users:** {len(approved_users)}")
@@ -623,7 +623,7 @@ def admin_panel():
         st.divider()
         
         # List all agencies
-        agencies = crud_agencies.get_all_agencies(db)
+        agencies = reference_data.get_agencies()
         if agencies:
             st.write(f"**Total Agencies: {len(agencies)}**")
             st.divider()
@@ -747,7 +747,7 @@ def admin_panel():
         st.divider()
         
         # List all CCUs
-        ccus = crud_ccus.get_all_ccus(db)
+        ccus = reference_data.get_ccus()
         if ccus:
             st.write(f"**Total CCUs: {len(ccus)}**")
             st.divider()
@@ -863,7 +863,7 @@ def admin_panel():
         st.divider()
         
         # List all Events
-        events = crud_events.get_all_events(db)
+        events = reference_data.get_events()
         if events:
             st.write(f"**Total Events: {len(events)}**")
             st.divider()
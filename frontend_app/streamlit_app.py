@@ -1,22 +1,10 @@
 import streamlit as st
 import sys
-import os
 from pathlib import Path
 
 # 0. ULTRA-FAST PAGE CONFIGURATION (Must be the very first Streamlit command)
 # Avoid importing heavy modules here to minimize the "Streamlit Crown" flash on refresh
 
-# Pre-computed base64 logo for near-instant application
-try:
-    # Add the current directory to path to ensure assets_base64 is found
-    _script_dir = os.path.dirname(os.path.abspath(__file__))
-    if _script_dir not in sys.path:
-        sys.path.insert(0, _script_dir)
-    from assets_base64 import LOGO_BASE64
-except Exception:
-    # Fallback if the file is missing or import fails
-    LOGO_BASE64 = "favicon.svg"
-
 # Branding handled via Dockerfile patch and page config
 st.set_page_config(
     page_title="Lead Manager",
@@ -30,24 +18,17 @@ st.set_page_config(
 backend_path = Path(__file__).parent.parent / "backend"
 sys.path.insert(0, str(backend_path))
 
-# 2. HEAVY IMPORTS (Import after branding is applied)
-from frontend.common import get_logo_path, init_session_state, inject_custom_css, handle_active_modal
-from frontend.auth import login, signup, forgot_password
-from frontend.dashboard import dashboard, view_all_user_dashboards, discovery_tool
-from frontend.view_leads import view_leads, mark_referral_page
-from frontend.add_lead import add_lead
-from frontend.referrals_sent import view_referrals
-from frontend.referral_confirm import referral_confirm
-from frontend.referral_reports import referral_reports
-from frontend.activity_logs import view_activity_logs
-from frontend.user_management import admin_panel, update_password, render_historian, user_profile_page
-from app.crud import crud_users, crud_activity_logs, crud_agencies, crud_email_reminders, crud_ccus
+# 2. SHELL IMPORTS (Import after branding is applied)
+# Page modules are imported on demand by frontend.navigation so a cold start
+# only loads the page being shown
+from frontend.common import get_logo_path, init_session_state, inject_custom_css, confirm_ui_head, handle_active_modal
+from frontend.navigation import PAGES, get_page, load_view, dev_reload_enabled, profiling_enabled
 from app.db import SessionLocal
-from app.email_scheduler import start_scheduler
 
 @st.cache_resource
 def init_scheduler():
     """Initialize the email scheduler once"""
+    from app.email_scheduler import start_scheduler
     start_scheduler()
 
 
@@ -65,17 +46,19 @@ def main():
     from frontend.common import render_top_bar
     render_top_bar()
     
-    # 0. TARGETED RELOADING (SAFELY)
-    # This ensures backend changes are picked up locally WITHOUT the AWS crash bug
-    import importlib
-    import app.crud.crud_leads as crud_leads
-    import app.crud.crud_users as crud_users
-    import app.crud.crud_notifications as crud_notifications
-    import app.utils.security as security
-    importlib.reload(crud_leads)
-    importlib.reload(crud_users)
-    importlib.reload(crud_notifications)
-    importlib.reload(security)
+    # 0. TARGETED RELOADING (DEV ONLY)
+    # Picks up local backend edits without a restart; off by default because
+    # re-executing these modules on every rerun is slow and breaks on AWS
+    if dev_reload_enabled():
+        import importlib
+        import app.crud.crud_leads as crud_leads
+        import app.crud.crud_users as crud_users
+        import app.crud.crud_notifications as crud_notifications
+        import app.utils.security as security
+        importlib.reload(crud_leads)
+        importlib.reload(crud_users)
+        importlib.reload(crud_notifications)
+        importlib.reload(security)
 
     # 0.5 PROGRAMMATIC NAVIGATION
     # Sync URL query params with session state at the very start of main()
@@ -92,11 +75,11 @@ def main():
     # Check authentication
     if not st.session_state.authenticated:
         if st.session_state.show_signup:
-            signup()
+            load_view("frontend.auth", "signup")()
         elif st.session_state.show_forgot_password:
-            forgot_password()
+            load_view("frontend.auth", "forgot_password")()
         else:
-            login()
+            load_view("frontend.auth", "login")()
     else:
         # --- CENTRALIZED MODAL RENDERING ---
         # Render modals at the end of the script to ensure page-level button logic
@@ -187,7 +170,7 @@ def main():
             # The callback handles the reset logic efficiently.
             
             st.divider()
-            render_historian()
+            load_view("frontend.user_management", "render_historian")()
             
             
             # API Health Check Diagnostic
@@ -201,7 +184,7 @@ def main():
         page = st.session_state.main_navigation
         
         if st.session_state.get('current_page') == 'Mark Referral Page':
-            mark_referral_page()
+            get_page("Mark Referral Page")()
         elif page == "Dashboard":
             # Check if admin wants to view all user dashboards
             if st.session_state.user_role == "admin" and st.session_state.show_user_dashboards:
@@ -209,28 +192,16 @@ def main():
                     st.session_state.show_user_dashboards = False
                     st.rerun()
                 st.divider()
-                view_all_user_dashboards()
+                get_page("All User Dashboards")()
             else:
-                dashboard()
-        elif page == "View Leads":
-            view_leads()
-        elif page == "Add Lead":
-            add_lead()
-        elif page == "Lead Discovery":
-            discovery_tool()
-        elif page == "Referrals Sent":
-            view_referrals()
-        elif page == "Authorizations":
-            referral_confirm()
-        elif page == "Activity Logs":
-            view_activity_logs()
-        elif page == "User Profile":
-            user_profile_page()
+                get_page("Dashboard")()
         elif page == "User Management":
             if st.session_state.user_role == "admin":
-                admin_panel()
+                get_page("User Management")()
             else:
                 st.error("Access denied. Admin only.")
+        elif page in PAGES:
+            get_page(page)()
         elif page == "Notifications":
             from frontend.common import render_notification_center
             db = SessionLocal()
@@ -244,8 +215,20 @@ def main():
         # (like "Care Start") and cleared the modal triggers, we DON'T show the modal.
         handle_active_modal()
 
+    # Run completed: the CSS/JS head injector reached the browser, skip it on later reruns
+    confirm_ui_head()
+
 
 
 if __name__ == "__main__":
     init_scheduler()
-    main()
+    if profiling_enabled():
+        import time
+        _run_start = time.perf_counter()
+        try:
+            main()
+        finally:
+            # Streamlit stops a run with an exception on st.rerun()/st.stop(); still report it
+            print(f"[PROFILE] Script run ({st.session_state.get('main_navigation', 'login')}) took {(time.perf_counter() - _run_start) * 1000:.1f} ms")
+    else:
+        main()